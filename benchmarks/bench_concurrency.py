@@ -0,0 +1,95 @@
+"""
+Concurrent tool-call throughput against a local stub API.
+
+Compares the previous synchronous `text_to_speech` handler (blocking ElevenLabs
+client running on the FastMCP event loop) with the async handler backed by the
+shared AsyncElevenLabs client and pooled httpx.AsyncClient.
+
+Usage:
+    python benchmarks/bench_concurrency.py --requests 50 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+
+async def run_concurrently(mcp, tool_name: str, requests: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            mcp.call_tool(tool_name, {"text": f"Benchmark line {i}"})
+            for i in range(requests)
+        )
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    output_dir = tempfile.mkdtemp(prefix="elevenlabs_mcp_bench_")
+    os.environ.setdefault("ELEVENLABS_API_KEY", "stub")
+    os.environ["ELEVENLABS_MCP_BASE_PATH"] = output_dir
+    os.environ["ELEVENLABS_MCP_OUTPUT_MODE"] = "files"
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    from elevenlabs.client import AsyncElevenLabs, ElevenLabs
+    from mcp.server.fastmcp import FastMCP
+    from elevenlabs_mcp import server
+    from elevenlabs_mcp.client import create_http_client
+    from elevenlabs_mcp.utils import make_output_file, make_output_path
+
+    with run_stub_api(create_app(latency=args.latency), port=args.port) as base_url:
+        sync_client = ElevenLabs(api_key="stub", base_url=base_url)
+
+        # Equivalent of the handler before the async conversion.
+        def sync_text_to_speech(text: str):
+            output_path = make_output_path(None, output_dir)
+            output_file_name = make_output_file("tts", text, "mp3")
+            audio_data = sync_client.text_to_speech.convert(
+                text=text,
+                voice_id=server.DEFAULT_VOICE_ID,
+                model_id="eleven_multilingual_v2",
+                output_format="mp3_44100_128",
+            )
+            (output_path / output_file_name).write_bytes(b"".join(audio_data))
+
+        before = FastMCP("before")
+        before.add_tool(sync_text_to_speech, name="text_to_speech")
+
+        server.client = AsyncElevenLabs(
+            api_key="stub", httpx_client=create_http_client(), base_url=base_url
+        )
+
+        sync_elapsed = asyncio.run(
+            run_concurrently(before, "text_to_speech", args.requests)
+        )
+        async_elapsed = asyncio.run(
+            run_concurrently(server.mcp, "text_to_speech", args.requests)
+        )
+
+    print(
+        f"{args.requests} concurrent text_to_speech calls, {args.latency:.3f}s upstream latency"
+    )
+    for label, elapsed in (("sync", sync_elapsed), ("async", async_elapsed)):
+        print(f"  {label:<6} {elapsed:8.3f}s  {args.requests / elapsed:8.1f} req/s")
+    print(f"  speedup {sync_elapsed / async_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Exporting every agent conversation against a local stub API.
+
+Compares fetching the conversation list page by page and each transcript one
+by one, the way repeated list_conversations and get_conversation calls would,
+with export_conversations, which fetches transcripts concurrently and
+streams them to a JSONL file.
+
+Usage:
+    python benchmarks/bench_export.py --conversations 250 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--conversations", type=int, default=250)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    os.environ.setdefault("ELEVENLABS_API_KEY", "stub")
+    os.environ["ELEVENLABS_MCP_BASE_PATH"] = tempfile.mkdtemp(
+        prefix="elevenlabs_mcp_bench_"
+    )
+    logging.disable(logging.INFO)
+
+    from elevenlabs.client import AsyncElevenLabs
+    from elevenlabs_mcp import server
+    from elevenlabs_mcp.client import create_http_client
+
+    app = create_app(latency=args.latency, conversations=args.conversations)
+    with run_stub_api(app, port=args.port) as base_url:
+
+        async def run() -> tuple[float, float, int]:
+            server.client = AsyncElevenLabs(
+                api_key="stub", httpx_client=create_http_client(), base_url=base_url
+            )
+
+            start = time.perf_counter()
+            cursor, fetched = None, 0
+            while True:
+                page = await server.client.conversational_ai.conversations.list(
+                    cursor=cursor, page_size=100
+                )
+                for conv in page.conversations:
+                    await server.client.conversational_ai.conversations.get(
+                        conv.conversation_id
+                    )
+                    fetched += 1
+                if not page.has_more:
+                    break
+                cursor = page.next_cursor
+            serial = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await server.mcp.call_tool(
+                "export_conversations",
+                {"max_concurrency": args.concurrency, "resume": False},
+            )
+            exported = time.perf_counter() - start
+            return serial, exported, fetched
+
+        serial, exported, fetched = asyncio.run(run())
+
+    output_file = (
+        Path(os.environ["ELEVENLABS_MCP_BASE_PATH"]) / "conversations_all.jsonl"
+    )
+    with open(output_file, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+
+    print(
+        f"{args.conversations} conversations, "
+        f"{args.latency * 1000:.0f} ms stub latency"
+    )
+    print(f"  {'':<36}{'seconds':>9}{'conversations/s':>17}")
+    print(f"  {'serial list + get':<36}{serial:>9.2f}{fetched / serial:>17.1f}")
+    label = f"export_conversations ({args.concurrency} at a time)"
+    print(f"  {label:<36}{exported:>9.2f}{len(lines) / exported:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Filesystem calls per text_to_speech tool call against a local stub API.
+
+Counts the os-level calls (stat, lstat, access, mkdir, open) made during each
+call, comparing the previous make_output_path, which resolved, created and
+checked the output directory on every call, with the memoized resolver.
+
+Usage:
+    python benchmarks/bench_output_path_syscalls.py --requests 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+COUNTED = ["stat", "lstat", "access", "mkdir"]
+
+
+class SyscallCounter:
+    """Counts calls to COUNTED os functions and file opens while active."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.active = False
+        self._originals = {name: getattr(os, name) for name in COUNTED}
+        for name, original in self._originals.items():
+            setattr(os, name, self._wrap(name, original))
+        sys.addaudithook(self._audit)
+
+    def _wrap(self, name, original):
+        def counted(*args, **kwargs):
+            if self.active:
+                self.counts[name] += 1
+            return original(*args, **kwargs)
+
+        return counted
+
+    def _audit(self, event, args):
+        if self.active and event == "open":
+            self.counts["open"] += 1
+
+
+def legacy_make_output_path(output_directory, base_path=None):
+    """make_output_path before memoization: resolve, mkdir and access check per call."""
+    from elevenlabs_mcp.utils import _resolve_output_path, is_file_writeable
+
+    output_path = _resolve_output_path(output_directory, base_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+    is_file_writeable(output_path)
+    return output_path
+
+
+def legacy_write(full_file_path, file_data):
+    full_file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(full_file_path, "wb") as f:
+        f.write(file_data)
+
+
+async def count_calls(server, counter, requests: int) -> Counter:
+    counter.counts.clear()
+    for i in range(requests):
+        counter.active = True
+        await server.mcp.call_tool("text_to_speech", {"text": f"Line {i}"})
+        counter.active = False
+    return Counter({name: count / requests for name, count in counter.counts.items()})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    output_dir = tempfile.mkdtemp(prefix="elevenlabs_mcp_bench_")
+    os.environ.setdefault("ELEVENLABS_API_KEY", "stub")
+    os.environ["ELEVENLABS_MCP_BASE_PATH"] = str(Path(output_dir) / "nested" / "audio")
+    os.environ["ELEVENLABS_MCP_OUTPUT_MODE"] = "files"
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    from elevenlabs.client import AsyncElevenLabs
+    from elevenlabs_mcp import server, utils
+    from elevenlabs_mcp.client import create_http_client
+
+    counter = SyscallCounter()
+    with run_stub_api(create_app(latency=0), port=args.port) as base_url:
+        server.client = AsyncElevenLabs(
+            api_key="stub", httpx_client=create_http_client(), base_url=base_url
+        )
+
+        async def run():
+            # Warm up the voice index and model catalog so only per-call work is counted
+            await server.mcp.call_tool("text_to_speech", {"text": "Warm up"})
+            memoized = await count_calls(server, counter, args.requests)
+            server.make_output_path = legacy_make_output_path
+            utils.write_output_file = legacy_write
+            legacy = await count_calls(server, counter, args.requests)
+            return memoized, legacy
+
+        memoized, legacy = asyncio.run(run())
+
+    print(f"Filesystem calls per text_to_speech call ({args.requests} calls)")
+    print(f"  {'call':<8}{'before':>8}{'after':>8}")
+    for name in COUNTED + ["open"]:
+        print(f"  {name:<8}{legacy[name]:>8.1f}{memoized[name]:>8.1f}")
+    print(f"  {'total':<8}{sum(legacy.values()):>8.1f}{sum(memoized.values()):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
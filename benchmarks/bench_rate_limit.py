@@ -0,0 +1,99 @@
+"""
+Bursts of text_to_speech calls against a stub API that allows few concurrent requests.
+
+The stub answers 429 once max_concurrency requests are in flight, like the API
+does at a subscription's concurrency limit. Compares the shared client without
+a rate limiter with one capping text-to-speech at the same concurrency.
+
+Usage:
+    python benchmarks/bench_rate_limit.py --requests 40 --max-concurrency 3 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+
+async def burst(mcp, requests: int) -> tuple[float, int]:
+    """Seconds for all calls to finish, and how many failed."""
+
+    async def call(i: int) -> bool:
+        try:
+            await mcp.call_tool("text_to_speech", {"text": f"Burst line {i}"})
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(call(i) for i in range(requests)))
+    return time.perf_counter() - start, results.count(False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--max-concurrency", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    os.environ.setdefault("ELEVENLABS_API_KEY", "stub")
+    os.environ["ELEVENLABS_MCP_BASE_PATH"] = tempfile.mkdtemp(
+        prefix="elevenlabs_mcp_bench_"
+    )
+    os.environ["ELEVENLABS_MCP_OUTPUT_MODE"] = "files"
+    logging.disable(logging.INFO)
+
+    from elevenlabs.client import AsyncElevenLabs
+    from elevenlabs_mcp import server
+    from elevenlabs_mcp.client import create_http_client
+    from elevenlabs_mcp.rate_limit import RateLimiter
+
+    app = create_app(latency=args.latency, max_concurrency=args.max_concurrency)
+    with run_stub_api(app, port=args.port) as base_url:
+
+        async def run() -> list[tuple[str, float, int, int, dict]]:
+            rows = []
+            for label, limiter in (
+                ("no limiter", None),
+                ("limiter", RateLimiter(concurrency={"tts": args.max_concurrency})),
+            ):
+                server.client = AsyncElevenLabs(
+                    api_key="stub",
+                    httpx_client=create_http_client(limiter),
+                    base_url=base_url,
+                )
+                app.state.stats["rejected"] = 0
+                elapsed, failed = await burst(server.mcp, args.requests)
+                stats = limiter.stats()["families"]["tts"] if limiter else {}
+                rows.append(
+                    (label, elapsed, failed, app.state.stats["rejected"], stats)
+                )
+            return rows
+
+        rows = asyncio.run(run())
+
+    print(
+        f"{args.requests} concurrent text_to_speech calls, stub allows "
+        f"{args.max_concurrency} in flight, {args.latency * 1000:.0f} ms latency"
+    )
+    print(f"  {'':<12}{'seconds':>9}{'failed':>8}{'429s':>7}{'max queued':>12}")
+    for label, elapsed, failed, rejected, stats in rows:
+        print(
+            f"  {label:<12}{elapsed:>9.2f}{failed:>8}{rejected:>7}"
+            f"{stats.get('max_queued', '-'):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Read requests against a stub API that fails or stalls a share of them.
+
+The stub answers failure_rate of requests with a 503 and delays slow_rate of
+the rest by slow_seconds. Compares the shared client without retries, with
+retries, and with retries plus hedged GET requests, by success rate and
+p50/p99 latency of `voices.get`.
+
+Usage:
+    python benchmarks/bench_retry.py --requests 200 --failure-rate 0.1 --slow-rate 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def fetch_voices(client, requests: int, concurrency: int) -> tuple[int, list]:
+    """Successful requests and the latency of each request."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def fetch(i: int) -> bool:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await client.voices.get(voice_id=f"voice{i}")
+                return True
+            except Exception:
+                return False
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    results = await asyncio.gather(*(fetch(i) for i in range(requests)))
+    return results.count(True), latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-seconds", type=float, default=1.0)
+    parser.add_argument("--hedge-after-ms", type=int, default=150)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    from elevenlabs.client import AsyncElevenLabs
+    from elevenlabs_mcp.client import create_http_client
+    from elevenlabs_mcp.retry import RetryPolicy
+
+    policies = {
+        "no retries": RetryPolicy(max_retries=0),
+        "retries": RetryPolicy(max_retries=3, base_delay=0.05),
+        "retries+hedging": RetryPolicy(
+            max_retries=3, base_delay=0.05, hedge_after=args.hedge_after_ms / 1000
+        ),
+    }
+    rows = []
+    for label, policy in policies.items():
+        app = create_app(
+            latency=args.latency,
+            faults={
+                "failure_rate": args.failure_rate,
+                "slow_rate": args.slow_rate,
+                "slow_seconds": args.slow_seconds,
+            },
+        )
+        with run_stub_api(app, port=args.port) as base_url:
+
+            async def run():
+                client = AsyncElevenLabs(
+                    api_key="stub",
+                    httpx_client=create_http_client(retry_policy=policy),
+                    base_url=base_url,
+                )
+                return await fetch_voices(client, args.requests, args.concurrency)
+
+            succeeded, latencies = asyncio.run(run())
+        rows.append((label, succeeded, latencies, policy.stats()))
+
+    print(
+        f"{args.requests} voices.get, {args.failure_rate:.0%} fail with 503, "
+        f"{args.slow_rate:.0%} delayed {args.slow_seconds:.1f}s, "
+        f"{args.latency * 1000:.0f} ms latency"
+    )
+    print(f"  {'':<17}{'succeeded':>10}{'p50':>9}{'p99':>9}{'retries':>9}{'hedged':>8}")
+    for label, succeeded, latencies, stats in rows:
+        print(
+            f"  {label:<17}{succeeded / args.requests:>10.1%}"
+            f"{statistics.median(latencies) * 1000:>7.0f}ms"
+            f"{percentile(latencies, 0.99) * 1000:>7.0f}ms"
+            f"{stats['retries']:>9}{stats['hedged']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
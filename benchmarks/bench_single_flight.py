@@ -0,0 +1,99 @@
+"""
+Identical concurrent tool calls against a local stub API, with and without coalescing.
+
+Fans the same text_to_speech and get_voice call out to many concurrent
+callers, the way several MCP clients asking for the same thing would, and
+counts the requests that reach the API.
+
+Usage:
+    python benchmarks/bench_single_flight.py --callers 20 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    os.environ.setdefault("ELEVENLABS_API_KEY", "stub")
+    os.environ["ELEVENLABS_MCP_BASE_PATH"] = tempfile.mkdtemp(
+        prefix="elevenlabs_mcp_bench_"
+    )
+    os.environ["ELEVENLABS_MCP_OUTPUT_MODE"] = "files"
+    logging.disable(logging.INFO)
+
+    from elevenlabs.client import AsyncElevenLabs
+    from elevenlabs_mcp import server
+    from elevenlabs_mcp.client import create_http_client
+    from elevenlabs_mcp.single_flight import SingleFlight
+
+    calls = {
+        "text_to_speech": {"text": "The same line for everyone", "voice_id": "voice0"},
+        "get_voice": {"voice_id": "not-in-the-index"},
+    }
+
+    with run_stub_api(create_app(latency=args.latency), port=args.port) as base_url:
+
+        async def run() -> list[tuple[str, str, float, int]]:
+            requests = Counter()
+
+            async def count(request):
+                requests[request.url.path] += 1
+
+            http_client = create_http_client()
+            http_client.event_hooks["request"].append(count)
+            server.client = AsyncElevenLabs(
+                api_key="stub", httpx_client=http_client, base_url=base_url
+            )
+            # Load the voice index up front so only the calls themselves are counted
+            await server.voice_index.ensure_fresh()
+
+            rows = []
+            for label, single_flight in (
+                ("independent", None),
+                ("coalesced", SingleFlight()),
+            ):
+                server.single_flight = single_flight
+                for tool, arguments in calls.items():
+                    requests.clear()
+                    start = time.perf_counter()
+                    await asyncio.gather(
+                        *(
+                            server.mcp.call_tool(tool, arguments)
+                            for _ in range(args.callers)
+                        )
+                    )
+                    elapsed = time.perf_counter() - start
+                    rows.append((label, tool, elapsed, sum(requests.values())))
+            return rows
+
+        rows = asyncio.run(run())
+
+    print(
+        f"{args.callers} concurrent identical calls per tool, "
+        f"{args.latency * 1000:.0f} ms stub latency"
+    )
+    print(f"  {'':<13}{'tool':<16}{'seconds':>9}{'API requests':>14}")
+    for label, tool, elapsed, requests in rows:
+        print(f"  {label:<13}{tool:<16}{elapsed:>9.2f}{requests:>14}")
+
+
+if __name__ == "__main__":
+    main()
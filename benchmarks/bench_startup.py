@@ -0,0 +1,141 @@
+"""
+Server startup time: module import, and time until the server answers over stdio.
+
+Starts the server as a subprocess the way an MCP client does and measures
+the time until it answers `initialize` and then `tools/list`, along with the
+cumulative import time of elevenlabs_mcp.server from `python -X importtime`.
+Handshakes are timed with an empty cache directory, as on the first start
+after an install or upgrade, and with the tool schemas already cached.
+No API calls are made.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SERVER_COMMAND = [
+    sys.executable,
+    "-c",
+    "from elevenlabs_mcp.server import main; main()",
+]
+
+
+def server_env(cache_dir: str | None = None) -> dict:
+    env = dict(os.environ)
+    env.setdefault("ELEVENLABS_API_KEY", "stub")
+    env.setdefault("ELEVENLABS_MCP_BASE_PATH", tempfile.gettempdir())
+    if cache_dir is not None:
+        env["ELEVENLABS_MCP_CACHE_DIR"] = cache_dir
+    env["PYTHONPATH"] = str(ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_time(cache_dir: str) -> float:
+    """Cumulative import time of elevenlabs_mcp.server in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import elevenlabs_mcp.server"],
+        env=server_env(cache_dir),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = re.search(r"\|\s*(\d+) \| elevenlabs_mcp\.server$", result.stderr, re.M)
+    return int(match.group(1)) / 1e6
+
+
+def read_response(process: subprocess.Popen, request_id: int) -> dict:
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before answering")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue  # Startup banner
+        if message.get("id") == request_id:
+            return message
+
+
+def handshake_times(cache_dir: str) -> tuple[float, float, int]:
+    """Seconds from process start until the initialize and tools/list responses."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        SERVER_COMMAND,
+        env=server_env(cache_dir),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+
+    def send(message: dict) -> None:
+        process.stdin.write(json.dumps(message) + "\n")
+        process.stdin.flush()
+
+    try:
+        send(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "bench", "version": "0"},
+                },
+            }
+        )
+        read_response(process, 1)
+        initialized = time.perf_counter() - start
+        send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = read_response(process, 2)["result"]["tools"]
+        listed = time.perf_counter() - start
+    finally:
+        # The stdio server keeps running after stdin closes
+        process.kill()
+        process.wait()
+    return initialized, listed, len(tools)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cold = []
+        for run in range(args.runs):
+            cold.append(handshake_times(os.path.join(temp_dir, f"cold_{run}")))
+        # The last cold run left the tool schemas cached in its directory
+        warm_dir = os.path.join(temp_dir, f"cold_{args.runs - 1}")
+        imports = [import_time(warm_dir) for _ in range(args.runs)]
+        warm = [handshake_times(warm_dir) for _ in range(args.runs)]
+
+    print(f"Server startup, median of {args.runs} runs")
+    print(f"  import elevenlabs_mcp.server  {statistics.median(imports):.3f}s")
+    for label, handshakes in (("empty cache", cold), ("schemas cached", warm)):
+        print(f"  {label}")
+        print(
+            f"    initialize answered         {statistics.median(h[0] for h in handshakes):.3f}s"
+        )
+        print(
+            f"    tools/list answered         {statistics.median(h[1] for h in handshakes):.3f}s"
+            f" ({handshakes[0][2]} tools)"
+        )
+
+
+if __name__ == "__main__":
+    main()
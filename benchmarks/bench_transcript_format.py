@@ -0,0 +1,198 @@
+"""
+Transcript rendering time for synthetic diarized scribe responses.
+
+Compares the previous format_diarized_transcript with the single-pass
+implementation and times the SRT, VTT and JSON renderings, for words given
+both as SDK models and as plain dicts.
+
+Usage:
+    python benchmarks/bench_transcript_format.py --words 500000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from elevenlabs.types import (  # noqa: E402
+    SpeechToTextChunkResponseModel,
+    SpeechToTextWordResponseModel,
+)
+from elevenlabs_mcp.formatting import (  # noqa: E402
+    format_diarized_transcript,
+    format_srt,
+    format_transcript_json,
+    format_vtt,
+)
+
+VOCABULARY = [
+    "hello",
+    "there",
+    "we",
+    "should",
+    "ship",
+    "it",
+    "today,",
+    "right?",
+    "yes.",
+]
+
+
+def legacy_format_diarized_transcript(transcription) -> str:
+    """format_diarized_transcript as it was before the single-pass rewrite."""
+    try:
+        # Try to access words array - the exact attribute might vary
+        words = None
+        if hasattr(transcription, "words"):
+            words = transcription.words
+        elif hasattr(transcription, "__dict__"):
+            # Try to find words in the response dict
+            for key, value in transcription.__dict__.items():
+                if key == "words" or (
+                    isinstance(value, list)
+                    and len(value) > 0
+                    and (
+                        hasattr(value[0], "speaker_id")
+                        if hasattr(value[0], "__dict__")
+                        else (
+                            "speaker_id" in value[0]
+                            if isinstance(value[0], dict)
+                            else False
+                        )
+                    )
+                ):
+                    words = value
+                    break
+
+        if not words:
+            return transcription.text
+
+        formatted_lines = []
+        current_speaker = None
+        current_text = []
+
+        for word in words:
+            # Get speaker_id - might be an attribute or dict key
+            word_speaker = None
+            if hasattr(word, "speaker_id"):
+                word_speaker = word.speaker_id
+            elif isinstance(word, dict) and "speaker_id" in word:
+                word_speaker = word["speaker_id"]
+
+            # Get text - might be an attribute or dict key
+            word_text = None
+            if hasattr(word, "text"):
+                word_text = word.text
+            elif isinstance(word, dict) and "text" in word:
+                word_text = word["text"]
+
+            if not word_speaker or not word_text:
+                continue
+
+            # Skip spacing/punctuation types if they exist
+            if hasattr(word, "type") and word.type == "spacing":
+                continue
+            elif isinstance(word, dict) and word.get("type") == "spacing":
+                continue
+
+            if current_speaker != word_speaker:
+                # Save previous speaker's text
+                if current_speaker and current_text:
+                    speaker_label = current_speaker.upper().replace("_", " ")
+                    formatted_lines.append(f"{speaker_label}: {' '.join(current_text)}")
+
+                # Start new speaker
+                current_speaker = word_speaker
+                current_text = [word_text.strip()]
+            else:
+                current_text.append(word_text.strip())
+
+        # Add final speaker's text
+        if current_speaker and current_text:
+            speaker_label = current_speaker.upper().replace("_", " ")
+            formatted_lines.append(f"{speaker_label}: {' '.join(current_text)}")
+
+        return "\n\n".join(formatted_lines)
+
+    except Exception:
+        # Fallback to regular text if something goes wrong
+        return transcription.text
+
+
+def make_words(count: int, speakers: int = 4) -> list[dict]:
+    rng = random.Random(0)
+    words = []
+    speaker = 0
+    t = 0.0
+    for i in range(count):
+        if rng.random() < 0.02:
+            speaker = rng.randrange(speakers)
+        words.append(
+            {
+                "text": rng.choice(VOCABULARY),
+                "start": round(t, 3),
+                "end": round(t + 0.25, 3),
+                "type": "word",
+                "speaker_id": f"speaker_{speaker}",
+                "logprob": 0.0,
+            }
+        )
+        words.append(
+            {
+                "text": " ",
+                "start": round(t + 0.25, 3),
+                "end": round(t + 0.3, 3),
+                "type": "spacing",
+                "speaker_id": f"speaker_{speaker}",
+                "logprob": 0.0,
+            }
+        )
+        t += 0.3
+    return words
+
+
+def timed(function, transcription) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    function(transcription)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=500_000)
+    args = parser.parse_args()
+
+    words = make_words(args.words)
+    text = "".join(word["text"] for word in words)
+    inputs = {
+        "models": SpeechToTextChunkResponseModel(
+            language_code="en",
+            language_probability=1.0,
+            text=text,
+            words=[SpeechToTextWordResponseModel(**word) for word in words],
+        ),
+        "dicts": SimpleNamespace(language_code="en", text=text, words=words),
+    }
+    renderers = {
+        "text (before)": legacy_format_diarized_transcript,
+        "text": format_diarized_transcript,
+        "srt": format_srt,
+        "vtt": format_vtt,
+        "json": format_transcript_json,
+    }
+
+    print(f"{args.words} words")
+    for label, transcription in inputs.items():
+        for name, renderer in renderers.items():
+            elapsed = timed(renderer, transcription)
+            print(f"  {label:<7} {name:<14} {elapsed:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
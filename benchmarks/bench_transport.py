@@ -0,0 +1,179 @@
+"""
+Many MCP clients calling text_to_speech against a local stub API.
+
+Compares one server process per client over stdio, the way desktop MCP clients
+run the server, with a single long-lived server shared by every client over
+HTTP+SSE. Reports the time until every client is initialized, tool calls per
+second once they are, and p50/p99 call latency. No API calls are made.
+
+Usage:
+    python benchmarks/bench_transport.py --clients 8 --requests 25 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_api import create_app, run_stub_api  # noqa: E402
+
+SERVER_ARGS = ["-c", "from elevenlabs_mcp.server import main; main()"]
+
+
+def server_env(base_url: str, output_dir: str) -> dict:
+    env = dict(os.environ)
+    env["ELEVENLABS_API_KEY"] = "stub"
+    env["ELEVENLABS_API_BASE_URL"] = base_url
+    env["ELEVENLABS_MCP_BASE_PATH"] = output_dir
+    env["ELEVENLABS_MCP_OUTPUT_MODE"] = "files"
+    env["FASTMCP_LOG_LEVEL"] = "WARNING"
+    env["PYTHONPATH"] = str(ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Server did not listen on port {port} within {timeout}s")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_client(
+    connect,
+    client: int,
+    requests: int,
+    ready: asyncio.Barrier,
+    latencies: list[float],
+) -> None:
+    from mcp import ClientSession
+
+    async with connect() as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            await ready.wait()
+            for i in range(requests):
+                start = time.perf_counter()
+                result = await session.call_tool(
+                    "text_to_speech", {"text": f"Client {client} line {i}"}
+                )
+                latencies.append(time.perf_counter() - start)
+                if result.isError:
+                    raise RuntimeError(result.content[0].text)
+
+
+async def run_clients(connect, clients: int, requests: int) -> dict:
+    latencies: list[float] = []
+    timings = {}
+    start = time.perf_counter()
+
+    async def started() -> None:
+        timings["ready"] = time.perf_counter()
+
+    ready = asyncio.Barrier(clients + 1)
+    tasks = [
+        asyncio.create_task(run_client(connect, client, requests, ready, latencies))
+        for client in range(clients)
+    ]
+    await ready.wait()
+    await started()
+    await asyncio.gather(*tasks)
+    finished = time.perf_counter()
+    return {
+        "setup": timings["ready"] - start,
+        "throughput": len(latencies) / (finished - timings["ready"]),
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 0.99),
+    }
+
+
+def bench_stdio(env: dict, clients: int, requests: int) -> dict:
+    from mcp import StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    parameters = StdioServerParameters(
+        command=sys.executable, args=SERVER_ARGS + ["--transport", "stdio"], env=env
+    )
+    return asyncio.run(run_clients(lambda: stdio_client(parameters), clients, requests))
+
+
+def bench_sse(env: dict, clients: int, requests: int, port: int, workers: int) -> dict:
+    from mcp.client.sse import sse_client
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, *SERVER_ARGS, "--transport", "sse", "--port", str(port)]
+        + (["--workers", str(workers)] if workers else []),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port)
+        listening = time.perf_counter() - start
+        url = f"http://127.0.0.1:{port}/sse"
+        result = asyncio.run(run_clients(lambda: sse_client(url), clients, requests))
+        result["setup"] += listening
+        return result
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=25, help="Calls per client")
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--port", type=int, default=8765, help="Stub API port")
+    parser.add_argument("--server-port", type=int, default=8766)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--transports", default="stdio,sse", help="Comma-separated: stdio, sse"
+    )
+    args = parser.parse_args()
+
+    output_dir = tempfile.mkdtemp(prefix="elevenlabs_mcp_bench_")
+    transports = [t.strip() for t in args.transports.split(",") if t.strip()]
+    with run_stub_api(create_app(latency=args.latency), port=args.port) as base_url:
+        env = server_env(base_url, output_dir)
+        results = {}
+        for transport in transports:
+            if transport == "stdio":
+                results[transport] = bench_stdio(env, args.clients, args.requests)
+            else:
+                results[transport] = bench_sse(
+                    env, args.clients, args.requests, args.server_port, args.workers
+                )
+
+    print(
+        f"{args.clients} clients x {args.requests} text_to_speech calls, "
+        f"{args.latency * 1000:.0f} ms stub latency"
+    )
+    print(f"  {'transport':<10}{'setup':>9}{'calls/s':>10}{'p50':>10}{'p99':>10}")
+    for transport, result in results.items():
+        print(
+            f"  {transport:<10}{result['setup']:>8.2f}s{result['throughput']:>10.1f}"
+            f"{result['p50'] * 1000:>8.0f}ms{result['p99'] * 1000:>8.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Peak memory of file uploads against a local stub API.
+
+Each measurement runs in a fresh subprocess and reports its peak RSS, comparing
+the previous upload path (whole input file read into a bytes object) with the
+tools as they are now (open file handle streamed into the multipart body).
+
+Usage:
+    python benchmarks/bench_upload_memory.py --sizes 16 64 256
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+TOOLS = ["speech_to_text", "isolate_audio", "speech_to_speech"]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def upload(tool: str, file_path: Path, mode: str):
+    from elevenlabs_mcp import server
+
+    if mode == "tool":
+        args = {"input_file_path": str(file_path)}
+        if tool == "speech_to_text":
+            args["return_transcript_to_client_directly"] = True
+            args["save_transcript_to_file"] = False
+        await server.mcp.call_tool(tool, args)
+        return
+
+    # Equivalent of the handlers before streaming the file handle.
+    with file_path.open("rb") as f:
+        audio_bytes = f.read()
+    if tool == "speech_to_text":
+        await server.client.speech_to_text.convert(
+            model_id="scribe_v1", file=audio_bytes
+        )
+    elif tool == "isolate_audio":
+        audio_data = server.client.audio_isolation.convert(audio=audio_bytes)
+        b"".join([chunk async for chunk in audio_data])
+    else:
+        audio_data = server.client.speech_to_speech.convert(
+            voice_id="voice0", model_id="eleven_multilingual_sts_v2", audio=audio_bytes
+        )
+        b"".join([chunk async for chunk in audio_data])
+
+
+def child(args):
+    logging.disable(logging.INFO)
+    from elevenlabs.client import AsyncElevenLabs
+    from elevenlabs_mcp import server
+    from elevenlabs_mcp.client import create_http_client
+
+    server.client = AsyncElevenLabs(
+        api_key="stub", httpx_client=create_http_client(), base_url=args.base_url
+    )
+    baseline = peak_rss_mb()
+    asyncio.run(upload(args.tool, Path(args.file), args.mode))
+    print(f"{baseline:.1f} {peak_rss_mb():.1f}")
+
+
+def measure(
+    base_url: str, tool: str, file_path: Path, mode: str
+) -> tuple[float, float]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            "--base-url",
+            base_url,
+            "--tool",
+            tool,
+            "--file",
+            str(file_path),
+            "--mode",
+            mode,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), float(output[1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--child", action="store_true")
+    parser.add_argument("--base-url")
+    parser.add_argument("--tool", choices=TOOLS)
+    parser.add_argument("--file")
+    parser.add_argument("--mode", choices=["read", "tool"])
+    args = parser.parse_args()
+
+    output_dir = tempfile.mkdtemp(prefix="elevenlabs_mcp_bench_")
+    os.environ.setdefault("ELEVENLABS_API_KEY", "stub")
+    os.environ["ELEVENLABS_MCP_BASE_PATH"] = output_dir
+    os.environ["ELEVENLABS_MCP_OUTPUT_MODE"] = "files"
+
+    if args.child:
+        child(args)
+        return
+
+    from stub_api import create_app, run_stub_api
+
+    print(f"{'tool':<18}{'size MB':>9}{'read() peak MB':>16}{'streamed peak MB':>18}")
+    with run_stub_api(create_app(latency=0), port=args.port) as base_url:
+        for size in args.sizes:
+            input_file = Path(output_dir) / f"input_{size}mb.mp3"
+            with input_file.open("wb") as f:
+                for _ in range(size):
+                    f.write(os.urandom(1024 * 1024))
+            for tool in TOOLS:
+                _, read_peak = measure(base_url, tool, input_file, "read")
+                _, tool_peak = measure(base_url, tool, input_file, "tool")
+                print(f"{tool:<18}{size:>9}{read_peak:>16.1f}{tool_peak:>18.1f}")
+            input_file.unlink()
+
+
+if __name__ == "__main__":
+    main()
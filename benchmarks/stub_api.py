@@ -0,0 +1,289 @@
+"""
+Local stub of the ElevenLabs API used by the benchmarks.
+
+Every endpoint sleeps for a configurable latency before answering so that
+concurrency effects are visible without hitting the real API or spending credits.
+With max_concurrency set, requests beyond that many in flight are rejected with
+a 429, as the API does once a subscription's concurrency limit is reached.
+FaultInjection makes a share of requests fail with a 503 or answer slowly.
+"""
+
+import asyncio
+import base64
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+FAKE_AUDIO_CHUNK = b"\xff\xfb\x90\x64" + b"\x00" * 4092
+
+
+class ConcurrencyLimit:
+    """ASGI middleware answering 429 while max_concurrency requests are in flight."""
+
+    def __init__(self, app, max_concurrency: int, stats: dict):
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.stats = stats
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        if self.in_flight >= self.max_concurrency:
+            self.stats["rejected"] += 1
+            response = JSONResponse(
+                {"detail": {"status": "too_many_concurrent_requests"}},
+                status_code=429,
+            )
+            return await response(scope, receive, send)
+        self.in_flight += 1
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.in_flight)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+
+class FaultInjection:
+    """
+    ASGI middleware failing failure_rate of requests with a 503 and delaying
+    slow_rate of the others by slow_seconds, chosen with a seeded random generator.
+    """
+
+    def __init__(
+        self,
+        app,
+        stats: dict,
+        failure_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_seconds: float = 1.0,
+        retry_after: float | None = None,
+        seed: int = 0,
+    ):
+        self.app = app
+        self.stats = stats
+        self.failure_rate = failure_rate
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        self.stats["requests"] += 1
+        if self.random.random() < self.failure_rate:
+            self.stats["failed"] += 1
+            headers = (
+                {"Retry-After": str(self.retry_after)}
+                if self.retry_after is not None
+                else None
+            )
+            response = JSONResponse(
+                {"detail": {"status": "service_unavailable"}},
+                status_code=503,
+                headers=headers,
+            )
+            return await response(scope, receive, send)
+        if self.random.random() < self.slow_rate:
+            self.stats["slowed"] += 1
+            await asyncio.sleep(self.slow_seconds)
+        await self.app(scope, receive, send)
+
+
+def create_app(
+    latency: float = 0.1,
+    audio_chunks: int = 4,
+    max_concurrency: int | None = None,
+    faults: dict | None = None,
+    conversations: int = 250,
+) -> FastAPI:
+    """
+    Build the stub app; faults holds FaultInjection arguments, conversations
+    is how many agent conversations are listed, and app.state.stats counts
+    rejected, failed and slowed requests.
+    """
+    app = FastAPI()
+    app.state.stats = {
+        "rejected": 0,
+        "max_in_flight": 0,
+        "requests": 0,
+        "failed": 0,
+        "slowed": 0,
+    }
+    if max_concurrency is not None:
+        app.add_middleware(
+            ConcurrencyLimit, max_concurrency=max_concurrency, stats=app.state.stats
+        )
+    if faults:
+        app.add_middleware(FaultInjection, stats=app.state.stats, **faults)
+
+    async def audio_body():
+        for _ in range(audio_chunks):
+            yield FAKE_AUDIO_CHUNK
+
+    @app.post("/v1/text-to-speech/{voice_id}")
+    async def text_to_speech(voice_id: str):
+        await asyncio.sleep(latency)
+        return StreamingResponse(audio_body(), media_type="audio/mpeg")
+
+    @app.post("/v1/text-to-speech/{voice_id}/stream")
+    async def text_to_speech_stream(voice_id: str):
+        await asyncio.sleep(latency)
+        return StreamingResponse(audio_body(), media_type="audio/mpeg")
+
+    async def drain_upload(request: Request) -> int:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+        return received
+
+    @app.post("/v1/speech-to-text")
+    async def speech_to_text(request: Request):
+        received = await drain_upload(request)
+        await asyncio.sleep(latency)
+        return {
+            "language_code": "en",
+            "language_probability": 1.0,
+            "text": f"Received {received} bytes",
+            "words": [],
+        }
+
+    @app.post("/v1/audio-isolation")
+    async def audio_isolation(request: Request):
+        await drain_upload(request)
+        await asyncio.sleep(latency)
+        return StreamingResponse(audio_body(), media_type="audio/mpeg")
+
+    @app.post("/v1/speech-to-speech/{voice_id}")
+    async def speech_to_speech(voice_id: str, request: Request):
+        await drain_upload(request)
+        await asyncio.sleep(latency)
+        return StreamingResponse(audio_body(), media_type="audio/mpeg")
+
+    @app.get("/v2/voices")
+    async def search_voices():
+        await asyncio.sleep(latency)
+        return {
+            "voices": [
+                {"voice_id": f"voice{i}", "name": name, "category": "premade"}
+                for i, name in enumerate(["Adam", "Rachel", "Bella"])
+            ],
+            "has_more": False,
+            "total_count": 3,
+        }
+
+    @app.get("/v1/voices/{voice_id}")
+    async def get_voice(voice_id: str):
+        await asyncio.sleep(latency)
+        return {"voice_id": voice_id, "name": f"Stub {voice_id}", "category": "premade"}
+
+    @app.get("/v1/models")
+    async def list_models():
+        await asyncio.sleep(latency)
+        return [
+            {
+                "model_id": "eleven_multilingual_v2",
+                "name": "Eleven Multilingual v2",
+                "can_do_text_to_speech": True,
+                "maximum_text_length_per_request": 10000,
+                "languages": [{"language_id": "en", "name": "English"}],
+            },
+            {
+                "model_id": "eleven_flash_v2_5",
+                "name": "Eleven Flash v2.5",
+                "can_do_text_to_speech": True,
+                "maximum_text_length_per_request": 40000,
+                "languages": [
+                    {"language_id": "en", "name": "English"},
+                    {"language_id": "hu", "name": "Hungarian"},
+                ],
+            },
+        ]
+
+    @app.post("/v1/text-to-voice/create-previews")
+    async def create_previews(request: Request):
+        await asyncio.sleep(latency)
+        body = await request.json()
+        audio = base64.b64encode(FAKE_AUDIO_CHUNK * audio_chunks).decode()
+        return {
+            "text": body.get("text") or "Auto-generated preview text.",
+            "previews": [
+                {
+                    "audio_base_64": audio,
+                    "generated_voice_id": f"generated{index}",
+                    "media_type": "audio/mpeg",
+                    "duration_secs": 2.5,
+                    "language": "en",
+                }
+                for index in range(3)
+            ],
+        }
+
+    @app.get("/v1/convai/conversations")
+    async def list_conversations(cursor: str | None = None, page_size: int = 30):
+        await asyncio.sleep(latency)
+        start = int(cursor or 0)
+        end = min(start + page_size, conversations)
+        return {
+            "conversations": [
+                {
+                    "agent_id": "agent0",
+                    "agent_name": "Stub agent",
+                    "conversation_id": f"conv{index:05d}",
+                    "start_time_unix_secs": 1700000000 + index,
+                    "call_duration_secs": 60,
+                    "message_count": 4,
+                    "status": "done",
+                    "call_successful": "success",
+                }
+                for index in range(start, end)
+            ],
+            "next_cursor": str(end) if end < conversations else None,
+            "has_more": end < conversations,
+        }
+
+    @app.get("/v1/convai/conversations/{conversation_id}")
+    async def get_conversation(conversation_id: str):
+        await asyncio.sleep(latency)
+        return {
+            "agent_id": "agent0",
+            "conversation_id": conversation_id,
+            "status": "done",
+            "transcript": [
+                {
+                    "role": "user" if turn % 2 == 0 else "agent",
+                    "message": f"Turn {turn} of {conversation_id}",
+                    "time_in_call_secs": turn * 15,
+                }
+                for turn in range(4)
+            ],
+            "metadata": {"start_time_unix_secs": 1700000000, "call_duration_secs": 60},
+            "has_audio": False,
+            "has_user_audio": False,
+            "has_response_audio": False,
+        }
+
+    return app
+
+
+@contextmanager
+def run_stub_api(app: FastAPI, host: str = "127.0.0.1", port: int = 8765):
+    """Serve the stub app on a background thread and yield its base URL."""
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
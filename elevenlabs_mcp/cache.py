@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class TTSCache:
+    """
+    Content-addressed on-disk cache for synthesized audio.
+
+    Entries are keyed on a hash of every input that affects the generated audio
+    and evicted least-recently-used first once the total size exceeds max_bytes.
+    Recency survives restarts through the files' modification times.
+    """
+
+    suffix = ".audio"
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.suffix):
+                stat = entry.stat()
+                existing.append(
+                    (stat.st_mtime, entry.name[: -len(self.suffix)], stat.st_size)
+                )
+        for _, key, size in sorted(existing):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def make_key(
+        text: str,
+        voice_id: str,
+        model_id: str,
+        voice_settings: dict,
+        output_format: str,
+        **extra,
+    ) -> str:
+        """Hash the synthesis inputs; extra request options only take part when set."""
+        parts = [text, voice_id, model_id, voice_settings, output_format]
+        extra = {k: v for k, v in extra.items() if v is not None}
+        if extra:
+            parts.append(extra)
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                self._total_bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        self._store(key, len(data), lambda f: f.write(data))
+
+    def put_file(self, key: str, source: Path) -> None:
+        """Add an entry by copying an existing file, without loading it into memory."""
+        try:
+            size = source.stat().st_size
+        except OSError:
+            return
+
+        def copy(f):
+            with open(source, "rb") as src:
+                shutil.copyfileobj(src, f)
+
+        self._store(key, size, copy)
+
+    def _store(self, key: str, size: int, write) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    write(f)
+                os.replace(temp_path, self._path(key))
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                return
+
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = size
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes:
+                oldest, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                self.evictions += 1
+                try:
+                    self._path(oldest).unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class ResourceCache:
+    """
+    Bounded in-memory LRU of encoded resource reads.
+
+    Keys include the file's modification time and size, so an entry is never
+    served after the file changes on disk; it just ages out.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+        self._total_bytes = 0
+
+    @staticmethod
+    def make_key(path: Path, stat: os.stat_result, *extra) -> tuple:
+        return (str(path), stat.st_mtime_ns, stat.st_size, *extra)
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, value, size: int) -> None:
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+
+# Models to prefer for each purpose, in order; the first one supporting the requested language wins
+MODEL_PREFERENCES = {
+    "tts": [
+        "eleven_multilingual_v2",
+        "eleven_turbo_v2_5",
+        "eleven_flash_v2_5",
+        "eleven_turbo_v2",
+        "eleven_flash_v2",
+    ],
+    "agent": [
+        "eleven_turbo_v2",
+        "eleven_flash_v2",
+        "eleven_turbo_v2_5",
+        "eleven_flash_v2_5",
+    ],
+}
+
+# Models for languages the first preference is known not to support, for when the catalog can't be loaded
+OFFLINE_MODELS = {
+    "tts": {
+        "hu": "eleven_flash_v2_5",
+        "no": "eleven_flash_v2_5",
+        "vi": "eleven_flash_v2_5",
+    },
+}
+
+
+def fallback_model(language: str, purpose: str = "tts") -> str:
+    """Model for a language without the catalog, from the static OFFLINE_MODELS table."""
+    return OFFLINE_MODELS.get(purpose, {}).get(
+        language.lower(), MODEL_PREFERENCES[purpose][0]
+    )
+
+
+class ModelCatalog:
+    """
+    Cached catalog of the models returned by `models.list`.
+
+    The catalog is persisted to disk so it survives server restarts and is only
+    fetched again once older than ttl seconds. A language -> best model table is
+    precomputed for every entry in MODEL_PREFERENCES whenever it is loaded.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[list[dict]]],
+        path: Path | None = None,
+        ttl: float = 86400,
+    ):
+        self.loader = loader
+        self.path = path
+        self.ttl = ttl
+        self.refreshes = 0
+        self._models: list[dict] = []
+        self._best_models: dict[str, dict[str, str]] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._load_from_disk()
+
+    def _load_from_disk(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._set_models(data["models"], data["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save_to_disk(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": self._fetched_at, "models": self._models}, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            # The in-memory catalog is still usable; it just won't survive a restart
+            pass
+
+    def _set_models(self, models: list[dict], fetched_at: float) -> None:
+        supported: dict[str, set[str]] = {}
+        for model in models:
+            if model.get("can_do_text_to_speech") is False:
+                continue
+            for language in model.get("languages") or []:
+                supported.setdefault(language["language_id"], set()).add(
+                    model["model_id"]
+                )
+
+        best_models = {}
+        for purpose, preference in MODEL_PREFERENCES.items():
+            best_models[purpose] = {}
+            for language, model_ids in supported.items():
+                best = next((m for m in preference if m in model_ids), None)
+                if best is not None:
+                    best_models[purpose][language] = best
+
+        self._models = models
+        self._best_models = best_models
+        self._fetched_at = fetched_at
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._fetched_at is not None and time.time() - self._fetched_at < self.ttl
+        )
+
+    async def refresh(self) -> None:
+        models = await self.loader()
+        self._set_models(models, time.time())
+        self.refreshes += 1
+        self._save_to_disk()
+
+    async def ensure_fresh(self) -> None:
+        if self._is_fresh():
+            return
+        async with self._lock:
+            if not self._is_fresh():
+                try:
+                    await self.refresh()
+                except Exception:
+                    # A stale catalog is better than none while the API is unreachable
+                    if not self._models:
+                        raise
+
+    def invalidate(self) -> None:
+        self._fetched_at = None
+
+    async def models(self) -> list[dict]:
+        await self.ensure_fresh()
+        return self._models
+
+    async def best_model(self, language: str, purpose: str = "tts") -> str | None:
+        """Preferred model for a language, or None if no known model supports it."""
+        await self.ensure_fresh()
+        return self._best_models.get(purpose, {}).get(language.lower())
+
+    def character_limit(self, model_id: str) -> int | None:
+        """Per-request character limit of a model, from the catalog as currently loaded."""
+        for model in self._models:
+            if model["model_id"] == model_id:
+                return model.get("maximum_text_length_per_request")
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "models": len(self._models),
+            "age_seconds": (
+                round(time.time() - self._fetched_at, 1)
+                if self._fetched_at is not None
+                else None
+            ),
+            "ttl_seconds": self.ttl,
+            "refreshes": self.refreshes,
+            "languages": len(self._best_models.get("tts", {})),
+        }
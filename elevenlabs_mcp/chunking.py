@@ -0,0 +1,82 @@
+import re
+
+
+# Maximum characters per text_to_speech request for each model
+MODEL_CHARACTER_LIMITS = {
+    "eleven_multilingual_v2": 10000,
+    "eleven_flash_v2_5": 40000,
+    "eleven_turbo_v2_5": 40000,
+    "eleven_flash_v2": 30000,
+    "eleven_turbo_v2": 30000,
+    "eleven_monolingual_v1": 10000,
+}
+DEFAULT_CHARACTER_LIMIT = 10000
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?;:…。！？])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,，、])\s+")
+
+
+def get_character_limit(model_id: str) -> int:
+    return MODEL_CHARACTER_LIMITS.get(model_id, DEFAULT_CHARACTER_LIMIT)
+
+
+def _split_oversized(piece: str, max_chars: int) -> list[str]:
+    """Split a single sentence longer than max_chars on clauses, then words, then characters."""
+    for pattern in (_CLAUSE_END, re.compile(r"\s+")):
+        parts = pattern.split(piece)
+        if len(parts) > 1:
+            return _pack(parts, max_chars, " ")
+    return [piece[i : i + max_chars] for i in range(0, len(piece), max_chars)]
+
+
+def _pack(pieces: list[str], max_chars: int, separator: str) -> list[str]:
+    """Greedily join pieces into chunks of at most max_chars characters."""
+    chunks = []
+    current = ""
+    for piece in pieces:
+        piece = piece.strip()
+        if not piece:
+            continue
+        if len(piece) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.extend(_split_oversized(piece, max_chars))
+            continue
+        candidate = f"{current}{separator}{piece}" if current else piece
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_text(text: str, max_chars: int) -> list[str]:
+    """
+    Split text into chunks of at most max_chars characters.
+
+    Paragraph boundaries are preferred, then sentence boundaries; clauses, words
+    and finally raw characters are only used for sentences longer than max_chars.
+
+    Args:
+        text: The text to split
+        max_chars: Maximum number of characters per chunk
+
+    Returns:
+        list[str]: Chunks in their original order
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+
+    pieces = []
+    for paragraph in _PARAGRAPH_BREAK.split(text.strip()):
+        paragraph = paragraph.strip()
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+        else:
+            pieces.extend(_pack(_SENTENCE_END.split(paragraph), max_chars, " "))
+    return _pack(pieces, max_chars, "\n\n")
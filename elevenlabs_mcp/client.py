@@ -0,0 +1,87 @@
+import threading
+from typing import Any, Callable
+
+import httpx
+from elevenlabs_mcp import __version__
+from elevenlabs_mcp.rate_limit import RateLimitedTransport, RateLimiter
+from elevenlabs_mcp.retry import RetryPolicy, RetryTransport
+from elevenlabs_mcp.utils import get_env_bool, get_env_float, get_env_int
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+def get_connection_limits() -> httpx.Limits:
+    """
+    Build the connection pool limits for the shared HTTP client.
+
+    Configurable through ELEVENLABS_MCP_MAX_CONNECTIONS,
+    ELEVENLABS_MCP_MAX_KEEPALIVE_CONNECTIONS and ELEVENLABS_MCP_KEEPALIVE_EXPIRY.
+    """
+    max_connections = get_env_int(
+        "ELEVENLABS_MCP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS
+    )
+    max_keepalive_connections = get_env_int(
+        "ELEVENLABS_MCP_MAX_KEEPALIVE_CONNECTIONS",
+        min(DEFAULT_MAX_KEEPALIVE_CONNECTIONS, max_connections),
+    )
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(max_keepalive_connections, max_connections),
+        keepalive_expiry=get_env_float(
+            "ELEVENLABS_MCP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY
+        ),
+    )
+
+
+def create_http_client(
+    limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None
+) -> httpx.AsyncClient:
+    """
+    Create the pooled async HTTP client shared by every tool.
+
+    HTTP/2 is enabled with ELEVENLABS_MCP_HTTP2=true and requires the `h2`
+    package (`pip install httpx[http2]`). Requests pass through limiter and
+    are retried according to retry_policy when they are given; every retry
+    waits for the limiter again.
+    """
+    limits = get_connection_limits()
+    http2 = get_env_bool("ELEVENLABS_MCP_HTTP2", False)
+    headers = {
+        "User-Agent": f"ElevenLabs-MCP/{__version__}",
+    }
+    if limiter is None and retry_policy is None:
+        return httpx.AsyncClient(headers=headers, limits=limits, http2=http2)
+    transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    if limiter is not None:
+        transport = RateLimitedTransport(transport, limiter)
+    if retry_policy is not None:
+        transport = RetryTransport(transport, retry_policy)
+    return httpx.AsyncClient(headers=headers, transport=transport)
+
+
+class LazyClient:
+    """
+    Stands in for a client that is only constructed when first used.
+
+    Attribute access is forwarded to the client, which factory creates on the
+    first access; building the ElevenLabs client imports the whole SDK, which
+    would otherwise delay server startup.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
@@ -0,0 +1,265 @@
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class ConversationPage:
+    """One page of the conversation list: its conversation IDs and where the next page starts."""
+
+    conversation_ids: list[str]
+    next_cursor: str | None = None
+    has_more: bool = False
+
+
+@dataclass
+class ExportResult:
+    output_file: Path
+    state_file: Path
+    exported: int = 0
+    skipped: int = 0
+    pages: int = 0
+    complete: bool = False
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        text = f"Exported {self.exported} conversations"
+        if self.skipped:
+            text += f" ({self.skipped} already in the file)"
+        text += f" to {self.output_file}; {self.pages} pages of the conversation list are done."
+        if self.failed:
+            text += f" {len(self.failed)} conversations failed and are retried on the next resumed run: {json.dumps(self.failed)}"
+        if not self.complete:
+            text += f" The export stopped before the last page; run it again with resume to continue from {self.state_file.name}."
+        return text
+
+
+def state_file_for(output_file: Path) -> Path:
+    return output_file.with_name(f"{output_file.name}.state.json")
+
+
+def _read_exported_ids(output_file: Path) -> set[str]:
+    """
+    IDs of the conversations already in output_file.
+
+    A last line cut short by an interruption is removed, so the conversation
+    is fetched and written again. Any other line that is not an exported
+    conversation means the file is not this export, and it is left untouched.
+    """
+    exported = set()
+    if not output_file.exists():
+        return exported
+    with open(output_file, "r+b") as f:
+        offset = 0
+        for number, line in enumerate(f, start=1):
+            if not line.endswith(b"\n"):
+                f.truncate(offset)
+                break
+            try:
+                exported.add(json.loads(line)["conversation_id"])
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(
+                    f"Line {number} of {output_file} is not an exported conversation; "
+                    "use another file name, or resume=False to overwrite it"
+                )
+            offset += len(line)
+    return exported
+
+
+class ExportState:
+    """
+    Sidecar file recording how far an export got.
+
+    cursor is where the first page not yet completely written starts (None
+    for the first page), failed maps conversations that could not be fetched
+    to their error, and filters are the list filters the export was started
+    with, so a resumed run cannot mix two different exports in one file.
+    """
+
+    def __init__(self, path: Path, filters: dict[str, Any]):
+        self.path = path
+        self.filters = filters
+        self.cursor: str | None = None
+        self.pages = 0
+        self.complete = False
+        self.failed: dict[str, str] = {}
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read export state {self.path}: {e}") from e
+        if data.get("filters") != self.filters:
+            raise ValueError(
+                f"{self.path.name} belongs to an export with filters {data.get('filters')}; "
+                "use the same filters, another file name, or resume=False to start over"
+            )
+        self.complete = data.get("complete", False)
+        self.failed = data.get("failed", {})
+        if not self.complete:
+            # A complete export starts again from the first page to pick up new conversations
+            self.cursor = data.get("cursor")
+            self.pages = data.get("pages", 0)
+
+    def save(self) -> None:
+        data = {
+            "filters": self.filters,
+            "cursor": self.cursor,
+            "pages": self.pages,
+            "complete": self.complete,
+            "failed": self.failed,
+        }
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+
+
+@dataclass
+class _PendingPage:
+    next_cursor: str | None
+    remaining: int = 0
+
+
+async def export_conversation_pages(
+    list_page: Callable[[str | None], Awaitable[ConversationPage]],
+    fetch_conversation: Callable[[str], Awaitable[dict]],
+    output_file: Path,
+    filters: dict[str, Any] | None = None,
+    max_concurrency: int = 8,
+    resume: bool = True,
+    progress: Callable[[int], Awaitable[None]] | None = None,
+) -> ExportResult:
+    """
+    Walk every page of the conversation list and append each conversation to a JSONL file.
+
+    Conversations are fetched up to max_concurrency at a time while the next
+    page is listed, and each is written as one line as soon as it arrives, so
+    lines are in completion order rather than list order. The cursor in the
+    state file only moves past a page once all of its conversations are
+    written. With resume, an interrupted export continues from that cursor,
+    conversations already in the file are not fetched again and earlier
+    failures are retried; without it the file is started over.
+
+    Args:
+        list_page: Returns the page starting at a cursor, None for the first page
+        fetch_conversation: Returns one conversation as a JSON-serializable dict
+        output_file: JSONL file to append to; the state file sits next to it
+        filters: List filters, recorded so a resume uses the same ones
+        max_concurrency: Conversations fetched at the same time
+        resume: Continue the export recorded next to output_file
+        progress: Called with the number of conversations written so far
+
+    Returns:
+        Counts for this run and whether the last page was reached
+    """
+    state = ExportState(state_file_for(output_file), filters or {})
+    if resume:
+        if output_file.exists() and not state.path.exists():
+            raise ValueError(
+                f"{output_file} already exists and has no {state.path.name} next to it, "
+                "so it is not an export to resume; use another file name, or resume=False to overwrite it"
+            )
+        state.load()
+        seen = _read_exported_ids(output_file)
+    else:
+        output_file.unlink(missing_ok=True)
+        seen = set()
+    state.complete = False
+    state.save()
+
+    result = ExportResult(output_file=output_file, state_file=state.path)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pending: list[_PendingPage] = []
+    tasks: set[asyncio.Task] = set()
+    retry_ids = set(state.failed)
+
+    def commit() -> None:
+        # Move the cursor past every leading page that is completely written
+        moved = False
+        while pending and pending[0].remaining == 0:
+            page = pending.pop(0)
+            state.cursor = page.next_cursor
+            state.pages += 1
+            state.complete = page.next_cursor is None
+            moved = True
+        if moved:
+            state.save()
+
+    with open(output_file, "a", encoding="utf-8", newline="\n") as out:
+
+        async def export_one(conversation_id: str, page: _PendingPage | None) -> None:
+            try:
+                conversation = await fetch_conversation(conversation_id)
+                line = json.dumps(
+                    {"conversation_id": conversation_id, **conversation},
+                    ensure_ascii=False,
+                )
+                out.write(line + "\n")
+                out.flush()
+            except Exception as e:
+                state.failed[conversation_id] = str(e)
+                result.failed[conversation_id] = str(e)
+            else:
+                state.failed.pop(conversation_id, None)
+                result.exported += 1
+            finally:
+                semaphore.release()
+            # Not reached when cancelled, so an unwritten conversation never moves the cursor
+            if page is not None:
+                page.remaining -= 1
+                commit()
+            if progress and conversation_id not in result.failed:
+                await progress(result.exported)
+
+        async def start(conversation_id: str, page: _PendingPage | None) -> None:
+            await semaphore.acquire()
+            seen.add(conversation_id)
+            task = asyncio.create_task(export_one(conversation_id, page))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        try:
+            for conversation_id in retry_ids:
+                if conversation_id in seen:
+                    state.failed.pop(conversation_id, None)
+                else:
+                    await start(conversation_id, None)
+
+            cursor = state.cursor
+            while True:
+                listed = await list_page(cursor)
+                next_cursor = listed.next_cursor if listed.has_more else None
+                page = _PendingPage(next_cursor)
+                pending.append(page)
+                for conversation_id in listed.conversation_ids:
+                    if conversation_id in seen:
+                        if conversation_id not in retry_ids:
+                            result.skipped += 1
+                        continue
+                    page.remaining += 1
+                    await start(conversation_id, page)
+                commit()
+                if next_cursor is None:
+                    break
+                cursor = next_cursor
+
+            await asyncio.gather(*tasks)
+        except Exception:
+            # Keep what is already being fetched, then report the listing error
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            state.save()
+
+    result.pages = state.pages
+    result.complete = state.complete
+    return result
@@ -0,0 +1,133 @@
+import os
+import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from pathlib import Path
+
+
+# Directories whose indexes are kept in memory at once
+MAX_INDEXED_DIRECTORIES = 32
+# Directories with more files than this only score the files sharing the most trigrams with the query
+MAX_CANDIDATES = 256
+
+
+_NON_ALPHANUMERIC = re.compile(r"\W")
+
+
+def _normalize(filename: str) -> str:
+    """Lowercased alphanumeric tokens in sorted order, as fuzz.token_sort_ratio compares them."""
+    return " ".join(sorted(_NON_ALPHANUMERIC.sub(" ", filename).lower().split()))
+
+
+def _trigrams(normalized: str) -> set[str]:
+    padded = f"  {normalized} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class FilenameIndex:
+    """
+    Filenames in a directory (and optionally its subdirectories) indexed for fuzzy lookups.
+
+    Every filename is stored pre-normalized with a trigram -> files table, so a
+    lookup in a large directory only scores the closest candidates. The index
+    is stale once the modification time of any scanned directory changes.
+    """
+
+    def __init__(self, directory: Path, recursive: bool = False):
+        self.directory = directory
+        self.recursive = recursive
+        self._paths: list[str] = []
+        self._normalized: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+        self._mtimes: dict[str, int] = {}
+        self._scan()
+
+    def _add_directory(self, directory: str) -> list[str]:
+        self._mtimes[directory] = os.stat(directory).st_mtime_ns
+        subdirectories = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    self._paths.append(entry.path)
+                elif self.recursive and entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+        return subdirectories
+
+    def _scan(self) -> None:
+        pending = [str(self.directory)]
+        while pending:
+            pending.extend(self._add_directory(pending.pop()))
+
+        postings = defaultdict(list)
+        for index, path in enumerate(self._paths):
+            normalized = _normalize(os.path.basename(path))
+            self._normalized.append(normalized)
+            for gram in _trigrams(normalized):
+                postings[gram].append(index)
+        self._postings = dict(postings)
+
+    def is_stale(self) -> bool:
+        try:
+            return any(
+                os.stat(directory).st_mtime_ns != mtime
+                for directory, mtime in self._mtimes.items()
+            )
+        except OSError:
+            return True
+
+    def _candidates(self, normalized: str) -> list[int]:
+        if len(self._paths) <= MAX_CANDIDATES:
+            return list(range(len(self._paths)))
+
+        postings = [
+            self._postings[gram]
+            for gram in _trigrams(normalized)
+            if gram in self._postings
+        ]
+        # Trigrams shared by most files (like the extension) don't tell candidates apart
+        selective = [p for p in postings if len(p) <= len(self._paths) // 2] or postings
+        shared = Counter()
+        for posting in selective:
+            shared.update(posting)
+        return [index for index, _ in shared.most_common(MAX_CANDIDATES)]
+
+    def find_similar(
+        self, filename: str, threshold: int = 70, exclude: Path | None = None
+    ) -> list[tuple[Path, int]]:
+        """Files scoring at least threshold on fuzz.token_sort_ratio, best first."""
+        from fuzzywuzzy import fuzz
+
+        normalized = _normalize(filename)
+        excluded = str(exclude) if exclude is not None else None
+        matches = []
+        for index in self._candidates(normalized):
+            path = self._paths[index]
+            if path == excluded:
+                continue
+            similarity = fuzz.ratio(normalized, self._normalized[index])
+            if similarity >= threshold:
+                matches.append((Path(path), similarity))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+
+_indexes: OrderedDict[tuple[str, bool], FilenameIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_filename_index(directory: Path, recursive: bool = False) -> FilenameIndex:
+    """Cached index for a directory, rebuilt when the directory has changed."""
+    key = (str(directory), recursive)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None and not index.is_stale():
+            _indexes.move_to_end(key)
+            return index
+
+    index = FilenameIndex(directory, recursive)
+    with _indexes_lock:
+        _indexes[key] = index
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_INDEXED_DIRECTORIES:
+            _indexes.popitem(last=False)
+    return index
@@ -0,0 +1,166 @@
+import json
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterator, NamedTuple
+
+
+# Longest subtitle cue before it is split, even when the same speaker keeps talking
+SUBTITLE_MAX_CHARS = 84
+
+
+class TranscriptSegment(NamedTuple):
+    speaker: str | None
+    start: float | None
+    end: float | None
+    text: str
+
+
+def _get_words(transcription) -> list[Any]:
+    if isinstance(transcription, dict):
+        return transcription.get("words") or []
+    return getattr(transcription, "words", None) or []
+
+
+def _get_text(transcription) -> str:
+    if isinstance(transcription, dict):
+        return transcription.get("text") or ""
+    return getattr(transcription, "text", None) or ""
+
+
+def _field_readers(word) -> tuple[Callable[[Any], Any], ...]:
+    """Getters for text, speaker_id, type, start and end suited to words shaped like this one."""
+    fields = ("text", "speaker_id", "type", "start", "end")
+    if isinstance(word, dict):
+        return tuple(
+            itemgetter(field) if field in word else partial(_get_key, field=field)
+            for field in fields
+        )
+    return tuple(
+        attrgetter(field) if hasattr(word, field) else partial(_get_attr, field=field)
+        for field in fields
+    )
+
+
+def _get_key(word: dict, field: str):
+    return word.get(field)
+
+
+def _get_attr(word, field: str):
+    return getattr(word, field, None)
+
+
+def iter_segments(
+    transcription, max_chars: int | None = None
+) -> Iterator[TranscriptSegment]:
+    """
+    Group a transcription's words into consecutive same-speaker segments in one pass.
+
+    Spacing entries are skipped. Words may be objects or dicts; the representation
+    is detected once from the first word.
+
+    Args:
+        transcription: scribe response, or a dict with the same fields
+        max_chars: Also start a new segment before its text would exceed this length
+
+    Yields:
+        TranscriptSegment: speaker, start, end and text of each segment, in order
+    """
+    words = _get_words(transcription)
+    if not words:
+        return
+    text_of, speaker_of, type_of, start_of, end_of = _field_readers(words[0])
+
+    def segment(speaker, group: list) -> TranscriptSegment:
+        text = " ".join(filter(None, map(str.strip, map(text_of, group))))
+        return TranscriptSegment(speaker, start_of(group[0]), end_of(group[-1]), text)
+
+    spoken = [word for word in words if type_of(word) != "spacing" and text_of(word)]
+    for speaker, run in groupby(spoken, key=speaker_of):
+        group = list(run)
+        if max_chars is None:
+            yield segment(speaker, group)
+            continue
+
+        first, length = 0, -1
+        for index, size in enumerate(map(len, map(str.strip, map(text_of, group)))):
+            if index > first and length + 1 + size > max_chars:
+                yield segment(speaker, group[first:index])
+                first, length = index, -1
+            length += 1 + size
+        yield segment(speaker, group[first:])
+
+
+@lru_cache(maxsize=256)
+def speaker_label(speaker_id: str) -> str:
+    return speaker_id.upper().replace("_", " ")
+
+
+def format_diarized_transcript(transcription) -> str:
+    """Format transcript with speaker labels from diarized response."""
+    try:
+        lines = [
+            f"{speaker_label(segment.speaker)}: {segment.text}"
+            if segment.speaker
+            else segment.text
+            for segment in iter_segments(transcription)
+        ]
+    except Exception:
+        # Fallback to regular text if something goes wrong
+        return _get_text(transcription)
+    return "\n\n".join(lines) if lines else _get_text(transcription)
+
+
+def _timestamp(seconds: float | None, separator: str) -> str:
+    milliseconds = round((seconds or 0) * 1000)
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
+
+
+def format_srt(transcription, max_chars: int = SUBTITLE_MAX_CHARS) -> str:
+    """Render a transcription as SubRip subtitles, one cue per segment."""
+    cues = []
+    for index, segment in enumerate(iter_segments(transcription, max_chars), 1):
+        text = (
+            f"[{speaker_label(segment.speaker)}] {segment.text}"
+            if segment.speaker
+            else segment.text
+        )
+        cues.append(
+            f"{index}\n{_timestamp(segment.start, ',')} --> {_timestamp(segment.end, ',')}\n{text}\n"
+        )
+    return "\n".join(cues)
+
+
+def format_vtt(transcription, max_chars: int = SUBTITLE_MAX_CHARS) -> str:
+    """Render a transcription as WebVTT subtitles, with speakers as voice spans."""
+    cues = ["WEBVTT\n"]
+    for segment in iter_segments(transcription, max_chars):
+        text = (
+            f"<v {speaker_label(segment.speaker)}>{segment.text}"
+            if segment.speaker
+            else segment.text
+        )
+        cues.append(
+            f"{_timestamp(segment.start, '.')} --> {_timestamp(segment.end, '.')}\n{text}\n"
+        )
+    return "\n".join(cues)
+
+
+def format_transcript_json(transcription) -> str:
+    """Render a transcription as JSON with its full text and speaker segments."""
+    language_code = (
+        transcription.get("language_code")
+        if isinstance(transcription, dict)
+        else getattr(transcription, "language_code", None)
+    )
+    return json.dumps(
+        {
+            "language_code": language_code,
+            "text": _get_text(transcription),
+            "segments": [segment._asdict() for segment in iter_segments(transcription)],
+        },
+        ensure_ascii=False,
+    )
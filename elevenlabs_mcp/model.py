@@ -32,3 +32,16 @@ class McpModel(BaseModel):
     id: str
     name: str
     languages: list[McpLanguage]
+
+
+class BatchSpeechItem(BaseModel):
+    text: str
+    voice_id: Optional[str] = None
+    voice_name: Optional[str] = None
+    model_id: Optional[str] = None
+    language: str = "en"
+    stability: float = 0.5
+    similarity_boost: float = 0.75
+    style: float = 0
+    use_speaker_boost: bool = True
+    speed: float = 1.0
@@ -0,0 +1,329 @@
+import asyncio
+import os
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from elevenlabs_mcp.utils import get_env_float, get_env_int
+
+
+# URL path prefixes of each endpoint family; requests to any other path belong to "other"
+ENDPOINT_FAMILIES = {
+    "tts": (
+        "/v1/text-to-speech",
+        "/v1/text-to-dialogue",
+        "/v1/sound-generation",
+        "/v1/speech-to-speech",
+        "/v1/audio-isolation",
+        "/v1/text-to-voice",
+    ),
+    "stt": ("/v1/speech-to-text",),
+    "music": ("/v1/music",),
+    "convai": ("/v1/convai",),
+}
+
+# Concurrent generation requests allowed per subscription tier, after ElevenLabs' published limits
+TIER_CONCURRENCY = {
+    "free": 2,
+    "starter": 3,
+    "creator": 5,
+    "pro": 10,
+    "scale": 15,
+    "business": 15,
+}
+
+# Pause after a 429 that carries no usable Retry-After header
+DEFAULT_THROTTLE_SECONDS = 1.0
+
+
+def endpoint_family(path: str) -> str:
+    for family, prefixes in ENDPOINT_FAMILIES.items():
+        if path.startswith(prefixes):
+            return family
+    return "other"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header, given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Requests per second with bursts of up to burst requests.
+
+    Tokens may go negative: every caller reserves the next token as soon as
+    it asks and sleeps until it is due, so waiters are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate, self._paused_until - now)
+
+    def refund(self) -> None:
+        self._tokens = min(self.burst, self._tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for seconds, as the API asked with a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class ConcurrencyGate:
+    """A semaphore whose limit can change while requests wait; None means unlimited."""
+
+    def __init__(self, limit: int | None = None):
+        self.limit = limit
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    def has_room(self) -> bool:
+        return self.limit is None or self.in_flight < self.limit
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.has_room():
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the caller gave up
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def set_limit(self, limit: int | None) -> None:
+        self.limit = limit
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.has_room():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class FamilyStats:
+    def __init__(self):
+        self.requests = 0
+        self.waited = 0
+        self.max_queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+
+
+class RateLimiter:
+    """
+    Client-side throttle for API requests: one token bucket for every request,
+    plus a cap on concurrent requests per endpoint family.
+
+    Requests queue here instead of being rejected by the API with a 429, which
+    fails the tool call. A 429 that still gets through pauses the bucket for
+    its Retry-After. Caps passed to the constructor take
+    precedence over the ones derived from a subscription tier.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0,
+        burst: int = 1,
+        concurrency: dict[str, int] | None = None,
+        tier: str | None = None,
+    ):
+        self.bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self.fixed_concurrency = dict(concurrency or {})
+        self.tier: str | None = None
+        self.gates = {
+            family: ConcurrencyGate() for family in [*ENDPOINT_FAMILIES, "other"]
+        }
+        self._stats = {family: FamilyStats() for family in self.gates}
+        for family, limit in self.fixed_concurrency.items():
+            self.gates[family].set_limit(limit)
+        if tier:
+            self.apply_tier(tier)
+
+    def apply_tier(self, tier: str | None) -> None:
+        """Cap the generation families at the concurrency of a subscription tier."""
+        limit = TIER_CONCURRENCY.get((tier or "").lower())
+        if limit is None:
+            return
+        self.tier = tier.lower()
+        for family in ENDPOINT_FAMILIES:
+            if family not in self.fixed_concurrency:
+                self.gates[family].set_limit(limit)
+
+    async def acquire(self, family: str) -> None:
+        """Wait for a token and a slot in family; pair every call with release(family)."""
+        gate = self.gates[family]
+        stats = self._stats[family]
+        stats.requests += 1
+        start = time.monotonic()
+        if self.bucket is not None:
+            delay = self.bucket.reserve()
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    self.bucket.refund()
+                    raise
+        if gate.queued or not gate.has_room():
+            stats.max_queued = max(stats.max_queued, gate.queued + 1)
+        await gate.acquire()
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            stats.waited += 1
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+
+    def release(self, family: str) -> None:
+        self.gates[family].release()
+
+    def throttled(self, family: str, retry_after: float | None) -> None:
+        """Record a 429 from the API and hold back the following requests."""
+        self._stats[family].throttled += 1
+        if self.bucket is not None:
+            self.bucket.pause(
+                retry_after if retry_after is not None else DEFAULT_THROTTLE_SECONDS
+            )
+
+    def stats(self) -> dict:
+        families = {}
+        for family, gate in self.gates.items():
+            stats = self._stats[family]
+            families[family] = {
+                "limit": gate.limit,
+                "in_flight": gate.in_flight,
+                "queued": gate.queued,
+                "max_queued": stats.max_queued,
+                "requests": stats.requests,
+                "waited": stats.waited,
+                "average_wait_seconds": round(stats.total_wait / stats.waited, 3)
+                if stats.waited
+                else 0.0,
+                "max_wait_seconds": round(stats.max_wait, 3),
+                "throttled": stats.throttled,
+            }
+        return {
+            "requests_per_second": self.bucket.rate if self.bucket else None,
+            "burst": self.bucket.burst if self.bucket else None,
+            "tier": self.tier,
+            "families": families,
+        }
+
+
+def create_rate_limiter() -> RateLimiter:
+    """
+    Rate limiter configured from the environment.
+
+    ELEVENLABS_MCP_RATE_LIMIT requests per second (default: unlimited) in bursts
+    of ELEVENLABS_MCP_RATE_LIMIT_BURST; ELEVENLABS_MCP_CONCURRENCY_TTS, _STT,
+    _MUSIC and _CONVAI cap concurrent requests per family, and
+    ELEVENLABS_MCP_SUBSCRIPTION_TIER sets the caps that aren't given.
+    """
+    rate = get_env_float("ELEVENLABS_MCP_RATE_LIMIT", 0)
+    concurrency = {}
+    for family in ENDPOINT_FAMILIES:
+        limit = get_env_int(
+            f"ELEVENLABS_MCP_CONCURRENCY_{family.upper()}", 0, minimum=0
+        )
+        if limit > 0:
+            concurrency[family] = limit
+    return RateLimiter(
+        rate=rate,
+        burst=get_env_int("ELEVENLABS_MCP_RATE_LIMIT_BURST", max(1, int(rate))),
+        concurrency=concurrency,
+        tier=os.getenv("ELEVENLABS_MCP_SUBSCRIPTION_TIER"),
+    )
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that gives back its concurrency slot once it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                release, self._release = self._release, None
+                release()
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that passes every request through a RateLimiter.
+
+    A request holds its family's slot until its response body is closed, so
+    streamed audio counts against the cap for as long as it is downloading.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        family = endpoint_family(request.url.path)
+        await self.limiter.acquire(family)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            self.limiter.release(family)
+            raise
+
+        if response.status_code == 429:
+            self.limiter.throttled(
+                family, parse_retry_after(response.headers.get("retry-after"))
+            )
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(
+                response.stream, lambda: self.limiter.release(family)
+            ),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
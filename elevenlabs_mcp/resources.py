@@ -0,0 +1,251 @@
+import base64
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import pydantic_core
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ResourceError
+from mcp.server.fastmcp.resources import FunctionResource
+from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.types import AnyFunction
+
+from elevenlabs_mcp.tool_schemas import ToolSchemaCache, build_tool
+
+
+# Bytes read per step when encoding a file; a multiple of 3 so the base64 pieces concatenate cleanly
+BASE64_CHUNK_SIZE = 3 * 256 * 1024
+# Deferred outputs saved on disk that stay reachable by URI; they cost no memory beyond their path
+MAX_DEFERRED_FILES = 4096
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ResourceData:
+    """Resource contents that are already encoded for the wire."""
+
+    mime_type: str
+    text: str | None = None
+    blob: str | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.text if self.text is not None else self.blob)
+
+
+def encode_file_base64(
+    file_path: Path,
+    offset: int = 0,
+    length: int | None = None,
+    chunk_size: int = BASE64_CHUNK_SIZE,
+) -> str:
+    """
+    Base64-encode a file, or a byte range of it, a chunk at a time.
+
+    Only one chunk of raw bytes is held at once, next to the encoded output,
+    instead of the whole file followed by its encoding.
+
+    Args:
+        file_path: File to encode
+        offset: First byte to include
+        length: Number of bytes to include; the rest of the file if None
+        chunk_size: Bytes read per step, rounded down to a multiple of 3
+
+    Returns:
+        str: Base64 of the requested bytes
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    with open(file_path, "rb") as f:
+        remaining = f.seek(0, 2) - offset
+        if length is not None:
+            remaining = min(remaining, length)
+        remaining = max(remaining, 0)
+        f.seek(offset)
+
+        encoded = bytearray(4 * ((remaining + 2) // 3))
+        position = 0
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            piece = base64.b64encode(chunk)
+            encoded[position : position + len(piece)] = piece
+            position += len(piece)
+            remaining -= len(chunk)
+    return encoded[:position].decode("ascii")
+
+
+class DeferredResources:
+    """
+    Outputs too large to inline in a tool result, served later by URI.
+
+    Outputs saved on disk are remembered by path. Outputs that only exist in
+    memory are kept until max_bytes is exceeded, least recently used first;
+    an evicted output has to be generated again.
+    """
+
+    def __init__(self, max_inline_bytes: int, max_bytes: int):
+        self.max_inline_bytes = max_inline_bytes
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: OrderedDict[str, Path | bytes] = OrderedDict()
+        self._bytes = 0
+        self._files = 0
+        self._lock = threading.Lock()
+
+    def should_defer(self, size: int) -> bool:
+        return size > self.max_inline_bytes
+
+    @staticmethod
+    def uri(name: str) -> str:
+        return f"elevenlabs://outputs/{name}"
+
+    def _account(self, entry: Path | bytes, sign: int) -> None:
+        if isinstance(entry, bytes):
+            self._bytes += sign * len(entry)
+        else:
+            self._files += sign
+
+    def add(self, name: str, source: Path | bytes) -> str:
+        """Remember an output's file path or contents under its filename; returns its URI."""
+        with self._lock:
+            previous = self._entries.pop(name, None)
+            if previous is not None:
+                self._account(previous, -1)
+            self._entries[name] = source
+            self._account(source, 1)
+            while (
+                self._bytes > self.max_bytes or self._files > MAX_DEFERRED_FILES
+            ) and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._account(evicted, -1)
+                self.evictions += 1
+        return self.uri(name)
+
+    def get(self, name: str) -> Path | bytes | None:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                self._entries.move_to_end(name)
+            return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "outputs": len(self._entries),
+                "bytes_in_memory": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_inline_bytes": self.max_inline_bytes,
+                "evictions": self.evictions,
+            }
+
+
+class ElevenLabsFastMCP(FastMCP):
+    """
+    FastMCP server whose resource functions may return ResourceData.
+
+    FastMCP base64-encodes binary resources in one piece and labels them with
+    the template's MIME type; ResourceData is sent as-is with its own MIME type.
+    Tool parameter schemas come from tool_schemas when it has them.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        tool_schemas: ToolSchemaCache | None = None,
+        **settings,
+    ):
+        self.tool_schemas = tool_schemas
+        super().__init__(name, **settings)
+
+    def add_tool(
+        self,
+        fn: AnyFunction,
+        name: str | None = None,
+        description: str | None = None,
+        parameter_schemas: dict | None = None,
+    ) -> None:
+        tool = build_tool(fn, name, description, self.tool_schemas, parameter_schemas)
+        tools = self._tool_manager._tools
+        if tool.name in tools:
+            if self._tool_manager.warn_on_duplicate_tools:
+                logger.warning(f"Tool already exists: {tool.name}")
+            return
+        tools[tool.name] = tool
+
+    def tool(
+        self,
+        name: str | None = None,
+        description: str | None = None,
+        parameter_schemas: dict | None = None,
+    ):
+        """
+        Decorator to register a tool, like FastMCP.tool.
+
+        parameter_schemas maps parameter names to callables returning their JSON
+        schema; they are only called when the tool's schema is not cached.
+        """
+        if callable(name):
+            raise TypeError(
+                "The @tool decorator was used incorrectly. "
+                "Did you forget to call it? Use @tool() instead of @tool"
+            )
+
+        def decorator(fn: AnyFunction) -> AnyFunction:
+            self.add_tool(fn, name, description, parameter_schemas)
+            return fn
+
+        return decorator
+
+    def _setup_handlers(self) -> None:
+        super()._setup_handlers()
+        self._mcp_server.request_handlers[types.ReadResourceRequest] = (
+            self._handle_read_resource
+        )
+
+    async def _handle_read_resource(
+        self, request: types.ReadResourceRequest
+    ) -> types.ServerResult:
+        uri = request.params.uri
+        try:
+            resource = await self._resource_manager.get_resource(uri)
+            if resource is None:
+                raise ResourceError(f"Unknown resource: {uri}")
+            if isinstance(resource, FunctionResource):
+                result = resource.fn()
+                if inspect.isawaitable(result):
+                    result = await result
+                if not isinstance(result, (ResourceData, str, bytes)):
+                    result = json.dumps(pydantic_core.to_jsonable_python(result))
+            else:
+                result = await resource.read()
+        except ResourceError:
+            raise
+        except Exception as e:
+            raise ResourceError(str(e))
+
+        if isinstance(result, ResourceData):
+            if result.text is not None:
+                contents = types.TextResourceContents(
+                    uri=uri, mimeType=result.mime_type, text=result.text
+                )
+            else:
+                contents = types.BlobResourceContents(
+                    uri=uri, mimeType=result.mime_type, blob=result.blob
+                )
+        elif isinstance(result, bytes):
+            contents = types.BlobResourceContents(
+                uri=uri,
+                mimeType=resource.mime_type,
+                blob=base64.b64encode(result).decode(),
+            )
+        else:
+            contents = types.TextResourceContents(
+                uri=uri, mimeType=resource.mime_type, text=result
+            )
+        return types.ServerResult(types.ReadResourceResult(contents=[contents]))
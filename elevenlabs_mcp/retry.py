@@ -0,0 +1,183 @@
+import asyncio
+import random
+
+import httpx
+
+from elevenlabs_mcp.rate_limit import parse_retry_after
+from elevenlabs_mcp.utils import get_env_float, get_env_int
+
+
+# Responses worth another attempt; 429s and 503s usually say when with Retry-After
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# Statuses that mean the request was not processed, so even a POST can be sent again
+NOT_PROCESSED_STATUS_CODES = frozenset({429})
+# Methods that can be sent twice without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Retry-After longer than this is passed on to the caller instead of waited out
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed request again.
+
+    Idempotent requests are retried after transport errors and retryable
+    statuses; other requests only when they never reached the API: failed
+    connections and 429s. Waits grow exponentially from base_delay up to
+    max_delay with full jitter, unless the response gives a Retry-After.
+    GET requests still unanswered after hedge_after seconds are sent a
+    second time and the first response wins; 0 disables hedging.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        hedge_after: float = 0,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge_after = hedge_after
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.hedged = 0
+        self.hedges_won = 0
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def stats(self) -> dict:
+        return {
+            "max_retries": self.max_retries,
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+            "hedge_after_seconds": self.hedge_after or None,
+            "hedged": self.hedged,
+            "hedges_won": self.hedges_won,
+        }
+
+
+def create_retry_policy() -> RetryPolicy:
+    """
+    Retry policy configured from the environment.
+
+    ELEVENLABS_MCP_MAX_RETRIES (default: 2), ELEVENLABS_MCP_RETRY_BASE_DELAY and
+    ELEVENLABS_MCP_RETRY_MAX_DELAY in seconds, and ELEVENLABS_MCP_HEDGE_AFTER_MS
+    to hedge slow GET requests (default: off).
+    """
+    return RetryPolicy(
+        max_retries=get_env_int("ELEVENLABS_MCP_MAX_RETRIES", 2, minimum=0),
+        base_delay=get_env_float("ELEVENLABS_MCP_RETRY_BASE_DELAY", 0.5),
+        max_delay=get_env_float("ELEVENLABS_MCP_RETRY_MAX_DELAY", 8.0),
+        hedge_after=get_env_int("ELEVENLABS_MCP_HEDGE_AFTER_MS", 0, minimum=0) / 1000,
+    )
+
+
+def _is_replayable(request: httpx.Request) -> bool:
+    # Bodies built from bytes or files serve sync and async clients alike and can be sent
+    # again, multipart files being rewound on each send; bodies from iterators serve one
+    # kind of client only and are used up by the first send
+    stream = request.stream
+    return isinstance(stream, httpx.SyncByteStream) and isinstance(
+        stream, httpx.AsyncByteStream
+    )
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """httpx transport that retries and hedges requests according to a RetryPolicy."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy):
+        self.transport = transport
+        self.policy = policy
+
+    async def _send_hedged(self, request: httpx.Request) -> httpx.Response:
+        first = asyncio.create_task(self.transport.handle_async_request(request))
+        attempts = [first]
+        winner = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=self.policy.hedge_after)
+            if not done:
+                self.policy.hedged += 1
+                attempts.append(
+                    asyncio.create_task(self.transport.handle_async_request(request))
+                )
+            pending = set(attempts)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in attempts:
+                    if winner is None and task in done and task.exception() is None:
+                        winner = task
+        finally:
+            # Also runs when the caller is cancelled: stop the other attempts and close
+            # any response that is not returned, so its rate limiter slot is given back
+            losers = [task for task in attempts if task is not winner]
+            for task in losers:
+                task.cancel()
+            await asyncio.gather(*losers, return_exceptions=True)
+            for task in losers:
+                if not task.cancelled() and task.exception() is None:
+                    await task.result().aclose()
+        if winner is None:
+            # Every attempt failed; report the original request's error
+            return first.result()
+        if winner is not first:
+            self.policy.hedges_won += 1
+        return winner.result()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        if self.policy.hedge_after > 0 and request.method == "GET":
+            return await self._send_hedged(request)
+        return await self.transport.handle_async_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in IDEMPOTENT_METHODS
+        replayable = _is_replayable(request)
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(request)
+            except httpx.TransportError as e:
+                retryable = replayable and (
+                    idempotent
+                    or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                )
+                if not retryable or attempt >= self.policy.max_retries:
+                    if retryable:
+                        self.policy.exhausted += 1
+                    raise
+                delay = self.policy.backoff(attempt)
+            else:
+                status = response.status_code
+                retryable = (
+                    replayable
+                    and status in RETRYABLE_STATUS_CODES
+                    and (idempotent or status in NOT_PROCESSED_STATUS_CODES)
+                )
+                if not retryable:
+                    if attempt:
+                        self.policy.recovered += 1
+                    return response
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if (
+                    attempt >= self.policy.max_retries
+                    or (retry_after or 0) > MAX_RETRY_AFTER_SECONDS
+                ):
+                    self.policy.exhausted += 1
+                    return response
+                await response.aclose()
+                delay = self.policy.backoff(attempt, retry_after)
+
+            attempt += 1
+            self.policy.retries += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
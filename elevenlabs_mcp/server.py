@@ -11,23 +11,30 @@ Each tool that makes an API call is marked with a cost warning. Please follow th
 Tools without cost warnings in their description are free to use as they only read existing data.
 """
 
-import httpx
+import argparse
+import asyncio
 import os
+import sys
 import base64
+import json
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
-from typing import Literal, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal, Union
+import uvicorn
 from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context
 from mcp.types import (
     TextContent,
-    Resource,
     EmbeddedResource,
 )
-from elevenlabs.client import ElevenLabs
-from elevenlabs.types import MusicPrompt
-from elevenlabs_mcp.model import McpVoice, McpModel, McpLanguage
+from elevenlabs_mcp.model import McpVoice, McpModel, McpLanguage, BatchSpeechItem
 from elevenlabs_mcp.utils import (
+    ElevenLabsMcpError,
     make_error,
     make_output_path,
     make_output_file,
@@ -36,18 +43,51 @@ from elevenlabs_mcp.utils import (
     handle_large_text,
     parse_location,
     get_mime_type,
+    is_text_mime_type,
     handle_output_mode,
+    save_output,
+    OutputResult,
     handle_multiple_files_output_mode,
     get_output_mode_description,
+    create_saved_file_response,
+    stream_to_file,
+    write_output_file,
+    get_env_bool,
+    get_env_int,
+    get_env_float,
+    get_cache_dir,
 )
 
+from elevenlabs_mcp.cache import ResourceCache, TTSCache
+from elevenlabs_mcp.catalog import ModelCatalog, fallback_model
+from elevenlabs_mcp.chunking import split_text, get_character_limit
+from elevenlabs_mcp.client import LazyClient, create_http_client
+from elevenlabs_mcp.rate_limit import create_rate_limiter
+from elevenlabs_mcp.retry import create_retry_policy
+from elevenlabs_mcp.single_flight import SingleFlight
+from elevenlabs_mcp.export import ConversationPage, export_conversation_pages
+from elevenlabs_mcp.formatting import (
+    format_diarized_transcript,
+    format_srt,
+    format_transcript_json,
+    format_vtt,
+)
+from elevenlabs_mcp.resources import (
+    DeferredResources,
+    ElevenLabsFastMCP,
+    ResourceData,
+    encode_file_base64,
+)
+from elevenlabs_mcp.tool_schemas import ToolSchemaCache
+from elevenlabs_mcp.voices import VoiceIndex
+from elevenlabs_mcp.write_behind import WriteBehindQueue
 from elevenlabs_mcp.convai import create_conversation_config, create_platform_settings
-from elevenlabs.types.knowledge_base_locator import KnowledgeBaseLocator
-
-from elevenlabs.play import play
-from elevenlabs_mcp import __version__
 from pathlib import Path
 
+if TYPE_CHECKING:
+    # The SDK is imported on first use; importing it takes longer than the rest of startup
+    from elevenlabs.types import MusicPrompt, SpeechToTextChunkResponseModel
+
 load_dotenv()
 api_key = os.getenv("ELEVENLABS_API_KEY")
 # Set default base_path to project audio directory if running from this project
@@ -84,106 +124,359 @@ DEFAULT_VOICE_ID = os.getenv("ELEVENLABS_DEFAULT_VOICE_ID", "cgSgspJ2msm6clMCkdW
 
 if output_mode not in {"files", "resources", "both"}:
     raise ValueError("ELEVENLABS_MCP_OUTPUT_MODE must be one of: 'files', 'resources', 'both'")
+# Shared by the descriptions of every tool that writes output
+output_mode_description = get_output_mode_description(output_mode)
 if not api_key:
     raise ValueError("ELEVENLABS_API_KEY environment variable is required")
 
-origin = parse_location(os.getenv("ELEVENLABS_API_RESIDENCY"))
+# ELEVENLABS_API_BASE_URL points the client at another API host, such as a local stub for load tests
+origin = (os.getenv("ELEVENLABS_API_BASE_URL") or "").strip() or parse_location(
+    os.getenv("ELEVENLABS_API_RESIDENCY")
+)
 
-# Add custom client to ElevenLabs to set User-Agent header
-custom_client = httpx.Client(
-    headers={
-        "User-Agent": f"ElevenLabs-MCP/{__version__}",
-    },
+# Optional on-disk cache of synthesized speech, keyed on every input that affects the audio
+tts_cache = (
+    TTSCache(
+        get_cache_dir() / "tts",
+        get_env_int("ELEVENLABS_MCP_TTS_CACHE_MAX_MB", 500) * 1024 * 1024,
+    )
+    if get_env_bool("ELEVENLABS_MCP_TTS_CACHE", False)
+    else None
 )
 
-client = ElevenLabs(api_key=api_key, httpx_client=custom_client, base_url=origin)
-mcp = FastMCP("ElevenLabs")
+# Recently read resources, kept encoded; only files up to 1/16 of the budget are cached
+resource_cache_bytes = get_env_int("ELEVENLABS_MCP_RESOURCE_CACHE_MB", 32) * 1024 * 1024
+resource_cache = ResourceCache(resource_cache_bytes, resource_cache_bytes // 16)
 
+# In "both" mode, optionally return resources before their files have been written to disk
+write_queue = (
+    WriteBehindQueue(
+        write_output_file,
+        workers=get_env_int("ELEVENLABS_MCP_WRITE_BEHIND_WORKERS", 4),
+        max_pending=get_env_int("ELEVENLABS_MCP_WRITE_BEHIND_MAX_PENDING", 64),
+    )
+    if output_mode == "both" and get_env_bool("ELEVENLABS_MCP_WRITE_BEHIND", False)
+    else None
+)
+
+# Outputs larger than this are returned as an elevenlabs://outputs/ URI instead of inline base64
+inline_resource_max_kb = get_env_int(
+    "ELEVENLABS_MCP_INLINE_RESOURCE_MAX_KB", 0, minimum=0
+)
+deferred_resources = (
+    DeferredResources(
+        inline_resource_max_kb * 1024,
+        get_env_int("ELEVENLABS_MCP_DEFERRED_RESOURCE_MB", 256) * 1024 * 1024,
+    )
+    if inline_resource_max_kb > 0 and output_mode != "files"
+    else None
+)
+
+
+# Queues API requests client-side instead of letting bursts run into 429s
+rate_limiter = create_rate_limiter()
+# Retries transient failures and optionally hedges slow reads
+retry_policy = create_retry_policy()
+# Identical API calls made at the same time share one upstream request
+single_flight = SingleFlight() if get_env_bool("ELEVENLABS_MCP_COALESCE", True) else None
+
+
+async def _single_flight(kind: str, key, call):
+    """Run call, sharing it with identical concurrent calls unless coalescing is disabled."""
+    if single_flight is None:
+        return await call()
+    return await single_flight.do(kind, key, call)
+
+
+def _create_client():
+    from elevenlabs.client import AsyncElevenLabs
+
+    # Shared async client with pooled connections; also sets the User-Agent header
+    custom_client = create_http_client(rate_limiter, retry_policy)
+    return AsyncElevenLabs(api_key=api_key, httpx_client=custom_client, base_url=origin)
+
+
+client = LazyClient(_create_client)
+# Tool parameter schemas persisted between restarts, keyed on the package versions that shape them
+tool_schemas = (
+    ToolSchemaCache(get_cache_dir() / "tool_schemas.json")
+    if get_env_bool("ELEVENLABS_MCP_TOOL_SCHEMA_CACHE", True)
+    else None
+)
+mcp = ElevenLabsFastMCP("ElevenLabs", tool_schemas=tool_schemas)
 
-def format_diarized_transcript(transcription) -> str:
-    """Format transcript with speaker labels from diarized response."""
-    try:
-        # Try to access words array - the exact attribute might vary
-        words = None
-        if hasattr(transcription, "words"):
-            words = transcription.words
-        elif hasattr(transcription, "__dict__"):
-            # Try to find words in the response dict
-            for key, value in transcription.__dict__.items():
-                if key == "words" or (
-                    isinstance(value, list)
-                    and len(value) > 0
-                    and (
-                        hasattr(value[0], "speaker_id")
-                        if hasattr(value[0], "__dict__")
-                        else (
-                            "speaker_id" in value[0]
-                            if isinstance(value[0], dict)
-                            else False
-                        )
-                    )
-                ):
-                    words = value
-                    break
-
-        if not words:
-            return transcription.text
-
-        formatted_lines = []
-        current_speaker = None
-        current_text = []
-
-        for word in words:
-            # Get speaker_id - might be an attribute or dict key
-            word_speaker = None
-            if hasattr(word, "speaker_id"):
-                word_speaker = word.speaker_id
-            elif isinstance(word, dict) and "speaker_id" in word:
-                word_speaker = word["speaker_id"]
-
-            # Get text - might be an attribute or dict key
-            word_text = None
-            if hasattr(word, "text"):
-                word_text = word.text
-            elif isinstance(word, dict) and "text" in word:
-                word_text = word["text"]
-
-            if not word_speaker or not word_text:
-                continue
-
-            # Skip spacing/punctuation types if they exist
-            if hasattr(word, "type") and word.type == "spacing":
-                continue
-            elif isinstance(word, dict) and word.get("type") == "spacing":
-                continue
-
-            if current_speaker != word_speaker:
-                # Save previous speaker's text
-                if current_speaker and current_text:
-                    speaker_label = current_speaker.upper().replace("_", " ")
-                    formatted_lines.append(f"{speaker_label}: {' '.join(current_text)}")
-
-                # Start new speaker
-                current_speaker = word_speaker
-                current_text = [word_text.strip()]
-            else:
-                current_text.append(word_text.strip())
-
-        # Add final speaker's text
-        if current_speaker and current_text:
-            speaker_label = current_speaker.upper().replace("_", " ")
-            formatted_lines.append(f"{speaker_label}: {' '.join(current_text)}")
-
-        return "\n\n".join(formatted_lines)
 
+async def _load_voices() -> list:
+    """Fetch every voice in the account, following pagination."""
+    voices = []
+    next_page_token = None
+    while True:
+        response = await client.voices.search(
+            page_size=100, next_page_token=next_page_token
+        )
+        voices.extend(response.voices)
+        if not response.has_more or not response.next_page_token:
+            return voices
+        next_page_token = response.next_page_token
+
+
+# Local index of the account's voices so name/ID lookups skip the API round-trip
+voice_index = VoiceIndex(
+    _load_voices, ttl=get_env_float("ELEVENLABS_MCP_VOICE_INDEX_TTL", 300)
+)
+
+
+async def _load_models() -> list[dict]:
+    return [model.model_dump(mode="json") for model in await client.models.list()]
+
+
+# Model catalog persisted between restarts; drives automatic model selection per language
+model_catalog = ModelCatalog(
+    _load_models,
+    get_cache_dir() / "models.json",
+    ttl=get_env_float("ELEVENLABS_MCP_MODEL_CATALOG_TTL", 86400),
+)
+
+
+async def _resolve_voice(voice_id: str | None, voice_name: str | None):
+    """Look up the voice to synthesize with, or None to use the default voice."""
+    if voice_id is not None and voice_name is not None:
+        make_error("voice_id and voice_name cannot both be provided.")
+
+    if voice_id is not None:
+        voice = await voice_index.get(voice_id)
+        # Voices outside the account (e.g. from the shared library) are not indexed
+        return voice if voice is not None else await client.voices.get(voice_id=voice_id)
+    if voice_name is not None:
+        voice = await voice_index.resolve(voice_name)
+        if voice is None:
+            make_error(f"Voice with name: {voice_name} does not exist.")
+        return voice
+    return None
+
+
+def _voice_settings(item: BatchSpeechItem) -> dict:
+    return {
+        "stability": item.stability,
+        "similarity_boost": item.similarity_boost,
+        "style": item.style,
+        "use_speaker_boost": item.use_speaker_boost,
+        "speed": item.speed,
+    }
+
+
+async def _default_model_id(language: str, purpose: str = "tts") -> str:
+    """Preferred model for a language according to the model catalog."""
+    try:
+        model_id = await model_catalog.best_model(language, purpose)
     except Exception:
-        # Fallback to regular text if something goes wrong
-        return transcription.text
-@mcp.resource("elevenlabs://{filename}")
-def get_elevenlabs_resource(filename: str) -> Resource:
+        # Catalog unavailable; fall back to the models known to cover each language
+        model_id = None
+    return model_id or fallback_model(language, purpose)
+
+
+async def _synthesize_speech(
+    text: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: dict,
+    output_format: str,
+    previous_text: str | None = None,
+    next_text: str | None = None,
+    use_cache: bool = True,
+) -> bytes:
+    """Synthesize text in a single request, going through the TTS cache when it is enabled."""
+    cache_key = None
+    if use_cache and tts_cache is not None:
+        cache_key = TTSCache.make_key(
+            text,
+            voice_id,
+            model_id,
+            voice_settings,
+            output_format,
+            previous_text=previous_text,
+            next_text=next_text,
+        )
+        cached = tts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    async def convert() -> bytes:
+        audio_data = client.text_to_speech.convert(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            output_format=output_format,
+            voice_settings=voice_settings,
+            previous_text=previous_text,
+            next_text=next_text,
+        )
+        return b"".join([chunk async for chunk in audio_data])
+
+    audio_bytes = await _single_flight(
+        "text_to_speech",
+        cache_key
+        or TTSCache.make_key(
+            text,
+            voice_id,
+            model_id,
+            voice_settings,
+            output_format,
+            previous_text=previous_text,
+            next_text=next_text,
+        ),
+        convert,
+    )
+    if cache_key is not None:
+        tts_cache.put(cache_key, audio_bytes)
+    return audio_bytes
+
+
+async def _transcribe(file_path: Path, language_code: str | None, diarize: bool):
+    # The open file is streamed into the multipart upload instead of being read into memory
+    with file_path.open("rb") as f:
+        return await client.speech_to_text.convert(
+            model_id="scribe_v1",
+            file=f,
+            language_code=language_code,
+            enable_logging=True,
+            diarize=diarize,
+            tag_audio_events=True,
+        )
+
+
+async def _run_all(coroutines) -> list:
     """
-    Resource handler for ElevenLabs generated files.
+    Run coroutines concurrently and return their results in order, like asyncio.gather.
+
+    Unlike gather, the first failure cancels the others, so no more paid
+    requests are started for a call that has already failed; that failure is
+    raised as is rather than wrapped in an ExceptionGroup.
     """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coroutine) for coroutine in coroutines]
+    except BaseExceptionGroup as errors:
+        raise errors.exceptions[0]
+    return [task.result() for task in tasks]
+
+
+async def _transcribe_long_audio(
+    file_path: Path,
+    language_code: str | None,
+    diarize: bool,
+    segment_seconds: int,
+    max_concurrency: int,
+    ctx: Context | None,
+) -> "SpeechToTextChunkResponseModel":
+    """Transcribe a recording as pause-aligned segments in parallel and merge the results."""
+    from elevenlabs.types import SpeechToTextChunkResponseModel
+    from elevenlabs_mcp.transcription import (
+        SEGMENT_OVERLAP_SECONDS,
+        export_segment,
+        merge_transcriptions,
+        plan_segments,
+    )
+
+    if segment_seconds < 60:
+        make_error("segment_seconds must be at least 60.")
+    if max_concurrency < 1:
+        make_error("max_concurrency must be at least 1.")
+    try:
+        segments = await asyncio.to_thread(plan_segments, file_path, segment_seconds)
+    except RuntimeError as e:
+        make_error(
+            f"Could not decode {file_path.name} for long_audio; use wav, flac, ogg or mp3 ({e})."
+        )
+    if len(segments) == 1:
+        return await _transcribe(file_path, language_code, diarize)
+
+    report_progress = _progress_reporter(ctx)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
+
+    with tempfile.TemporaryDirectory(prefix="elevenlabs_mcp_stt_") as temp_dir:
+
+        async def transcribe_segment(index: int, start: float, end: float):
+            nonlocal completed
+            # Segments after the first start a little early so their speakers can be matched
+            offset = max(0.0, start - SEGMENT_OVERLAP_SECONDS) if index else 0.0
+            segment_path = Path(temp_dir) / f"segment_{index:04d}.flac"
+            async with semaphore:
+                export = asyncio.ensure_future(
+                    asyncio.to_thread(export_segment, file_path, offset, end, segment_path)
+                )
+                try:
+                    await asyncio.shield(export)
+                except asyncio.CancelledError:
+                    # The thread can't be stopped; let it finish before temp_dir is removed
+                    await asyncio.wait({export})
+                    raise
+                transcription = await _transcribe(segment_path, language_code, diarize)
+                segment_path.unlink()
+            completed += 1
+            if report_progress:
+                await report_progress(completed, len(segments))
+            return transcription, offset
+
+        # Inside the with block, so a failure stops the other segments before cleanup
+        results = await _run_all(
+            transcribe_segment(index, start, end)
+            for index, (start, end) in enumerate(segments)
+        )
+
+    transcriptions = [transcription for transcription, _ in results]
+    words = merge_transcriptions(
+        transcriptions, segments, [offset for _, offset in results]
+    )
+    if words:
+        text = "".join(word.text for word in words).strip()
+    else:
+        text = " ".join(transcription.text for transcription in transcriptions)
+    return SpeechToTextChunkResponseModel(
+        language_code=transcriptions[0].language_code,
+        language_probability=transcriptions[0].language_probability,
+        text=text,
+        words=words,
+    )
+
+
+async def _handle_audio_stream_output(
+    audio_data: AsyncIterator[bytes], output_path: Path, output_file_name: str
+) -> Union[TextContent, EmbeddedResource]:
+    """Write streamed audio straight to disk in files mode; the other modes need the bytes."""
+    if output_mode == "files":
+        full_file_path = output_path / output_file_name
+        await stream_to_file(audio_data, full_file_path)
+        return TextContent(type="text", text=f"Success. File saved as: {full_file_path}")
+
+    audio_bytes = b"".join([chunk async for chunk in audio_data])
+    return handle_output_mode(
+        audio_bytes,
+        output_path,
+        output_file_name,
+        output_mode,
+        write_queue=write_queue,
+        deferred=deferred_resources,
+    )
+
+
+def _progress_reporter(ctx: Context | None):
+    """Progress callback sending MCP progress notifications, or None outside of a request."""
+    if ctx is None:
+        return None
+    try:
+        ctx.request_context
+    except ValueError:
+        return None
+
+    async def report(progress: float, total: float | None = None) -> None:
+        await ctx.report_progress(progress, total)
+
+    return report
+
+
+def _resource_file_path(filename: str) -> Path:
     candidate = Path(filename)
     base_dir = make_output_path(None, base_path)
 
@@ -200,40 +493,133 @@ def get_elevenlabs_resource(filename: str) -> Resource:
             )
         file_path = resolved_file
 
-    if not file_path.exists():
+    if not file_path.is_file() and _pending_write(file_path) is None:
         raise FileNotFoundError(f"Resource file not found: {filename}")
+    return file_path
 
-    # Read the file and determine MIME type
-    try:
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-    except IOError as e:
-        raise FileNotFoundError(f"Failed to read resource file {filename}: {e}")
 
-    file_extension = file_path.suffix.lstrip(".")
-    mime_type = get_mime_type(file_extension)
+def _pending_write(file_path: Path) -> bytes | None:
+    """Contents of a file still waiting in the write-behind queue."""
+    return write_queue.pending_data(file_path) if write_queue is not None else None
+
 
-    # For text files, return text content
-    if mime_type.startswith("text/"):
+def _load_resource_data(
+    file_path: Path, offset: int = 0, length: int | None = None
+) -> ResourceData:
+    mime_type = get_mime_type(file_path.suffix.lstrip("."))
+
+    # For whole text files, return text content
+    if is_text_mime_type(mime_type) and offset == 0 and length is None:
         try:
-            text_content = file_data.decode("utf-8")
-            return Resource(
-                uri=f"elevenlabs://{filename}", mimeType=mime_type, text=text_content
-            )
+            return ResourceData(mime_type, text=file_path.read_text(encoding="utf-8"))
         except UnicodeDecodeError:
             make_error(
-                f"Failed to decode text resource {filename} as UTF-8; MIME type {mime_type} may be incorrect or file is corrupt"
+                f"Failed to decode text resource {file_path.name} as UTF-8; MIME type {mime_type} may be incorrect or file is corrupt"
             )
 
-    # For binary files, return base64 encoded data
-    base64_data = base64.b64encode(file_data).decode("utf-8")
-    return Resource(
-        uri=f"elevenlabs://{filename}", mimeType=mime_type, data=base64_data
+    # For binary files and byte ranges, return base64 encoded data
+    return ResourceData(mime_type, blob=encode_file_base64(file_path, offset, length))
+
+
+def _resource_data_from_bytes(
+    file_path: Path, file_data: bytes, offset: int = 0, length: int | None = None
+) -> ResourceData:
+    mime_type = get_mime_type(file_path.suffix.lstrip("."))
+    if is_text_mime_type(mime_type) and offset == 0 and length is None:
+        try:
+            return ResourceData(mime_type, text=file_data.decode("utf-8"))
+        except UnicodeDecodeError:
+            pass
+    end = None if length is None else offset + length
+    return ResourceData(
+        mime_type, blob=base64.b64encode(file_data[offset:end]).decode("ascii")
     )
 
 
+async def _read_resource(
+    filename: str, offset: int = 0, length: int | None = None
+) -> ResourceData:
+    return await _read_file_resource(_resource_file_path(filename), offset, length)
+
+
+async def _read_file_resource(
+    file_path: Path, offset: int = 0, length: int | None = None
+) -> ResourceData:
+    filename = file_path.name
+    pending = _pending_write(file_path)
+    if pending is not None:
+        return _resource_data_from_bytes(file_path, pending, offset, length)
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        raise FileNotFoundError(f"Failed to read resource file {filename}: {e}")
+
+    key = ResourceCache.make_key(file_path, stat, offset, length)
+    data = resource_cache.get(key)
+    if data is None:
+        try:
+            data = await asyncio.to_thread(_load_resource_data, file_path, offset, length)
+        except OSError as e:
+            raise FileNotFoundError(f"Failed to read resource file {filename}: {e}")
+        resource_cache.put(key, data, data.size)
+    return data
+
+
+@mcp.resource("elevenlabs://{filename}")
+async def get_elevenlabs_resource(filename: str) -> ResourceData:
+    """
+    Resource handler for ElevenLabs generated files.
+    """
+    return await _read_resource(filename)
+
+
+@mcp.resource("elevenlabs://{filename}/range/{offset}/{length}")
+async def get_elevenlabs_resource_range(
+    filename: str, offset: int, length: int
+) -> ResourceData:
+    """
+    Byte range of an ElevenLabs generated file, base64 encoded, for reading large audio in parts.
+    """
+    if offset < 0 or length < 1:
+        make_error("offset must be at least 0 and length at least 1.")
+    return await _read_resource(filename, offset, length)
+
+
+async def _read_deferred_resource(
+    name: str, offset: int = 0, length: int | None = None
+) -> ResourceData:
+    entry = deferred_resources.get(name) if deferred_resources is not None else None
+    if entry is None:
+        make_error(
+            f"Output {name} is no longer available; generate it again to get a new URI."
+        )
+    if isinstance(entry, bytes):
+        return _resource_data_from_bytes(Path(name), entry, offset, length)
+    return await _read_file_resource(entry, offset, length)
+
+
+@mcp.resource("elevenlabs://outputs/{name}")
+async def get_deferred_resource(name: str) -> ResourceData:
+    """
+    Generated output that was too large to return inline.
+    """
+    return await _read_deferred_resource(name)
+
+
+@mcp.resource("elevenlabs://outputs/{name}/range/{offset}/{length}")
+async def get_deferred_resource_range(
+    name: str, offset: int, length: int
+) -> ResourceData:
+    """
+    Byte range of a generated output that was too large to return inline, base64 encoded.
+    """
+    if offset < 0 or length < 1:
+        make_error("offset must be at least 0 and length at least 1.")
+    return await _read_deferred_resource(name, offset, length)
+
+
 @mcp.tool(
-    description=f"""Convert text to speech with a given voice. {get_output_mode_description(output_mode)}.
+    description=f"""Convert text to speech with a given voice. {output_mode_description}.
     
     Only one of voice_id or voice_name can be provided. If none are provided, the default voice will be used.
 
@@ -241,7 +627,7 @@ def get_elevenlabs_resource(filename: str) -> Resource:
 
      Args:
         text (str): The text to convert to speech.
-        voice_name (str, optional): The name of the voice to use.
+        voice_name (str, optional): The name of the voice to use. Matched case-insensitively, falling back to the closest similar name.
         model_id (str, optional): The model ID to use for speech synthesis. Options include:
             - eleven_multilingual_v2: High quality multilingual model (29 languages)
             - eleven_flash_v2_5: Fastest model with ultra-low latency (32 languages)
@@ -278,12 +664,14 @@ def get_elevenlabs_resource(filename: str) -> Resource:
             opus_48000_96
             opus_48000_128
             opus_48000_192
+        stream (bool, optional): Use the streaming endpoint and write audio to disk as it arrives instead of buffering the whole clip.
+            Lowers peak memory for long texts and reports progress to clients that request it. Ignored in resources output mode.
 
     Returns:
         Text content with file path or MCP resource with audio data, depending on output mode.
     """
 )
-def text_to_speech(
+async def text_to_speech(
     text: str,
     voice_name: str | None = None,
     output_directory: str | None = None,
@@ -296,60 +684,335 @@ def text_to_speech(
     language: str = "en",
     output_format: str = "mp3_44100_128",
     model_id: str | None = None,
+    stream: bool = False,
+    ctx: Context = None,
 ) -> Union[TextContent, EmbeddedResource]:
     if text == "":
         make_error("Text is required.")
 
-    if voice_id is not None and voice_name is not None:
-        make_error("voice_id and voice_name cannot both be provided.")
-
-    voice = None
-    if voice_id is not None:
-        voice = client.voices.get(voice_id=voice_id)
-    elif voice_name is not None:
-        voices = client.voices.search(search=voice_name)
-        if len(voices.voices) == 0:
-            make_error("No voices found with that name.")
-        voice = next((v for v in voices.voices if v.name == voice_name), None)
-        if voice is None:
-            make_error(f"Voice with name: {voice_name} does not exist.")
-
+    voice = await _resolve_voice(voice_id, voice_name)
     voice_id = voice.voice_id if voice else DEFAULT_VOICE_ID
 
     output_path = make_output_path(output_directory, base_path)
     output_file_name = make_output_file("tts", text, "mp3")
 
     if model_id is None:
-        model_id = (
-            "eleven_flash_v2_5"
-            if language in ["hu", "no", "vi"]
-            else "eleven_multilingual_v2"
+        model_id = await _default_model_id(language)
+
+    voice_settings = {
+        "stability": stability,
+        "similarity_boost": similarity_boost,
+        "style": style,
+        "use_speaker_boost": use_speaker_boost,
+        "speed": speed,
+    }
+
+    cache_key = None
+    audio_bytes = None
+    if tts_cache is not None:
+        cache_key = TTSCache.make_key(
+            text, voice_id, model_id, voice_settings, output_format
         )
+        audio_bytes = tts_cache.get(cache_key)
 
-    audio_data = client.text_to_speech.convert(
-        text=text,
-        voice_id=voice_id,
-        model_id=model_id,
-        output_format=output_format,
-        voice_settings={
-            "stability": stability,
-            "similarity_boost": similarity_boost,
-            "style": style,
-            "use_speaker_boost": use_speaker_boost,
-            "speed": speed,
-        },
-    )
-    audio_bytes = b"".join(audio_data)
+    success_message = f"Success. File saved as: {{file_path}}. Voice used: {voice.name if voice else DEFAULT_VOICE_ID}"
+
+    if audio_bytes is None and stream and output_mode != "resources":
+        full_file_path = output_path / output_file_name
+        audio_stream = client.text_to_speech.stream(
+            text=text,
+            voice_id=voice_id,
+            model_id=model_id,
+            output_format=output_format,
+            voice_settings=voice_settings,
+        )
+        _, time_to_first_byte = await stream_to_file(
+            audio_stream, full_file_path, on_progress=_progress_reporter(ctx)
+        )
+        if cache_key is not None:
+            tts_cache.put_file(cache_key, full_file_path)
+
+        if output_mode == "files":
+            ttfb = f"{time_to_first_byte:.3f}s" if time_to_first_byte is not None else "N/A"
+            message = success_message.replace("{file_path}", str(full_file_path))
+            return TextContent(type="text", text=f"{message}. Time to first byte: {ttfb}")
+        return create_saved_file_response(full_file_path, deferred_resources)
+
+    if audio_bytes is None:
+        audio_bytes = await _synthesize_speech(
+            text, voice_id, model_id, voice_settings, output_format, use_cache=False
+        )
+        if cache_key is not None:
+            tts_cache.put(cache_key, audio_bytes)
 
     # Handle different output modes
-    success_message = f"Success. File saved as: {{file_path}}. Voice used: {voice.name if voice else DEFAULT_VOICE_ID}"
     return handle_output_mode(
-        audio_bytes, output_path, output_file_name, output_mode, success_message
+        audio_bytes,
+        output_path,
+        output_file_name,
+        output_mode,
+        success_message,
+        write_queue=write_queue,
+        deferred=deferred_resources,
+    )
+
+
+@mcp.tool(
+    description=f"""Convert long text to speech by splitting it into chunks that are synthesized in parallel and joined in order into a single file. {output_mode_description}.
+
+    Use this instead of text_to_speech for texts longer than a few thousand characters. Text is split on paragraph and sentence boundaries, and each chunk is sent with its neighbouring text as context so prosody stays continuous across chunk boundaries.
+
+    ⚠️ COST WARNING: This tool makes API calls to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
+
+     Args:
+        text (str): The text to convert to speech.
+        voice_name (str, optional): The name of the voice to use. Only one of voice_id or voice_name can be provided.
+        voice_id (str, optional): The ID of the voice to use.
+        model_id (str, optional): The model ID to use for speech synthesis. Same options as text_to_speech.
+        stability, similarity_boost, style, use_speaker_boost, speed: Voice settings, same as text_to_speech.
+        language: ISO 639-1 language code for the voice.
+        output_format (str, optional): Output format of the generated audio, same as text_to_speech. Opus formats cannot be joined and are not supported.
+        max_chunk_chars (int, optional): Maximum characters per chunk, capped at the model's limit. Smaller chunks return sooner. Defaults to 2000.
+        max_concurrency (int, optional): Maximum number of chunks synthesized at the same time (1-10). Defaults to 4.
+        output_directory (str, optional): Directory where files should be saved (only used when saving files).
+            Defaults to $HOME/Desktop if not provided.
+
+    Returns:
+        Text content with file path or MCP resource with audio data, depending on output mode.
+    """
+)
+async def text_to_speech_long(
+    text: str,
+    voice_name: str | None = None,
+    output_directory: str | None = None,
+    voice_id: str | None = None,
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+    style: float = 0,
+    use_speaker_boost: bool = True,
+    speed: float = 1.0,
+    language: str = "en",
+    output_format: str = "mp3_44100_128",
+    model_id: str | None = None,
+    max_chunk_chars: int = 2000,
+    max_concurrency: int = 4,
+    ctx: Context = None,
+) -> Union[TextContent, EmbeddedResource]:
+    if text.strip() == "":
+        make_error("Text is required.")
+    if output_format.startswith("opus"):
+        make_error("Opus output cannot be joined from chunks; use an mp3, pcm, ulaw or alaw format.")
+    if max_concurrency < 1 or max_concurrency > 10:
+        make_error("max_concurrency must be between 1 and 10")
+    if max_chunk_chars < 1:
+        make_error("max_chunk_chars must be at least 1")
+
+    voice = await _resolve_voice(voice_id, voice_name)
+    voice_id = voice.voice_id if voice else DEFAULT_VOICE_ID
+    if model_id is None:
+        model_id = await _default_model_id(language)
+
+    output_path = make_output_path(output_directory, base_path)
+    output_file_name = make_output_file("tts", text, "mp3")
+
+    voice_settings = {
+        "stability": stability,
+        "similarity_boost": similarity_boost,
+        "style": style,
+        "use_speaker_boost": use_speaker_boost,
+        "speed": speed,
+    }
+    character_limit = model_catalog.character_limit(model_id) or get_character_limit(
+        model_id
+    )
+    chunks = split_text(text, min(max_chunk_chars, character_limit))
+    report_progress = _progress_reporter(ctx)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
+    failed = False
+
+    async def synthesize_chunk(index: int) -> bytes:
+        nonlocal completed, failed
+        async with semaphore:
+            # A failed chunk frees its slot before the other chunks are cancelled
+            if failed:
+                raise asyncio.CancelledError
+            try:
+                audio_bytes = await _synthesize_speech(
+                    chunks[index],
+                    voice_id,
+                    model_id,
+                    voice_settings,
+                    output_format,
+                    previous_text=chunks[index - 1] if index > 0 else None,
+                    next_text=chunks[index + 1] if index + 1 < len(chunks) else None,
+                )
+            except Exception:
+                failed = True
+                raise
+        completed += 1
+        if report_progress:
+            await report_progress(completed, len(chunks))
+        return audio_bytes
+
+    audio_parts = await _run_all(synthesize_chunk(index) for index in range(len(chunks)))
+
+    success_message = f"Success. File saved as: {{file_path}}. Voice used: {voice.name if voice else DEFAULT_VOICE_ID}. Synthesized in {len(chunks)} chunks"
+    return handle_output_mode(
+        b"".join(audio_parts),
+        output_path,
+        output_file_name,
+        output_mode,
+        success_message,
+        write_queue=write_queue,
+        deferred=deferred_resources,
     )
 
 
 @mcp.tool(
-    description=f"""Transcribe speech from an audio file. When save_transcript_to_file=True: {get_output_mode_description(output_mode)}. When return_transcript_to_client_directly=True, always returns text directly regardless of output mode.
+    description=f"""Convert a list of utterances to speech in a single call. {output_mode_description}.
+
+    Identical items are synthesized once, voices are looked up once per distinct voice, and items run concurrently. Returns a manifest with the status, file and timing of every item; a failing item does not stop the others.
+
+    ⚠️ COST WARNING: This tool makes API calls to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
+
+    Args:
+        items: Utterances to synthesize. Each item has `text` and optionally `voice_id` or `voice_name`, `model_id`, `language`,
+            and the voice settings `stability`, `similarity_boost`, `style`, `use_speaker_boost` and `speed` (same meaning and defaults as text_to_speech).
+        output_format (str, optional): Output format of the generated audio for all items, same as text_to_speech. Defaults to "mp3_44100_128".
+        max_concurrency (int, optional): Maximum number of items synthesized at the same time (1-10). Defaults to 4.
+        output_directory (str, optional): Directory where files should be saved (only used when saving files).
+            Defaults to $HOME/Desktop if not provided.
+        save_manifest (bool, optional): Also output the manifest as a JSON file, handled like the audio files. Defaults to False.
+
+    Returns:
+        Manifest and file paths, or manifest and MCP resources with audio data, depending on output mode.
+    """
+)
+async def batch_text_to_speech(
+    items: list[BatchSpeechItem],
+    output_directory: str | None = None,
+    output_format: str = "mp3_44100_128",
+    max_concurrency: int = 4,
+    save_manifest: bool = False,
+    ctx: Context = None,
+) -> Union[TextContent, list[Union[TextContent, EmbeddedResource]]]:
+    if not items:
+        make_error("At least one item is required.")
+    if max_concurrency < 1 or max_concurrency > 10:
+        make_error("max_concurrency must be between 1 and 10")
+
+    output_path = make_output_path(output_directory, base_path)
+    batch_id = uuid.uuid4().hex[:8]
+    report_progress = _progress_reporter(ctx)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Resolve every distinct voice once
+    voice_refs = list(dict.fromkeys((item.voice_id, item.voice_name) for item in items))
+    resolved = await asyncio.gather(
+        *(_resolve_voice(voice_id, voice_name) for voice_id, voice_name in voice_refs),
+        return_exceptions=True,
+    )
+    voices = dict(zip(voice_refs, resolved))
+
+    model_ids = [
+        item.model_id or await _default_model_id(item.language) for item in items
+    ]
+
+    manifest = [{"index": index, "text": item.text[:40]} for index, item in enumerate(items)]
+    unique_requests: dict[str, list[int]] = {}
+    for index, item in enumerate(items):
+        voice = voices[(item.voice_id, item.voice_name)]
+        if item.text.strip() == "":
+            manifest[index].update(status="error", error="Text is required.")
+            continue
+        if isinstance(voice, Exception):
+            manifest[index].update(status="error", error=str(voice))
+            continue
+        request_key = TTSCache.make_key(
+            item.text,
+            voice.voice_id if voice else DEFAULT_VOICE_ID,
+            model_ids[index],
+            _voice_settings(item),
+            output_format,
+        )
+        unique_requests.setdefault(request_key, []).append(index)
+
+    completed = 0
+
+    async def synthesize_item(indices: list[int]):
+        nonlocal completed
+        index = indices[0]
+        item = items[index]
+        voice = voices[(item.voice_id, item.voice_name)]
+        output_file_name = make_output_file(
+            "tts", f"{batch_id}_{index:03d}", "mp3", full_id=True
+        )
+        start = time.perf_counter()
+        try:
+            async with semaphore:
+                audio_bytes = await _synthesize_speech(
+                    item.text,
+                    voice.voice_id if voice else DEFAULT_VOICE_ID,
+                    model_ids[index],
+                    _voice_settings(item),
+                    output_format,
+                )
+            result = save_output(
+                audio_bytes,
+                output_path,
+                output_file_name,
+                output_mode,
+                write_queue=write_queue,
+                deferred=deferred_resources,
+            )
+        except Exception as e:
+            for i in indices:
+                manifest[i].update(status="error", error=str(e))
+            return None
+        finally:
+            completed += len(indices)
+            if report_progress:
+                await report_progress(completed, len(items))
+
+        elapsed = round(time.perf_counter() - start, 3)
+        entry = result.manifest_entry()
+        manifest[index].update(status="ok", **entry, seconds=elapsed)
+        for duplicate in indices[1:]:
+            manifest[duplicate].update(
+                status="ok", **entry, seconds=0, duplicate_of=index
+            )
+        return result
+
+    results = await asyncio.gather(
+        *(synthesize_item(indices) for indices in unique_requests.values())
+    )
+    results = [result for result in results if result is not None]
+
+    succeeded = sum(1 for entry in manifest if entry["status"] == "ok")
+    summary = f"{succeeded}/{len(items)} items succeeded, {len(results)} files generated. Manifest: {json.dumps(manifest, ensure_ascii=False)}"
+    if not results:
+        return TextContent(type="text", text=f"No files generated. {summary}")
+
+    manifest_result = None
+    if save_manifest:
+        manifest_result = save_output(
+            json.dumps({"batch_id": batch_id, "items": manifest}, indent=2).encode("utf-8"),
+            output_path,
+            make_output_file("tts", f"{batch_id}_manifest", "json", full_id=True),
+            output_mode,
+            write_queue=write_queue,
+        )
+    output = handle_multiple_files_output_mode(
+        results, output_mode, summary, manifest_result
+    )
+    if isinstance(output, list):
+        return [TextContent(type="text", text=summary), *output]
+    return output
+
+
+@mcp.tool(
+    description=f"""Transcribe speech from an audio file. When save_transcript_to_file=True: {output_mode_description}. When return_transcript_to_client_directly=True, always returns text directly regardless of output mode.
 
     ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
 
@@ -361,42 +1024,53 @@ def text_to_speech(
         return_transcript_to_client_directly: Whether to return the transcript to the client directly.
         output_directory: Directory where files should be saved (only used when saving files).
             Defaults to $HOME/Desktop if not provided.
+        long_audio: Split the recording at pauses into segments that are transcribed in parallel, then merged with corrected timestamps and speaker labels. Use for recordings longer than about 20 minutes. Requires a format that can be decoded locally (wav, flac, ogg, mp3).
+        segment_seconds: Maximum length of each segment in seconds when long_audio is True.
+        max_concurrency: Maximum number of segments transcribed at once when long_audio is True.
+        transcript_format: Rendering of the transcript: `text` (speaker-labelled paragraphs when diarized), `srt` or `vtt` subtitles, or `json` with timed speaker segments.
 
     Returns:
         TextContent containing the transcription or MCP resource with transcript data.
     """
 )
-def speech_to_text(
+async def speech_to_text(
     input_file_path: str,
     language_code: str | None = None,
     diarize: bool = False,
     save_transcript_to_file: bool = True,
     return_transcript_to_client_directly: bool = False,
     output_directory: str | None = None,
+    long_audio: bool = False,
+    segment_seconds: int = 600,
+    max_concurrency: int = 4,
+    transcript_format: Literal["text", "srt", "vtt", "json"] = "text",
+    ctx: Context = None,
 ) -> Union[TextContent, EmbeddedResource]:
     if not save_transcript_to_file and not return_transcript_to_client_directly:
         make_error("Must save transcript to file or return it to the client directly.")
     file_path = handle_input_file(input_file_path)
     if save_transcript_to_file:
         output_path = make_output_path(output_directory, base_path)
-        output_file_name = make_output_file("stt", file_path.name, "txt")
-    with file_path.open("rb") as f:
-        audio_bytes = f.read()
-
+        extension = "txt" if transcript_format == "text" else transcript_format
+        output_file_name = make_output_file("stt", file_path.name, extension)
     if language_code == "" or language_code is None:
         language_code = None
 
-    transcription = client.speech_to_text.convert(
-        model_id="scribe_v1",
-        file=audio_bytes,
-        language_code=language_code,
-        enable_logging=True,
-        diarize=diarize,
-        tag_audio_events=True,
-    )
+    if long_audio:
+        transcription = await _transcribe_long_audio(
+            file_path, language_code, diarize, segment_seconds, max_concurrency, ctx
+        )
+    else:
+        transcription = await _transcribe(file_path, language_code, diarize)
 
     # Format transcript with speaker identification if diarization was enabled
-    if diarize:
+    if transcript_format == "srt":
+        formatted_transcript = format_srt(transcription)
+    elif transcript_format == "vtt":
+        formatted_transcript = format_vtt(transcription)
+    elif transcript_format == "json":
+        formatted_transcript = format_transcript_json(transcription)
+    elif diarize:
         formatted_transcript = format_diarized_transcript(transcription)
     else:
         formatted_transcript = transcription.text
@@ -408,13 +1082,15 @@ def speech_to_text(
         transcript_bytes = formatted_transcript.encode("utf-8")
 
         # Handle different output modes
-        success_message = f"Transcription saved to {file_path}"
+        success_message = "Transcription saved to {file_path}"
         return handle_output_mode(
             transcript_bytes,
             output_path,
             output_file_name,
             output_mode,
             success_message,
+            write_queue=write_queue,
+            deferred=deferred_resources,
         )
 
     # This should not be reached due to validation at the start of the function
@@ -422,7 +1098,7 @@ def speech_to_text(
 
 
 @mcp.tool(
-    description=f"""Convert text description of a sound effect to sound effect with a given duration. {get_output_mode_description(output_mode)}.
+    description=f"""Convert text description of a sound effect to sound effect with a given duration. {output_mode_description}.
     
     Duration must be between 0.5 and 5 seconds.
 
@@ -456,7 +1132,7 @@ def speech_to_text(
             opus_48000_192
     """
 )
-def text_to_sound_effects(
+async def text_to_sound_effects(
     text: str,
     duration_seconds: float = 2.0,
     output_directory: str | None = None,
@@ -474,10 +1150,17 @@ def text_to_sound_effects(
         duration_seconds=duration_seconds,
         loop=loop,
     )
-    audio_bytes = b"".join(audio_data)
+    audio_bytes = b"".join([chunk async for chunk in audio_data])
 
     # Handle different output modes
-    return handle_output_mode(audio_bytes, output_path, output_file_name, output_mode)
+    return handle_output_mode(
+        audio_bytes,
+        output_path,
+        output_file_name,
+        output_mode,
+        write_queue=write_queue,
+        deferred=deferred_resources,
+    )
 
 
 @mcp.tool(
@@ -489,50 +1172,66 @@ def text_to_sound_effects(
         search: Search term to filter voices by. Searches in name, description, labels and category.
         sort: Which field to sort by. `created_at_unix` might not be available for older voices.
         sort_direction: Sort order, either ascending or descending.
+        refresh: Reload the voice list from ElevenLabs instead of using the local index, e.g. after adding voices elsewhere.
 
     Returns:
         List of voices that match the search criteria.
     """
 )
-def search_voices(
+async def search_voices(
     search: str | None = None,
     sort: Literal["created_at_unix", "name"] = "name",
     sort_direction: Literal["asc", "desc"] = "desc",
+    refresh: bool = False,
 ) -> list[McpVoice]:
-    response = client.voices.search(
+    if refresh:
+        voice_index.invalidate()
+    voices = await voice_index.search(
         search=search, sort=sort, sort_direction=sort_direction
     )
     return [
         McpVoice(id=voice.voice_id, name=voice.name, category=voice.category)
-        for voice in response.voices
+        for voice in voices
     ]
 
 
-@mcp.tool(description="List all available models")
-def list_models() -> list[McpModel]:
-    response = client.models.list()
+@mcp.tool(
+    description="""List all available models.
+
+    Args:
+        refresh: Reload the model list from ElevenLabs instead of using the cached catalog.
+    """
+)
+async def list_models(refresh: bool = False) -> list[McpModel]:
+    if refresh:
+        model_catalog.invalidate()
+    models = await model_catalog.models()
     return [
         McpModel(
-            id=model.model_id,
-            name=model.name,
+            id=model["model_id"],
+            name=model["name"],
             languages=[
-                McpLanguage(language_id=lang.language_id, name=lang.name)
-                for lang in model.languages
+                McpLanguage(language_id=lang["language_id"], name=lang["name"])
+                for lang in model.get("languages") or []
             ],
         )
-        for model in response
+        for model in models
     ]
 
 
 @mcp.tool(description="Get details of a specific voice")
-def get_voice(voice_id: str) -> McpVoice:
+async def get_voice(voice_id: str) -> McpVoice:
     """Get details of a specific voice."""
-    response = client.voices.get(voice_id=voice_id)
+    response = await voice_index.get(voice_id)
+    if response is None:
+        response = await _single_flight(
+            "get_voice", voice_id, lambda: client.voices.get(voice_id=voice_id)
+        )
     return McpVoice(
         id=response.voice_id,
         name=response.name,
         category=response.category,
-        fine_tuning_status=response.fine_tuning.state,
+        fine_tuning_status=response.fine_tuning.state if response.fine_tuning else None,
     )
 
 
@@ -542,13 +1241,14 @@ def get_voice(voice_id: str) -> McpVoice:
     ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
     """
 )
-def voice_clone(
+async def voice_clone(
     name: str, files: list[str], description: str | None = None
 ) -> TextContent:
     input_files = [str(handle_input_file(file).absolute()) for file in files]
-    voice = client.voices.ivc.create(
+    voice = await client.voices.ivc.create(
         name=name, description=description, files=input_files
     )
+    voice_index.invalidate()
 
     return TextContent(
         type="text",
@@ -560,36 +1260,94 @@ def voice_clone(
 
 
 @mcp.tool(
-    description=f"""Isolate audio from a file. {get_output_mode_description(output_mode)}.
+    description=f"""Isolate audio from a file. {output_mode_description}.
 
     ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
     """
 )
-def isolate_audio(
+async def isolate_audio(
     input_file_path: str, output_directory: str | None = None
 ) -> Union[TextContent, EmbeddedResource]:
     file_path = handle_input_file(input_file_path)
     output_path = make_output_path(output_directory, base_path)
     output_file_name = make_output_file("iso", file_path.name, "mp3")
     with file_path.open("rb") as f:
-        audio_bytes = f.read()
-    audio_data = client.audio_isolation.convert(
-        audio=audio_bytes,
-    )
-    audio_bytes = b"".join(audio_data)
-
-    # Handle different output modes
-    return handle_output_mode(audio_bytes, output_path, output_file_name, output_mode)
+        audio_data = client.audio_isolation.convert(
+            audio=f,
+        )
+        return await _handle_audio_stream_output(
+            audio_data, output_path, output_file_name
+        )
 
 
 @mcp.tool(
-    description="Check the current subscription status. Could be used to measure the usage of the API."
+    description="Check the current subscription status. Could be used to measure the usage of the API. Also caps concurrent generation requests at the limit of the reported tier, unless configured otherwise."
 )
-def check_subscription() -> TextContent:
-    subscription = client.user.subscription.get()
+async def check_subscription() -> TextContent:
+    subscription = await client.user.subscription.get()
+    rate_limiter.apply_tier(subscription.tier)
     return TextContent(type="text", text=f"{subscription.model_dump_json(indent=2)}")
 
 
+@mcp.tool(
+    description="Get hit/miss statistics for the server's local caches, queueing statistics of the API rate limiter, retry counts, and how many identical concurrent calls shared one request. Does not call the ElevenLabs API."
+)
+async def get_cache_stats() -> TextContent:
+    stats = {
+        "tts": tts_cache.stats() if tts_cache is not None else "disabled",
+        "voices": voice_index.stats(),
+        "models": model_catalog.stats(),
+        "resources": resource_cache.stats(),
+        "deferred_outputs": (
+            deferred_resources.stats() if deferred_resources is not None else "disabled"
+        ),
+        "tool_schemas": (
+            tool_schemas.stats() if tool_schemas is not None else "disabled"
+        ),
+        "rate_limits": rate_limiter.stats(),
+        "retries": retry_policy.stats(),
+        "coalesced_calls": (
+            single_flight.stats() if single_flight is not None else "disabled"
+        ),
+    }
+    return TextContent(type="text", text=json.dumps(stats, indent=2))
+
+
+@mcp.tool(
+    description="""Check whether files returned as resources in write-behind mode have been written to disk. Does not call the ElevenLabs API.
+
+    With ELEVENLABS_MCP_WRITE_BEHIND enabled in "both" output mode, tools return their resource before the file is saved. A file is durable once its status is "written".
+
+    Args:
+        file_path: Generated file to check, absolute or relative to the base path. If omitted, returns queue statistics instead.
+        wait: Wait for every queued write to finish before answering.
+        timeout_seconds: How long to wait when wait is true.
+    """
+)
+async def get_write_status(
+    file_path: str | None = None, wait: bool = False, timeout_seconds: float = 30
+) -> TextContent:
+    if write_queue is None:
+        return TextContent(
+            type="text",
+            text="Write-behind is disabled; files are saved before tools return.",
+        )
+
+    flushed = True
+    if wait:
+        flushed = await asyncio.to_thread(write_queue.flush, timeout_seconds)
+
+    if file_path is None:
+        status = write_queue.stats()
+        status["flushed"] = flushed
+    else:
+        path = Path(os.path.expanduser(file_path))
+        if not path.is_absolute():
+            path = make_output_path(None, base_path) / path
+        status = {"file_path": str(path), "status": write_queue.status(path)}
+    return TextContent(type="text", text=json.dumps(status, indent=2))
+
+
 @mcp.tool(
     description="""Create a conversational AI agent with custom configuration.
 
@@ -605,7 +1363,7 @@ def check_subscription() -> TextContent:
         temperature: Temperature for the agent. The lower the temperature, the more deterministic the agent's responses will be. Range is 0 to 1.
         max_tokens: Maximum number of tokens to generate.
         asr_quality: Quality of the ASR. `high` or `low`.
-        model_id: ID of the ElevenLabs model to use for the agent.
+        model_id: ID of the ElevenLabs model to use for the agent. Defaults to the preferred model that supports the agent's language.
         optimize_streaming_latency: Optimize streaming latency. Range is 0 to 4.
         stability: Stability for the agent. Range is 0 to 1.
         similarity_boost: Similarity boost for the agent. Range is 0 to 1.
@@ -615,7 +1373,7 @@ def check_subscription() -> TextContent:
         retention_days: Number of days to retain the agent's data.
     """
 )
-def create_agent(
+async def create_agent(
     name: str,
     first_message: str,
     system_prompt: str,
@@ -625,7 +1383,7 @@ def create_agent(
     temperature: float = 0.5,
     max_tokens: int | None = None,
     asr_quality: str = "high",
-    model_id: str = "eleven_turbo_v2",
+    model_id: str | None = None,
     optimize_streaming_latency: int = 3,
     stability: float = 0.5,
     similarity_boost: float = 0.8,
@@ -634,6 +1392,9 @@ def create_agent(
     record_voice: bool = True,
     retention_days: int = 730,
 ) -> TextContent:
+    if model_id is None:
+        model_id = await _default_model_id(language, "agent")
+
     conversation_config = create_conversation_config(
         language=language,
         system_prompt=system_prompt,
@@ -656,7 +1417,7 @@ def create_agent(
         retention_days=retention_days,
     )
 
-    response = client.conversational_ai.agents.create(
+    response = await client.conversational_ai.agents.create(
         name=name,
         conversation_config=conversation_config,
         platform_settings=platform_settings,
@@ -681,7 +1442,7 @@ def create_agent(
         text: Text to add to the knowledge base.
     """
 )
-def add_knowledge_base_to_agent(
+async def add_knowledge_base_to_agent(
     agent_id: str,
     knowledge_base_name: str,
     url: str | None = None,
@@ -697,7 +1458,7 @@ def add_knowledge_base_to_agent(
         make_error("Must provide exactly one of: URL, file, or text")
 
     if url is not None:
-        response = client.conversational_ai.knowledge_base.documents.create_from_url(
+        response = await client.conversational_ai.knowledge_base.documents.create_from_url(
             name=knowledge_base_name,
             url=url,
         )
@@ -714,12 +1475,14 @@ def add_knowledge_base_to_agent(
             )
             file = open(path, "rb")
 
-        response = client.conversational_ai.knowledge_base.documents.create_from_file(
+        response = await client.conversational_ai.knowledge_base.documents.create_from_file(
             name=knowledge_base_name,
             file=file,
         )
 
-    agent = client.conversational_ai.agents.get(agent_id=agent_id)
+    from elevenlabs.types.knowledge_base_locator import KnowledgeBaseLocator
+
+    agent = await client.conversational_ai.agents.get(agent_id=agent_id)
 
     agent_config = agent.conversation_config.agent
     knowledge_base_list = (
@@ -738,7 +1501,7 @@ def add_knowledge_base_to_agent(
     if agent_config:
         agent_config["prompt"]["knowledge_base"] = knowledge_base_list
 
-    client.conversational_ai.agents.update(
+    await client.conversational_ai.agents.update(
         agent_id=agent_id, conversation_config=agent.conversation_config
     )
     return TextContent(
@@ -748,13 +1511,13 @@ def add_knowledge_base_to_agent(
 
 
 @mcp.tool(description="List all available conversational AI agents")
-def list_agents() -> TextContent:
+async def list_agents() -> TextContent:
     """List all available conversational AI agents.
 
     Returns:
         TextContent with a formatted list of available agents
     """
-    response = client.conversational_ai.agents.list()
+    response = await client.conversational_ai.agents.list()
 
     if not response.agents:
         return TextContent(type="text", text="No agents found.")
@@ -767,7 +1530,7 @@ def list_agents() -> TextContent:
 
 
 @mcp.tool(description="Get details about a specific conversational AI agent")
-def get_agent(agent_id: str) -> TextContent:
+async def get_agent(agent_id: str) -> TextContent:
     """Get details about a specific conversational AI agent.
 
     Args:
@@ -776,7 +1539,11 @@ def get_agent(agent_id: str) -> TextContent:
     Returns:
         TextContent with detailed information about the agent
     """
-    response = client.conversational_ai.agents.get(agent_id=agent_id)
+    response = await _single_flight(
+        "get_agent",
+        agent_id,
+        lambda: client.conversational_ai.agents.get(agent_id=agent_id),
+    )
 
     voice_info = "None"
     if response.conversation_config.tts:
@@ -795,12 +1562,12 @@ def get_agent(agent_id: str) -> TextContent:
         conversation_id: The unique identifier of the conversation to retrieve, you can get the ids from the list_conversations tool.
     """
 )
-def get_conversation(
+async def get_conversation(
     conversation_id: str,
 ) -> TextContent:
     """Get conversation details with transcript"""
     try:
-        response = client.conversational_ai.conversations.get(conversation_id)
+        response = await client.conversational_ai.conversations.get(conversation_id)
 
         # Parse transcript using utility function
         transcript, _ = parse_conversation_transcript(response.transcript)
@@ -854,7 +1621,7 @@ Transcript:
         max_length (int, optional): Maximum character length of the response text (defaults to 10000)
     """
 )
-def list_conversations(
+async def list_conversations(
     agent_id: str | None = None,
     cursor: str | None = None,
     call_start_before_unix: int | None = None,
@@ -866,7 +1633,7 @@ def list_conversations(
     page_size = min(page_size, 100)
 
     try:
-        response = client.conversational_ai.conversations.list(
+        response = await client.conversational_ai.conversations.list(
             cursor=cursor,
             agent_id=agent_id,
             call_start_before_unix=call_start_before_unix,
@@ -917,93 +1684,261 @@ Call Successful: {conv.call_successful}"""
 
 
 @mcp.tool(
-    description=f"""Transform audio from one voice to another using provided audio files. {get_output_mode_description(output_mode)}.
+    description="""Exports every agent conversation with its full transcript, metadata and analysis to a JSONL file, one conversation per line. Use when: asked to audit, archive or analyze many conversations at once, instead of calling get_conversation for each one.
 
-    ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
+    Walks all pages of the conversation list and fetches conversations concurrently, writing each line as soon as it arrives. Progress is recorded in a state file next to the export, so an interrupted export continues where it stopped when called again with the same file name and filters; conversations already in the file are not fetched again. Always returns the file path, whatever the output mode.
+
+    Args:
+        agent_id (str, optional): Only export conversations of this agent
+        call_start_before_unix (int, optional): Only export conversations that started before this Unix timestamp
+        call_start_after_unix (int, optional): Only export conversations that started after this Unix timestamp
+        output_directory (str, optional): Directory to write the export to. Defaults to $HOME/Desktop if not provided.
+        file_name (str, optional): Name of the export file. Defaults to conversations_<agent_id or all>.jsonl
+        max_concurrency (int, optional): Conversations fetched at the same time (1-20, defaults to 8)
+        page_size (int, optional): Conversations listed per page (1-100, defaults to 100)
+        resume (bool, optional): Continue an earlier export to the same file; False starts the file over. Defaults to True.
     """
 )
-def speech_to_speech(
-    input_file_path: str,
-    voice_name: str = "Adam",
+async def export_conversations(
+    agent_id: str | None = None,
+    call_start_before_unix: int | None = None,
+    call_start_after_unix: int | None = None,
     output_directory: str | None = None,
-) -> Union[TextContent, EmbeddedResource]:
-    voices = client.voices.search(search=voice_name)
+    file_name: str | None = None,
+    max_concurrency: int = 8,
+    page_size: int = 100,
+    resume: bool = True,
+    ctx: Context = None,
+) -> TextContent:
+    if max_concurrency < 1 or max_concurrency > 20:
+        make_error("max_concurrency must be between 1 and 20")
+    page_size = max(1, min(page_size, 100))
+    output_path = make_output_path(output_directory, base_path)
+    file_name = file_name or f"conversations_{agent_id or 'all'}.jsonl"
+    output_file = output_path / Path(file_name).name
+    filters = {
+        "agent_id": agent_id,
+        "call_start_before_unix": call_start_before_unix,
+        "call_start_after_unix": call_start_after_unix,
+    }
+    report_progress = _progress_reporter(ctx)
+
+    async def list_page(cursor: str | None) -> ConversationPage:
+        response = await client.conversational_ai.conversations.list(
+            cursor=cursor, page_size=page_size, **filters
+        )
+        return ConversationPage(
+            [conv.conversation_id for conv in response.conversations],
+            next_cursor=response.next_cursor,
+            has_more=response.has_more,
+        )
 
-    if len(voices.voices) == 0:
-        make_error("No voice found with that name.")
+    async def fetch_conversation(conversation_id: str) -> dict:
+        response = await client.conversational_ai.conversations.get(conversation_id)
+        return response.model_dump(mode="json")
 
-    voice = next((v for v in voices.voices if v.name == voice_name), None)
+    try:
+        result = await export_conversation_pages(
+            list_page,
+            fetch_conversation,
+            output_file,
+            filters=filters,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            progress=report_progress,
+        )
+    except ValueError as e:
+        make_error(str(e))
+    except Exception as e:
+        make_error(
+            f"Failed to export conversations: {str(e)}. Conversations fetched so far are in {output_file}; call again with resume to continue."
+        )
+
+    return TextContent(type="text", text=result.summary())
 
-    if voice is None:
-        make_error(f"Voice with name: {voice_name} does not exist.")
 
+@mcp.tool(
+    description=f"""Transform audio from one voice to another using provided audio files. {output_mode_description}.
+
+    ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
+    """
+)
+async def speech_to_speech(
+    input_file_path: str,
+    voice_name: str = "Adam",
+    output_directory: str | None = None,
+) -> Union[TextContent, EmbeddedResource]:
+    voice = await _resolve_voice(None, voice_name)
     assert voice is not None  # Type assertion for type checker
     file_path = handle_input_file(input_file_path)
     output_path = make_output_path(output_directory, base_path)
     output_file_name = make_output_file("sts", file_path.name, "mp3")
 
     with file_path.open("rb") as f:
-        audio_bytes = f.read()
+        audio_data = client.speech_to_speech.convert(
+            model_id="eleven_multilingual_sts_v2",
+            voice_id=voice.voice_id,
+            audio=f,
+        )
+        return await _handle_audio_stream_output(
+            audio_data, output_path, output_file_name
+        )
 
-    audio_data = client.speech_to_speech.convert(
-        model_id="eleven_multilingual_sts_v2",
-        voice_id=voice.voice_id,
-        audio=audio_bytes,
+
+def _save_voice_preview(preview, output_path: Path) -> tuple[OutputResult, float]:
+    """Decode and save one voice preview; returns the result and the seconds it took."""
+    start = time.perf_counter()
+    output_file_name = make_output_file(
+        "voice_design", preview.generated_voice_id, "mp3", full_id=True
+    )
+    result = save_output(
+        base64.b64decode(preview.audio_base_64),
+        output_path,
+        output_file_name,
+        output_mode,
+        write_queue=write_queue,
+        deferred=deferred_resources,
+        duration_seconds=preview.duration_secs,
     )
+    return result, time.perf_counter() - start
 
-    audio_bytes = b"".join(audio_data)
 
-    # Handle different output modes
-    return handle_output_mode(audio_bytes, output_path, output_file_name, output_mode)
+async def _design_voice(
+    voice_description: str,
+    text: str | None,
+    output_path: Path,
+    semaphore: asyncio.Semaphore,
+) -> tuple[list[OutputResult], dict]:
+    """Create the previews for one description and save them all concurrently."""
+    start = time.perf_counter()
+    async with semaphore:
+        previews = await client.text_to_voice.create_previews(
+            voice_description=voice_description,
+            text=text,
+            auto_generate_text=True if text is None else False,
+        )
+    request_seconds = time.perf_counter() - start
+
+    saved = await asyncio.gather(
+        *(
+            asyncio.to_thread(_save_voice_preview, preview, output_path)
+            for preview in previews.previews
+        )
+    )
+    results = [result for result, _ in saved]
+    design = {
+        "voice_description": voice_description,
+        "text": previews.text,
+        "request_seconds": round(request_seconds, 3),
+        "save_seconds": round(time.perf_counter() - start - request_seconds, 3),
+        "previews": [
+            result.manifest_entry(
+                generated_voice_id=preview.generated_voice_id,
+                language=preview.language,
+                seconds=round(seconds, 3),
+            )
+            for (result, seconds), preview in zip(saved, previews.previews)
+        ],
+    }
+    return results, design
 
 
 @mcp.tool(
-    description=f"""Create voice previews from a text prompt. Creates three previews with slight variations. {get_output_mode_description(output_mode)}.
+    description=f"""Create voice previews from a text prompt. Creates three previews with slight variations. {output_mode_description}.
     
-    If no text is provided, the tool will auto-generate text.
+    If no text is provided, the tool will auto-generate text. Set save_manifest to also output a JSON manifest listing each preview's generated voice ID, file, size, duration and timings.
 
-    Voice preview files are saved as: voice_design_(generated_voice_id)_(timestamp).mp3
+    Pass a list of descriptions to design several voices in one call; up to max_concurrency of them are requested at the same time. The previews of each voice are decoded and saved concurrently.
 
-    Example file name: voice_design_Ya2J5uIa5Pq14DNPsbC1_20250403_164949.mp3
+    Voice preview files are saved as: voice_design_(generated_voice_id)_(timestamp)_(unique suffix).mp3
 
-    ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
+    Example file name: voice_design_Ya2J5uIa5Pq14DNPsbC1_20250403_164949_00a1f3c2.mp3
+
+    ⚠️ COST WARNING: This tool makes an API call to ElevenLabs for every description, which may incur costs. Only use when explicitly requested by the user.
     """
 )
-def text_to_voice(
-    voice_description: str,
+async def text_to_voice(
+    voice_description: str | list[str],
     text: str | None = None,
     output_directory: str | None = None,
+    save_manifest: bool = False,
+    max_concurrency: int = 3,
 ) -> list[EmbeddedResource] | TextContent:
-    if voice_description == "":
-        make_error("Voice description is required.")
-
-    previews = client.text_to_voice.create_previews(
-        voice_description=voice_description,
-        text=text,
-        auto_generate_text=True if text is None else False,
+    descriptions = (
+        [voice_description] if isinstance(voice_description, str) else voice_description
     )
+    if not descriptions or any(description == "" for description in descriptions):
+        make_error("Voice description is required.")
+    if max_concurrency < 1 or max_concurrency > 10:
+        make_error("max_concurrency must be between 1 and 10")
 
     output_path = make_output_path(output_directory, base_path)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(
+            _design_voice(description, text, output_path, semaphore)
+            for description in descriptions
+        ),
+        return_exceptions=True,
+    )
+    total_seconds = round(time.perf_counter() - start, 3)
 
-    generated_voice_ids = []
     results = []
-
-    for preview in previews.previews:
-        output_file_name = make_output_file(
-            "voice_design", preview.generated_voice_id, "mp3", full_id=True
+    designs = []
+    errors = []
+    for description, outcome in zip(descriptions, outcomes):
+        if isinstance(outcome, BaseException):
+            if len(descriptions) == 1:
+                raise outcome
+            errors.append(f"{description!r}: {outcome}")
+            designs.append({"voice_description": description, "error": str(outcome)})
+            continue
+        design_results, design = outcome
+        results.extend(design_results)
+        designs.append(design)
+    if not results:
+        make_error(f"No voice previews were generated. {'; '.join(errors)}")
+
+    manifest_result = None
+    if save_manifest:
+        manifest = {"total_seconds": total_seconds, "designs": designs}
+        manifest_result = save_output(
+            json.dumps(manifest, indent=2).encode("utf-8"),
+            output_path,
+            make_output_file("voice_design", "manifest", "json", full_id=True),
+            output_mode,
+            write_queue=write_queue,
         )
-        generated_voice_ids.append(preview.generated_voice_id)
-        audio_bytes = base64.b64decode(preview.audio_base_64)
 
-        # Handle different output modes
-        result = handle_output_mode(
-            audio_bytes, output_path, output_file_name, output_mode
+    # Use centralized multiple files output handling
+    info = []
+    for design in designs:
+        if "error" in design:
+            continue
+        voice_ids = ", ".join(p["generated_voice_id"] for p in design["previews"])
+        preview_seconds = "/".join(f"{p['seconds']:.3f}" for p in design["previews"])
+        label = (
+            "Generated voice IDs are"
+            if len(descriptions) == 1
+            else f"Generated voice IDs for {design['voice_description']!r} are"
         )
-        results.append(result)
+        info.append(
+            f"{label}: {voice_ids} (request {design['request_seconds']:.3f}s, "
+            f"previews saved in {preview_seconds}s)"
+        )
+    if errors:
+        info.append(f"Failed: {'; '.join(errors)}")
+    info.append(f"Total time: {total_seconds:.3f}s")
+    additional_info = ". ".join(info)
 
-    # Use centralized multiple files output handling
-    additional_info = f"Generated voice IDs are: {', '.join(generated_voice_ids)}"
-    return handle_multiple_files_output_mode(results, output_mode, additional_info)
+    output = handle_multiple_files_output_mode(
+        results, output_mode, additional_info, manifest_result
+    )
+    if isinstance(output, list):
+        return [TextContent(type="text", text=additional_info), *output]
+    return output
 
 
 @mcp.tool(
@@ -1012,16 +1947,17 @@ def text_to_voice(
     ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.
     """
 )
-def create_voice_from_preview(
+async def create_voice_from_preview(
     generated_voice_id: str,
     voice_name: str,
     voice_description: str,
 ) -> TextContent:
-    voice = client.text_to_voice.create_voice_from_preview(
+    voice = await client.text_to_voice.create_voice_from_preview(
         voice_name=voice_name,
         voice_description=voice_description,
         generated_voice_id=generated_voice_id,
     )
+    voice_index.invalidate()
 
     return TextContent(
         type="text",
@@ -1029,9 +1965,9 @@ def create_voice_from_preview(
     )
 
 
-def _get_phone_number_by_id(phone_number_id: str):
+async def _get_phone_number_by_id(phone_number_id: str):
     """Helper function to get phone number details by ID."""
-    phone_numbers = client.conversational_ai.phone_numbers.list()
+    phone_numbers = await client.conversational_ai.phone_numbers.list()
     for phone in phone_numbers:
         if phone.phone_number_id == phone_number_id:
             return phone
@@ -1052,23 +1988,23 @@ def _get_phone_number_by_id(phone_number_id: str):
         TextContent containing information about the call
     """
 )
-def make_outbound_call(
+async def make_outbound_call(
     agent_id: str,
     agent_phone_number_id: str,
     to_number: str,
 ) -> TextContent:
     # Get phone number details to determine provider type
-    phone_number = _get_phone_number_by_id(agent_phone_number_id)
+    phone_number = await _get_phone_number_by_id(agent_phone_number_id)
 
     if phone_number.provider.lower() == "twilio":
-        response = client.conversational_ai.twilio.outbound_call(
+        response = await client.conversational_ai.twilio.outbound_call(
             agent_id=agent_id,
             agent_phone_number_id=agent_phone_number_id,
             to_number=to_number,
         )
         provider_info = "Twilio"
     elif phone_number.provider.lower() == "sip_trunk":
-        response = client.conversational_ai.sip_trunk.outbound_call(
+        response = await client.conversational_ai.sip_trunk.outbound_call(
             agent_id=agent_id,
             agent_phone_number_id=agent_phone_number_id,
             to_number=to_number,
@@ -1094,12 +2030,12 @@ def make_outbound_call(
         TextContent containing information about the shared voices
     """
 )
-def search_voice_library(
+async def search_voice_library(
     page: int = 0,
     page_size: int = 10,
     search: str | None = None,
 ) -> TextContent:
-    response = client.voices.get_shared(
+    response = await client.voices.get_shared(
         page=page,
         page_size=page_size,
         search=search,
@@ -1154,13 +2090,13 @@ def search_voice_library(
 
 
 @mcp.tool(description="List all phone numbers associated with the ElevenLabs account")
-def list_phone_numbers() -> TextContent:
+async def list_phone_numbers() -> TextContent:
     """List all phone numbers associated with the ElevenLabs account.
 
     Returns:
         TextContent containing formatted information about the phone numbers
     """
-    response = client.conversational_ai.phone_numbers.list()
+    response = await client.conversational_ai.phone_numbers.list()
 
     if not response:
         return TextContent(type="text", text="No phone numbers found.")
@@ -1184,12 +2120,37 @@ def list_phone_numbers() -> TextContent:
 
 
 @mcp.tool(description="Play an audio file. Supports WAV and MP3 formats.")
-def play_audio(input_file_path: str) -> TextContent:
+async def play_audio(input_file_path: str) -> TextContent:
+    from elevenlabs.play import play
+
     file_path = handle_input_file(input_file_path)
-    play(open(file_path, "rb").read(), use_ffmpeg=False)
+    with file_path.open("rb") as f:
+        audio_bytes = f.read()
+    await asyncio.to_thread(play, audio_bytes, use_ffmpeg=False)
     return TextContent(type="text", text=f"Successfully played audio file: {file_path}")
 
 
+def _music_prompt(composition_plan: dict[str, Any] | None) -> "MusicPrompt | None":
+    """Validate a composition plan passed as JSON into the SDK model."""
+    if composition_plan is None:
+        return None
+    from elevenlabs.types import MusicPrompt
+    from pydantic import ValidationError
+
+    try:
+        return MusicPrompt.model_validate(composition_plan)
+    except ValidationError as e:
+        make_error(f"Invalid composition plan: {e}")
+
+
+def _music_prompt_schema() -> dict:
+    """JSON schema of an optional MusicPrompt; imports the SDK, so it is only built when not cached."""
+    from elevenlabs.types import MusicPrompt
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(MusicPrompt | None).json_schema()
+
+
 @mcp.tool(
     description="""Convert a prompt to music and save the output audio file to a given directory.
     Directory is optional, if not provided, the output file will be saved to $HOME/Desktop.
@@ -1197,15 +2158,16 @@ def play_audio(input_file_path: str) -> TextContent:
     Args:
         prompt: Prompt to convert to music. Must provide either prompt or composition_plan.
         output_directory: Directory to save the output audio file
-        composition_plan: Composition plan to use for the music. Must provide either prompt or composition_plan.
+        composition_plan: Composition plan to use for the music, as returned by create_composition_plan. Must provide either prompt or composition_plan.
         music_length_ms: Length of the generated music in milliseconds. Cannot be used if composition_plan is provided.
 
-    ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user."""
+    ⚠️ COST WARNING: This tool makes an API call to ElevenLabs which may incur costs. Only use when explicitly requested by the user.""",
+    parameter_schemas={"composition_plan": _music_prompt_schema},
 )
-def compose_music(
+async def compose_music(
     prompt: str | None = None,
     output_directory: str | None = None,
-    composition_plan: MusicPrompt | None = None,
+    composition_plan: dict[str, Any] | None = None,
     music_length_ms: int | None = None,
 ) -> Union[TextContent, EmbeddedResource]:
     if prompt is None and composition_plan is None:
@@ -1225,13 +2187,20 @@ def compose_music(
     audio_data = client.music.compose(
         prompt=prompt,
         music_length_ms=music_length_ms,
-        composition_plan=composition_plan,
+        composition_plan=_music_prompt(composition_plan),
     )
 
-    audio_bytes = b"".join(audio_data)
+    audio_bytes = b"".join([chunk async for chunk in audio_data])
 
     # Handle different output modes
-    return handle_output_mode(audio_bytes, output_path, output_file_name, output_mode)
+    return handle_output_mode(
+        audio_bytes,
+        output_path,
+        output_file_name,
+        output_mode,
+        write_queue=write_queue,
+        deferred=deferred_resources,
+    )
 
 
 @mcp.tool(
@@ -1240,27 +2209,103 @@ def compose_music(
     Args:
         prompt: Prompt to create a composition plan for
         music_length_ms: The length of the composition plan to generate in milliseconds. Must be between 10000ms and 300000ms. Optional - if not provided, the model will choose a length based on the prompt.
-        source_composition_plan: An optional composition plan to use as a source for the new composition plan
-    """
+        source_composition_plan: An optional composition plan to use as a source for the new composition plan, as returned by this tool
+    """,
+    parameter_schemas={"source_composition_plan": _music_prompt_schema},
 )
-def create_composition_plan(
+async def create_composition_plan(
     prompt: str,
     music_length_ms: int | None = None,
-    source_composition_plan: MusicPrompt | None = None,
-) -> MusicPrompt:
-    composition_plan = client.music.composition_plan.create(
+    source_composition_plan: dict[str, Any] | None = None,
+) -> "MusicPrompt":
+    composition_plan = await client.music.composition_plan.create(
         prompt=prompt,
         music_length_ms=music_length_ms,
-        source_composition_plan=source_composition_plan,
+        source_composition_plan=_music_prompt(source_composition_plan),
     )
 
     return composition_plan
 
 
+# Every tool is registered by now; store the schemas that had to be built
+if tool_schemas is not None:
+    tool_schemas.save()
+
+
+# "http" is served by the HTTP+SSE transport, the HTTP transport of this mcp version
+TRANSPORTS = ("stdio", "sse", "http")
+# Seconds open client sessions get to finish on shutdown; SSE sessions otherwise keep the server alive
+SHUTDOWN_TIMEOUT = 5
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ElevenLabs MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=os.getenv("ELEVENLABS_MCP_TRANSPORT", "stdio").strip().lower(),
+        help="stdio for one client per process; sse or http to serve many clients from one process",
+    )
+    parser.add_argument(
+        "--host",
+        default=os.getenv("ELEVENLABS_MCP_HOST", "127.0.0.1"),
+        help="Address to listen on with --transport sse/http",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=get_env_int("ELEVENLABS_MCP_PORT", 8000),
+        help="Port to listen on with --transport sse/http",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=get_env_int("ELEVENLABS_MCP_WORKERS", 0, minimum=0),
+        help="Threads for blocking work such as decoding and writing files (default: Python's default)",
+    )
+    return parser.parse_args(argv)
+
+
+async def serve(transport: str, host: str, port: int, workers: int) -> None:
+    """Serve MCP clients over the given transport until cancelled."""
+    if workers > 0:
+        # asyncio.to_thread, used for file writes and audio processing, runs on this pool
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="elevenlabs-worker")
+        )
+    if transport == "stdio":
+        await mcp.run_stdio_async()
+    else:
+        # Every client shares this process's API client, connection pool and caches
+        config = uvicorn.Config(
+            mcp.sse_app(),
+            host=host,
+            port=port,
+            log_level=mcp.settings.log_level.lower(),
+            timeout_graceful_shutdown=SHUTDOWN_TIMEOUT,
+        )
+        await uvicorn.Server(config).serve()
+
+
 def main():
     print("Starting MCP server")
     """Run the MCP server"""
-    mcp.run()
+    args = parse_args()
+    # Resolve and validate the default output directory before the first tool call needs it
+    try:
+        make_output_path(None, base_path)
+    except ElevenLabsMcpError as e:
+        print(f"Default output directory is not usable yet: {e}", file=sys.stderr)
+    # Import the SDK and build the client while the client connects, not on the first tool call
+    threading.Thread(target=client.get, name="elevenlabs-client", daemon=True).start()
+    try:
+        asyncio.run(serve(args.transport, args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if write_queue is not None:
+            # Files whose resources were already returned must still reach the disk
+            write_queue.close()
 
 
 if __name__ == "__main__":
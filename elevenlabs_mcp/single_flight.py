@@ -0,0 +1,64 @@
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Concurrent identical calls share one in-flight call and its result.
+
+    The first caller for a key starts the call; callers arriving with the same
+    key before it finishes wait for that call instead of starting their own,
+    and get its result or exception. Nothing is kept once the call finishes,
+    so a later call starts afresh. A caller that is cancelled does not cancel
+    the shared call for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple[str, Hashable], asyncio.Future] = {}
+        self._started: Counter[str] = Counter()
+        self._coalesced: Counter[str] = Counter()
+
+    async def do(self, kind: str, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run call, or join the call already running for (kind, key).
+
+        Args:
+            kind: Name of the operation, used to group the counters
+            key: Identifies identical calls within kind; must be hashable
+            call: Starts the call when none is in flight for the key
+
+        Returns:
+            The shared call's result
+        """
+        flight_key = (kind, key)
+        flight = self._calls.get(flight_key)
+        if flight is None:
+            self._started[kind] += 1
+            flight = asyncio.ensure_future(call())
+            self._calls[flight_key] = flight
+            flight.add_done_callback(lambda _: self._finish(flight_key, flight))
+        else:
+            self._coalesced[kind] += 1
+        return await asyncio.shield(flight)
+
+    def _finish(self, flight_key: tuple[str, Hashable], flight: asyncio.Future) -> None:
+        if self._calls.get(flight_key) is flight:
+            del self._calls[flight_key]
+        if not flight.cancelled():
+            # Retrieved here so a failure nobody is waiting for any more isn't logged as lost
+            flight.exception()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "operations": {
+                kind: {
+                    "calls": self._started[kind],
+                    "coalesced": self._coalesced[kind],
+                }
+                for kind in sorted(set(self._started) | set(self._coalesced))
+            },
+        }
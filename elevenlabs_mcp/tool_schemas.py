@@ -0,0 +1,214 @@
+import inspect
+import json
+import os
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable
+
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+
+from elevenlabs_mcp import __version__
+
+
+# Distributions whose versions can change the generated schemas
+SCHEMA_DISTRIBUTIONS = ("mcp", "pydantic", "elevenlabs")
+
+
+def schema_version() -> str:
+    """Version key for cached schemas: this package plus every distribution that shapes them."""
+    versions = [f"elevenlabs-mcp {__version__}"]
+    for distribution in SCHEMA_DISTRIBUTIONS:
+        try:
+            versions.append(f"{distribution} {metadata.version(distribution)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{distribution} missing")
+    return ", ".join(versions)
+
+
+def _context_kwarg(signature: inspect.Signature) -> str | None:
+    for param_name, param in signature.parameters.items():
+        if param.annotation is Context:
+            return param_name
+    return None
+
+
+class LazyFuncMetadata:
+    """
+    Stands in for a tool's FuncMetadata until the tool is first called.
+
+    Building the pydantic argument model is most of what registering a tool
+    costs, and a tool whose schema came from the cache only needs the model
+    once a client actually calls it.
+    """
+
+    def __init__(self, fn: Callable[..., Any], skip_names: list[str]):
+        self.fn = fn
+        self.skip_names = skip_names
+        self._metadata: FuncMetadata | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> FuncMetadata:
+        if self._metadata is None:
+            with self._lock:
+                if self._metadata is None:
+                    self._metadata = func_metadata(self.fn, skip_names=self.skip_names)
+        return self._metadata
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+
+class ToolSchemaCache:
+    """
+    JSON schemas of tool parameters, persisted between restarts.
+
+    FastMCP builds a pydantic model and its JSON schema for every tool when it
+    is registered. Both only change with the tool's signature or the installed
+    package versions, so schemas are stored on disk under a key of all of
+    them and the argument model is built on a tool's first call. The whole
+    file is discarded when any version differs; a single tool is rebuilt when
+    its signature does.
+    """
+
+    def __init__(self, path: Path | None, version: str | None = None):
+        self.path = path
+        self.version = version if version is not None else schema_version()
+        self.hits = 0
+        self.misses = 0
+        self._schemas: dict[str, dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load_from_disk()
+
+    def _load_from_disk(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] == self.version:
+                self._schemas = data["tools"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(self) -> None:
+        """Write the schemas to disk if any were built since they were loaded."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            data = {"version": self.version, "tools": dict(self._schemas)}
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            # The schemas are simply rebuilt on the next start
+            pass
+
+    def get(self, name: str, signature: str) -> dict | None:
+        with self._lock:
+            entry = self._schemas.get(name)
+            if entry is None or entry.get("signature") != signature:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry["parameters"]
+
+    def put(self, name: str, signature: str, parameters: dict) -> None:
+        with self._lock:
+            self._schemas[name] = {"signature": signature, "parameters": parameters}
+            self._dirty = True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tools": len(self._schemas),
+                "hits": self.hits,
+                "misses": self.misses,
+                "version": self.version,
+            }
+
+
+def apply_parameter_schemas(
+    parameters: dict, parameter_schemas: dict[str, Callable[[], dict]]
+) -> dict:
+    """
+    Replace the schemas of some parameters with the ones their callables return.
+
+    Lets a tool accept a plain dict while advertising the full schema of a
+    model that is expensive to import. Each callable returns a JSON schema that
+    may carry its own $defs; the title, description and default generated for
+    the parameter are kept.
+    """
+    properties = parameters.get("properties", {})
+    for param_name, make_schema in parameter_schemas.items():
+        schema = dict(make_schema())
+        definitions = schema.pop("$defs", None)
+        if definitions:
+            parameters.setdefault("$defs", {}).update(definitions)
+        generated = properties.get(param_name, {})
+        for key in ("title", "description", "default"):
+            if key in generated:
+                schema[key] = generated[key]
+        properties[param_name] = schema
+    return parameters
+
+
+def build_tool(
+    fn: Callable[..., Any],
+    name: str | None = None,
+    description: str | None = None,
+    schema_cache: ToolSchemaCache | None = None,
+    parameter_schemas: dict[str, Callable[[], dict]] | None = None,
+) -> Tool:
+    """
+    Tool.from_function, with parameter schemas taken from schema_cache when it has them.
+
+    Args:
+        fn: The function to register as a tool
+        name: Optional name for the tool (defaults to function name)
+        description: Optional description of what the tool does
+        schema_cache: Where to look up and store the tool's parameter schema
+        parameter_schemas: Callables returning the schema of individual parameters,
+            only called when the tool's schema is not cached
+
+    Returns:
+        Tool: The tool, ready to add to the tool manager
+    """
+    func_name = name or fn.__name__
+    signature = inspect.signature(fn)
+    cache_key = str(signature)
+    if parameter_schemas:
+        cache_key += f" {sorted(parameter_schemas)}"
+
+    parameters = (
+        schema_cache.get(func_name, cache_key) if schema_cache is not None else None
+    )
+    if parameters is None:
+        tool = Tool.from_function(fn, name=name, description=description)
+        if parameter_schemas:
+            tool.parameters = apply_parameter_schemas(
+                tool.parameters, parameter_schemas
+            )
+        if schema_cache is not None:
+            schema_cache.put(func_name, cache_key, tool.parameters)
+        return tool
+
+    context_kwarg = _context_kwarg(signature)
+    return Tool.model_construct(
+        fn=fn,
+        name=func_name,
+        description=description or fn.__doc__ or "",
+        parameters=parameters,
+        fn_metadata=LazyFuncMetadata(
+            fn, [context_kwarg] if context_kwarg is not None else []
+        ),
+        is_async=inspect.iscoroutinefunction(fn),
+        context_kwarg=context_kwarg,
+    )
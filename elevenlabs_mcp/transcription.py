@@ -0,0 +1,187 @@
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import soundfile as sf
+
+
+# Resolution of the loudness envelope used to find pauses
+ENERGY_WINDOW_SECONDS = 0.05
+# Pauses are scored on loudness averaged over this span so gaps between words don't win
+SMOOTHING_SECONDS = 0.3
+# Audio before a segment's start that is transcribed again to match its speakers to the previous segment's
+SEGMENT_OVERLAP_SECONDS = 5.0
+
+
+def _energy_envelope(file_path: Path) -> tuple[np.ndarray, float]:
+    """RMS loudness per ENERGY_WINDOW_SECONDS window, decoded block by block."""
+    energies = []
+    with sf.SoundFile(file_path) as f:
+        window = max(1, int(f.samplerate * ENERGY_WINDOW_SECONDS))
+        duration = f.frames / f.samplerate
+        for block in f.blocks(blocksize=window * 1024, dtype="float32", always_2d=True):
+            mono = block.mean(axis=1)
+            padding = -len(mono) % window
+            if padding:
+                mono = np.pad(mono, (0, padding))
+            energies.append(
+                np.sqrt(np.mean(np.square(mono.reshape(-1, window)), axis=1))
+            )
+    envelope = np.concatenate(energies) if energies else np.zeros(0, dtype="float32")
+    return envelope, duration
+
+
+def plan_segments(
+    file_path: Path, segment_seconds: float, search_seconds: float = 30.0
+) -> list[tuple[float, float]]:
+    """
+    Split an audio file into segments of at most segment_seconds, cutting at pauses.
+
+    Each cut is placed at the quietest point in the last search_seconds before
+    the segment would exceed its maximum length.
+
+    Args:
+        file_path: Audio file in a format libsndfile can decode (wav, flac, ogg, mp3, ...)
+        segment_seconds: Maximum length of a segment
+        search_seconds: How far before the maximum length to look for a pause
+
+    Returns:
+        list[tuple[float, float]]: (start, end) of each segment in seconds
+    """
+    if segment_seconds <= 0:
+        raise ValueError("segment_seconds must be positive")
+
+    envelope, duration = _energy_envelope(file_path)
+    smoothing = max(1, int(SMOOTHING_SECONDS / ENERGY_WINDOW_SECONDS))
+    if len(envelope) >= smoothing:
+        envelope = np.convolve(envelope, np.ones(smoothing) / smoothing, mode="same")
+    search_seconds = min(search_seconds, segment_seconds / 2)
+
+    boundaries = [0.0]
+    while duration - boundaries[-1] > segment_seconds:
+        latest = boundaries[-1] + segment_seconds
+        lo = int((latest - search_seconds) / ENERGY_WINDOW_SECONDS)
+        hi = min(int(latest / ENERGY_WINDOW_SECONDS), len(envelope))
+        if hi > lo:
+            quietest = lo + int(np.argmin(envelope[lo:hi]))
+            cut = (quietest + 0.5) * ENERGY_WINDOW_SECONDS
+        else:
+            cut = latest
+        boundaries.append(cut)
+    boundaries.append(duration)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def export_segment(
+    file_path: Path, start: float, end: float, destination: Path
+) -> None:
+    """Write the [start, end) span of an audio file to destination as 16-bit FLAC."""
+    with sf.SoundFile(file_path) as source:
+        first = int(start * source.samplerate)
+        frames = min(int(end * source.samplerate), source.frames) - first
+        source.seek(first)
+        with sf.SoundFile(
+            destination,
+            "w",
+            samplerate=source.samplerate,
+            channels=source.channels,
+            format="FLAC",
+            subtype="PCM_16",
+        ) as target:
+            blocksize = source.samplerate * 10
+            while frames > 0:
+                block = source.read(
+                    min(blocksize, frames), dtype="int16", always_2d=True
+                )
+                if len(block) == 0:
+                    break
+                target.write(block)
+                frames -= len(block)
+
+
+def _match_speakers(
+    overlap_words: list[Any], previous_words: list[Any], tolerance: float = 0.5
+) -> dict[str, str]:
+    """Map a segment's speaker IDs onto the previous segment's from the words both transcribed."""
+    votes: Counter[tuple[str, str]] = Counter()
+    for word in overlap_words:
+        if word.type != "word" or word.speaker_id is None:
+            continue
+        text = word.text.strip().casefold()
+        for previous in previous_words:
+            if (
+                previous.speaker_id is not None
+                and previous.start is not None
+                and abs(previous.start - word.start) <= tolerance
+                and previous.text.strip().casefold() == text
+            ):
+                votes[(word.speaker_id, previous.speaker_id)] += 1
+                break
+
+    mapping: dict[str, str] = {}
+    for (local, known), _ in votes.most_common():
+        if local not in mapping and known not in mapping.values():
+            mapping[local] = known
+    return mapping
+
+
+def merge_transcriptions(
+    transcriptions: list[Any],
+    segments: list[tuple[float, float]],
+    offsets: list[float],
+) -> list[Any]:
+    """
+    Merge the words of per-segment transcriptions into one timeline.
+
+    Timestamps are shifted by each segment's audio offset. Words a segment
+    transcribed before its own start (the overlap with the previous segment)
+    are dropped, but first used to match its speakers to the previous
+    segment's; speakers that can't be matched get new IDs.
+
+    Args:
+        transcriptions: scribe responses, one per segment, in order
+        segments: (start, end) of each segment in seconds
+        offsets: Where each uploaded segment's audio starts, at or before its segment start
+
+    Returns:
+        list: Words with absolute timestamps and speaker IDs consistent across segments
+    """
+    merged = []
+    previous_words: list[Any] = []
+    speaker_count = 0
+    for transcription, (start, _), offset in zip(transcriptions, segments, offsets):
+        words = [
+            word.model_copy(
+                update={
+                    "start": word.start + offset if word.start is not None else None,
+                    "end": word.end + offset if word.end is not None else None,
+                }
+            )
+            for word in transcription.words or []
+        ]
+        overlap = [
+            word for word in words if word.start is not None and word.start < start
+        ]
+        mapping = _match_speakers(
+            overlap,
+            [
+                word
+                for word in previous_words
+                if word.start is not None and word.start >= offset - 1
+            ],
+        )
+
+        kept = []
+        for word in words:
+            if word.start is not None and word.start < start:
+                continue
+            if word.speaker_id is not None:
+                if word.speaker_id not in mapping:
+                    mapping[word.speaker_id] = f"speaker_{speaker_count}"
+                    speaker_count += 1
+                word = word.model_copy(update={"speaker_id": mapping[word.speaker_id]})
+            kept.append(word)
+        merged.extend(kept)
+        previous_words = kept
+    return merged
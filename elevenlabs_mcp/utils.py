@@ -1,10 +1,17 @@
 import os
+import re
 import tempfile
 import base64
+import itertools
+import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from fuzzywuzzy import fuzz
-from typing import Union
+from elevenlabs_mcp.file_index import get_filename_index
+from elevenlabs_mcp.resources import DeferredResources
+from elevenlabs_mcp.write_behind import WriteBehindQueue
+from typing import AsyncIterator, Awaitable, Callable, Union
 from mcp.types import (
     EmbeddedResource,
     TextResourceContents,
@@ -21,6 +28,48 @@ def make_error(error_text: str):
     raise ElevenLabsMcpError(error_text)
 
 
+def get_env_int(name: str, default: int, minimum: int = 1) -> int:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if parsed < minimum:
+        raise ValueError(f"{name} must be at least {minimum}")
+    return parsed
+
+
+def get_env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number")
+
+
+def get_env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def get_cache_dir() -> Path:
+    """
+    Directory for the server's persistent caches.
+
+    Defaults to ~/.cache/elevenlabs_mcp and can be overridden with ELEVENLABS_MCP_CACHE_DIR.
+    """
+    cache_dir = os.getenv("ELEVENLABS_MCP_CACHE_DIR")
+    if cache_dir and cache_dir.strip():
+        return Path(os.path.expanduser(cache_dir.strip())).resolve()
+    return Path.home() / ".cache" / "elevenlabs_mcp"
+
+
 def is_file_writeable(path: Path) -> bool:
     if path.exists():
         return os.access(path, os.W_OK)
@@ -28,18 +77,30 @@ def is_file_writeable(path: Path) -> bool:
     return os.access(parent_dir, os.W_OK)
 
 
+_UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^\w-]")
+# Per-process sequence number in output filenames, so names generated in the same second differ
+_output_file_sequence = itertools.count()
+
+
 def make_output_file(
     tool: str, text: str, extension: str, full_id: bool = False
 ) -> Path:
-    id = text if full_id else text[:5]
+    """
+    Unique name for a generated file.
 
-    output_file_name = f"{tool}_{id.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    Names are the tool, the start of the text and a timestamp, followed by a
+    per-process sequence number and a random token so that concurrent calls,
+    and other server processes, never produce the same name.
+    """
+    id = _UNSAFE_FILENAME_CHARACTERS.sub("_", text if full_id else text[:5])
+    sequence = next(_output_file_sequence) % 0x10000
+    suffix = f"{sequence:04x}{uuid.uuid4().hex[:4]}"
+
+    output_file_name = f"{tool}_{id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}.{extension}"
     return Path(output_file_name)
 
 
-def make_output_path(
-    output_directory: str | None, base_path: str | None = None
-) -> Path:
+def _resolve_output_path(output_directory: str | None, base_path: str | None) -> Path:
     output_path = None
     if output_directory is None:
         base = base_path
@@ -68,7 +129,31 @@ def make_output_path(
     else:
         expanded_output = os.path.expanduser(output_directory)
         output_path = Path(expanded_output).resolve()
-    
+    return output_path
+
+
+# Output directories that have already been created and checked, by make_output_path arguments
+_validated_output_paths: dict[tuple[str | None, str | None], Path] = {}
+_MAX_VALIDATED_OUTPUT_PATHS = 256
+
+
+def make_output_path(
+    output_directory: str | None, base_path: str | None = None
+) -> Path:
+    """
+    Resolve, create and check the directory generated files are written to.
+
+    Validated directories are remembered, so repeated calls with the same
+    arguments cost no filesystem calls; invalidate_output_path forgets a
+    directory after a write into it fails.
+    """
+    key = (output_directory, base_path)
+    output_path = _validated_output_paths.get(key)
+    if output_path is not None:
+        return output_path
+
+    output_path = _resolve_output_path(output_directory, base_path)
+
     # Ensure parent directory exists and is writable
     try:
         output_path.mkdir(parents=True, exist_ok=True)
@@ -78,12 +163,93 @@ def make_output_path(
     # Check if directory is writeable
     if not is_file_writeable(output_path):
         make_error(f"Directory ({output_path}) is not writeable")
-    
+
+    if len(_validated_output_paths) >= _MAX_VALIDATED_OUTPUT_PATHS:
+        _validated_output_paths.pop(next(iter(_validated_output_paths)))
+    _validated_output_paths[key] = output_path
     return output_path
 
 
+def invalidate_output_path(output_path: Path) -> None:
+    """Forget that output_path was validated, so the next make_output_path checks it again."""
+    for key, path in list(_validated_output_paths.items()):
+        if path == output_path:
+            _validated_output_paths.pop(key, None)
+
+
+FSYNC_POLICIES = ("none", "file", "full")
+
+
+def get_fsync_policy() -> str:
+    """
+    How durably generated files are written, from ELEVENLABS_MCP_FSYNC.
+
+    none: leave flushing to the operating system (default)
+    file: fsync each file before it is renamed into place
+    full: also fsync the directory after the rename (ignored on Windows)
+    """
+    policy = (os.getenv("ELEVENLABS_MCP_FSYNC") or "none").strip().lower()
+    return policy if policy in FSYNC_POLICIES else "none"
+
+
+def _temp_path_for(full_file_path: Path) -> Path:
+    return full_file_path.with_name(f".{full_file_path.name}.{uuid.uuid4().hex}.part")
+
+
+def _sync_file(f, policy: str) -> None:
+    if policy != "none":
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _sync_directory(directory: Path, policy: str) -> None:
+    if policy != "full" or os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(full_file_path: Path, file_data: bytes, policy: str) -> None:
+    temp_path = _temp_path_for(full_file_path)
+    try:
+        with open(temp_path, "xb") as f:
+            f.write(file_data)
+            _sync_file(f, policy)
+        os.replace(temp_path, full_file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    _sync_directory(full_file_path.parent, policy)
+
+
+def write_output_file(full_file_path: Path, file_data: bytes) -> None:
+    """
+    Write a generated file into a directory returned by make_output_path.
+
+    The data is written to a temporary file next to the target and renamed
+    into place, so readers never see a partially written file.
+    """
+    policy = get_fsync_policy()
+    try:
+        _write_atomic(full_file_path, file_data, policy)
+    except FileNotFoundError:
+        # The directory was removed after it was validated; create it again once
+        invalidate_output_path(full_file_path.parent)
+        full_file_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(full_file_path, file_data, policy)
+    except OSError:
+        invalidate_output_path(full_file_path.parent)
+        raise
+
+
 def find_similar_filenames(
-    target_file: str, directory: Path, threshold: int = 70
+    target_file: str, directory: Path, threshold: int = 70, recursive: bool = False
 ) -> list[tuple[str, int]]:
     """
     Find files with names similar to the target file using fuzzy matching.
@@ -92,34 +258,21 @@ def find_similar_filenames(
         target_file (str): The reference filename to compare against
         directory (str): Directory to search in (defaults to current directory)
         threshold (int): Similarity threshold (0 to 100, where 100 is identical)
+        recursive (bool): Also search subdirectories
 
     Returns:
         list: List of similar filenames with their similarity scores
     """
-    target_filename = os.path.basename(target_file)
-    similar_files = []
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if (
-                filename == target_filename
-                and os.path.join(root, filename) == target_file
-            ):
-                continue
-            similarity = fuzz.token_sort_ratio(target_filename, filename)
-
-            if similarity >= threshold:
-                file_path = Path(root) / filename
-                similar_files.append((file_path, similarity))
-
-    similar_files.sort(key=lambda x: x[1], reverse=True)
-
-    return similar_files
+    index = get_filename_index(Path(directory), recursive)
+    return index.find_similar(
+        os.path.basename(target_file), threshold, exclude=Path(target_file)
+    )
 
 
 def try_find_similar_files(
-    filename: str, directory: Path, take_n: int = 5
+    filename: str, directory: Path, take_n: int = 5, recursive: bool = False
 ) -> list[Path]:
-    similar_files = find_similar_filenames(filename, directory)
+    similar_files = find_similar_filenames(filename, directory, recursive=recursive)
     if not similar_files:
         return []
 
@@ -156,7 +309,11 @@ def handle_input_file(file_path: str, audio_content_check: bool = True) -> Path:
     path = Path(file_path)
     if not path.exists() and path.parent.exists():
         parent_directory = path.parent
-        similar_files = try_find_similar_files(path.name, parent_directory)
+        similar_files = try_find_similar_files(
+            path.name,
+            parent_directory,
+            recursive=get_env_bool("ELEVENLABS_MCP_RECURSIVE_FILE_SUGGESTIONS", False),
+        )
         similar_files_formatted = ",".join([str(file) for file in similar_files])
         if similar_files:
             make_error(
@@ -293,6 +450,8 @@ def get_mime_type(file_extension: str) -> str:
         "aac": "audio/aac",
         "opus": "audio/opus",
         "txt": "text/plain",
+        "srt": "application/x-subrip",
+        "vtt": "text/vtt",
         "json": "application/json",
         "xml": "application/xml",
         "html": "text/html",
@@ -306,6 +465,15 @@ def get_mime_type(file_extension: str) -> str:
     return mime_types.get(ext.lower(), "application/octet-stream")
 
 
+# Non-text/* MIME types whose content is UTF-8 text
+TEXT_APPLICATION_MIME_TYPES = {"application/json", "application/xml", "application/x-subrip"}
+
+
+def is_text_mime_type(mime_type: str) -> bool:
+    """Whether content of this MIME type is sent as text rather than base64."""
+    return mime_type.startswith("text/") or mime_type in TEXT_APPLICATION_MIME_TYPES
+
+
 def generate_resource_uri(filename: str) -> str:
     """
     Generate a resource URI for a given filename.
@@ -342,7 +510,7 @@ def create_resource_response(
         resource_uri = generate_resource_uri(filename)
 
     # For text files, use TextResourceContents
-    if mime_type.startswith("text/"):
+    if is_text_mime_type(mime_type):
         try:
             text_content = file_data.decode("utf-8")
             return EmbeddedResource(
@@ -365,52 +533,152 @@ def create_resource_response(
     )
 
 
-def handle_output_mode(
+def create_deferred_resource_response(
+    uri: str,
+    filename: str,
+    file_extension: str,
+    size: int,
+    file_path: Path | None = None,
+) -> TextContent:
+    """
+    Point to a resource instead of embedding it, for outputs too large to inline.
+
+    Args:
+        uri: URI the output can be read from
+        filename: Name of the file
+        file_extension: File extension for MIME type detection
+        size: Size of the output in bytes
+        file_path: Where the output is saved on disk, if it is
+
+    Returns:
+        TextContent: Message with the URI, MIME type and size of the output
+    """
+    mime_type = get_mime_type(file_extension)
+    message = f"Success. {filename} ({mime_type}, {size} bytes) is available as resource {uri}"
+    if file_path is not None:
+        message += f" and saved as: {file_path}"
+    message += f". Large files can be read in parts from {uri}/range/{{offset}}/{{length}}."
+    return TextContent(type="text", text=message)
+
+
+def create_saved_file_response(
+    full_file_path: Path, deferred: DeferredResources | None = None
+) -> Union[TextContent, EmbeddedResource]:
+    """
+    Resource response for an output that was already written to disk, as in 'both' mode.
+
+    Outputs above the deferred threshold are returned as a URI to the file,
+    like save_output does, instead of being read back and inlined.
+    """
+    size = full_file_path.stat().st_size
+    file_extension = full_file_path.suffix.lstrip(".")
+    if deferred is not None and deferred.should_defer(size):
+        uri = deferred.add(full_file_path.name, full_file_path)
+        return create_deferred_resource_response(
+            uri, full_file_path.name, file_extension, size, full_file_path
+        )
+    return create_resource_response(
+        full_file_path.read_bytes(),
+        full_file_path.name,
+        file_extension,
+        directory=full_file_path.parent,
+    )
+
+
+@dataclass(frozen=True)
+class OutputResult:
+    """A generated file as returned to the client, with what is known about it."""
+
+    content: Union[TextContent, EmbeddedResource]
+    path: Path
+    size: int
+    mime_type: str
+    saved: bool
+    uri: str | None = None
+    duration_seconds: float | None = None
+
+    def manifest_entry(self, **details) -> dict:
+        """JSON-serializable description of the file for manifests, with extra details appended."""
+        return {
+            "file": str(self.path) if self.saved else None,
+            "filename": self.path.name,
+            "uri": self.uri,
+            "bytes": self.size,
+            "mime_type": self.mime_type,
+            "duration_seconds": self.duration_seconds,
+            **details,
+        }
+
+
+def save_output(
     file_data: bytes,
     output_path: Path,
     filename: str,
     output_mode: str,
     success_message: str = None,
-) -> Union[TextContent, EmbeddedResource]:
+    write_queue: WriteBehindQueue | None = None,
+    deferred: DeferredResources | None = None,
+    duration_seconds: float | None = None,
+) -> OutputResult:
     """
-    Handle different output modes for file generation.
+    Handle different output modes for file generation, keeping the file's metadata.
 
-    Args:
-        file_data: Raw file data as bytes
-        output_path: Path where file should be saved
-        filename: Name of the file
-        output_mode: Output mode ('files', 'resources', or 'both')
-        success_message: Custom success message for files mode (optional)
+    Takes the same arguments as handle_output_mode, plus the duration of the
+    audio if the caller knows it.
 
     Returns:
-        Union[TextContent, EmbeddedResource]: TextContent for 'files' mode,
-                                            EmbeddedResource for 'resources' and 'both' modes
+        OutputResult: The content for the client along with the file's path, size and MIME type
     """
     file_extension = Path(filename).suffix.lstrip(".")
     full_file_path = output_path / filename
+    mime_type = get_mime_type(file_extension)
+
+    def result(content, saved: bool, uri: str | None = None) -> OutputResult:
+        return OutputResult(
+            content,
+            full_file_path,
+            len(file_data),
+            mime_type,
+            saved,
+            uri,
+            duration_seconds,
+        )
 
     if output_mode == "files":
         # Save to disk and return TextContent with success message
-        output_path.mkdir(parents=True, exist_ok=True)
-        with open(full_file_path, "wb") as f:
-            f.write(file_data)
+        write_output_file(full_file_path, file_data)
 
         if success_message and "{file_path}" in success_message:
             message = success_message.replace("{file_path}", str(full_file_path))
         else:
             message = success_message or f"Success. File saved as: {full_file_path}"
-        return TextContent(type="text", text=message)
+        return result(TextContent(type="text", text=message), saved=True)
 
     elif output_mode == "resources":
         # Return as EmbeddedResource without saving to disk
-        return create_resource_response(file_data, filename, file_extension, directory=output_path)
+        if deferred is not None and deferred.should_defer(len(file_data)):
+            uri = deferred.add(full_file_path.name, file_data)
+            content = create_deferred_resource_response(
+                uri, filename, file_extension, len(file_data)
+            )
+            return result(content, saved=False, uri=uri)
+        content = create_resource_response(file_data, filename, file_extension, directory=output_path)
+        return result(content, saved=False, uri=str(content.resource.uri))
 
     elif output_mode == "both":
         # Save to disk AND return as EmbeddedResource
-        output_path.mkdir(parents=True, exist_ok=True)
-        with open(full_file_path, "wb") as f:
-            f.write(file_data)
-        return create_resource_response(file_data, filename, file_extension, directory=output_path)
+        if write_queue is not None:
+            write_queue.submit(full_file_path, file_data)
+        else:
+            write_output_file(full_file_path, file_data)
+        if deferred is not None and deferred.should_defer(len(file_data)):
+            uri = deferred.add(full_file_path.name, full_file_path)
+            content = create_deferred_resource_response(
+                uri, filename, file_extension, len(file_data), full_file_path
+            )
+            return result(content, saved=True, uri=uri)
+        content = create_resource_response(file_data, filename, file_extension, directory=output_path)
+        return result(content, saved=True, uri=str(content.resource.uri))
 
     else:
         raise ValueError(
@@ -418,55 +686,131 @@ def handle_output_mode(
         )
 
 
+def handle_output_mode(
+    file_data: bytes,
+    output_path: Path,
+    filename: str,
+    output_mode: str,
+    success_message: str = None,
+    write_queue: WriteBehindQueue | None = None,
+    deferred: DeferredResources | None = None,
+) -> Union[TextContent, EmbeddedResource]:
+    """
+    Handle different output modes for file generation.
+
+    Args:
+        file_data: Raw file data as bytes
+        output_path: Path where file should be saved
+        filename: Name of the file
+        output_mode: Output mode ('files', 'resources', or 'both')
+        success_message: Custom success message for files mode (optional)
+        write_queue: In 'both' mode, queue the disk write here and return without waiting for it (optional)
+        deferred: Return outputs above its size threshold as a resource URI instead of inline (optional)
+
+    Returns:
+        Union[TextContent, EmbeddedResource]: TextContent for 'files' mode,
+                                            EmbeddedResource for 'resources' and 'both' modes
+    """
+    return save_output(
+        file_data,
+        output_path,
+        filename,
+        output_mode,
+        success_message,
+        write_queue,
+        deferred,
+    ).content
+
+
+async def stream_to_file(
+    chunks: AsyncIterator[bytes],
+    full_file_path: Path,
+    on_progress: Callable[[int], Awaitable[None]] | None = None,
+    progress_interval: int = 64 * 1024,
+) -> tuple[int, float | None]:
+    """
+    Write an async stream of chunks to disk as they arrive.
+
+    Chunks are written to a temporary file next to the target, which is renamed
+    into place once the stream completes so a partial file is never visible.
+
+    Args:
+        chunks: Async iterator of raw data chunks
+        full_file_path: Final path of the file
+        on_progress: Optional callback receiving the number of bytes written so far
+        progress_interval: Minimum number of bytes between progress callbacks
+
+    Returns:
+        tuple: (bytes_written, time_to_first_byte), time_to_first_byte is None if the stream was empty
+    """
+    start = time.perf_counter()
+    time_to_first_byte = None
+    bytes_written = 0
+    last_reported = 0
+
+    policy = get_fsync_policy()
+    full_file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _temp_path_for(full_file_path)
+    try:
+        with open(temp_path, "xb") as f:
+            async for chunk in chunks:
+                if time_to_first_byte is None:
+                    time_to_first_byte = time.perf_counter() - start
+                f.write(chunk)
+                bytes_written += len(chunk)
+                if on_progress and bytes_written - last_reported >= progress_interval:
+                    last_reported = bytes_written
+                    await on_progress(bytes_written)
+            _sync_file(f, policy)
+        os.replace(temp_path, full_file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    _sync_directory(full_file_path.parent, policy)
+
+    if on_progress and bytes_written != last_reported:
+        await on_progress(bytes_written)
+    return bytes_written, time_to_first_byte
+
+
 def handle_multiple_files_output_mode(
-    results: list[Union[TextContent, EmbeddedResource]],
+    results: list[OutputResult],
     output_mode: str,
     additional_info: str = None,
-) -> Union[TextContent, list[EmbeddedResource]]:
+    manifest: OutputResult | None = None,
+) -> Union[TextContent, list[Union[TextContent, EmbeddedResource]]]:
     """
     Handle different output modes for multiple file generation.
 
     Args:
-        results: List of results from handle_output_mode calls
+        results: List of results from save_output calls
         output_mode: Output mode ('files', 'resources', or 'both')
         additional_info: Additional information to include in files mode message
+        manifest: Saved JSON manifest describing the files (optional)
 
     Returns:
-        Union[TextContent, list[EmbeddedResource]]: TextContent for 'files' mode,
-                                                   list of EmbeddedResource for 'resources' and 'both' modes
+        Union[TextContent, list]: TextContent for 'files' mode, the content of every
+                                  file (and the manifest) for 'resources' and 'both' modes
     """
     if output_mode == "files":
-        # Extract file paths from TextContent objects and create combined message
-        file_paths = []
-        for result in results:
-            if isinstance(result, TextContent):
-                # Extract file path from the success message
-                text = result.text
-                if "File saved as: " in text:
-                    path = (
-                        text.split("File saved as: ")[1].split(".")[0]
-                        + "."
-                        + text.split(".")[-1].split(" ")[0]
-                    )
-                    file_paths.append(path)
-
+        file_paths = [str(result.path) for result in results]
         message = f"Success. Files saved at: {', '.join(file_paths)}"
         if additional_info:
             message += f". {additional_info}"
+        if manifest is not None:
+            message += f". Manifest saved as: {manifest.path}"
 
         return TextContent(type="text", text=message)
 
     elif output_mode in ["resources", "both"]:
-        # Return list of EmbeddedResource objects
-        embedded_resources = []
-        for result in results:
-            if isinstance(result, EmbeddedResource):
-                embedded_resources.append(result)
-
-        if not embedded_resources:
+        # EmbeddedResource objects, and links to outputs too large to inline
+        contents = [result.content for result in results]
+        if not contents:
             return TextContent(type="text", text="No files generated")
-
-        return embedded_resources
+        if manifest is not None:
+            contents.append(manifest.content)
+        return contents
 
     else:
         raise ValueError(
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+
+class VoiceIndex:
+    """
+    In-memory index of the account's voices.
+
+    Populated from a loader (normally paging through `voices.search`) and
+    refreshed once older than ttl seconds or when invalidated, so name and ID
+    lookups don't need an API round-trip per tool call.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[list[Any]]],
+        ttl: float = 300,
+        fuzzy_threshold: int = 80,
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.fuzzy_threshold = fuzzy_threshold
+        self.refreshes = 0
+        self.lookups = 0
+        self.fuzzy_matches = 0
+        self._voices: list[Any] = []
+        self._by_id: dict[str, Any] = {}
+        self._by_name: dict[str, Any] = {}
+        self._by_casefold_name: dict[str, Any] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl
+        )
+
+    async def refresh(self) -> None:
+        voices = await self.loader()
+        by_id, by_name, by_casefold_name = {}, {}, {}
+        for voice in voices:
+            by_id[voice.voice_id] = voice
+            if voice.name:
+                by_name.setdefault(voice.name, voice)
+                by_casefold_name.setdefault(voice.name.casefold(), voice)
+        self._voices = voices
+        self._by_id = by_id
+        self._by_name = by_name
+        self._by_casefold_name = by_casefold_name
+        self._loaded_at = time.monotonic()
+        self.refreshes += 1
+
+    async def ensure_fresh(self) -> None:
+        if self._is_fresh():
+            return
+        async with self._lock:
+            # Another task may have refreshed while we waited for the lock
+            if not self._is_fresh():
+                await self.refresh()
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    async def get(self, voice_id: str) -> Any | None:
+        await self.ensure_fresh()
+        self.lookups += 1
+        return self._by_id.get(voice_id)
+
+    async def resolve(self, name: str) -> Any | None:
+        """Find a voice by exact name, then case-insensitive name, then the closest fuzzy match."""
+        await self.ensure_fresh()
+        self.lookups += 1
+        voice = self._by_name.get(name) or self._by_casefold_name.get(name.casefold())
+        if voice is not None:
+            return voice
+
+        # Only fuzzy lookups need the matcher, so it isn't imported at startup
+        from fuzzywuzzy import fuzz
+
+        best_score, best_voice = 0, None
+        for candidate in self._voices:
+            if not candidate.name:
+                continue
+            score = fuzz.token_sort_ratio(name, candidate.name)
+            if score > best_score:
+                best_score, best_voice = score, candidate
+        if best_score >= self.fuzzy_threshold:
+            self.fuzzy_matches += 1
+            return best_voice
+        return None
+
+    async def search(
+        self,
+        search: str | None = None,
+        sort: str = "name",
+        sort_direction: str = "desc",
+    ) -> list[Any]:
+        """Filter voices on name, description, labels and category."""
+        await self.ensure_fresh()
+        self.lookups += 1
+        voices = self._voices
+        if search:
+            term = search.casefold()
+            voices = [
+                voice
+                for voice in voices
+                if any(
+                    term in str(field).casefold()
+                    for field in (
+                        voice.name,
+                        voice.description,
+                        voice.category,
+                        *(voice.labels or {}).values(),
+                    )
+                    if field
+                )
+            ]
+        reverse = sort_direction == "desc"
+        if sort == "created_at_unix":
+            return sorted(
+                voices, key=lambda voice: voice.created_at_unix or 0, reverse=reverse
+            )
+        return sorted(
+            voices, key=lambda voice: (voice.name or "").casefold(), reverse=reverse
+        )
+
+    def stats(self) -> dict:
+        return {
+            "voices": len(self._voices),
+            "age_seconds": (
+                round(time.monotonic() - self._loaded_at, 1)
+                if self._loaded_at is not None
+                else None
+            ),
+            "ttl_seconds": self.ttl,
+            "refreshes": self.refreshes,
+            "lookups": self.lookups,
+            "fuzzy_matches": self.fuzzy_matches,
+        }
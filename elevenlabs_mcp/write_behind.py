@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+
+# Outcomes of this many recent writes are kept for status queries
+WRITE_HISTORY_SIZE = 1024
+
+
+class WriteBehindQueue:
+    """
+    Writes generated files to disk on a pool of worker threads.
+
+    Callers get control back as soon as a write is queued. At most max_pending
+    writes wait at once; when the queue is full the file is written in the
+    caller's thread instead, which bounds the memory held by queued files and
+    slows producers down to the speed of the disk. The data of a queued file
+    stays readable through pending_data until it has been written.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[Path, bytes], None],
+        workers: int = 4,
+        max_pending: int = 64,
+    ):
+        self.writer = writer
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.written = 0
+        self.failed = 0
+        self.written_inline = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="elevenlabs-write"
+        )
+        self._pending: dict[str, bytes] = {}
+        self._history: OrderedDict[str, str] = OrderedDict()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def _record(self, key: str, status: str) -> None:
+        self._history[key] = status
+        self._history.move_to_end(key)
+        while len(self._history) > WRITE_HISTORY_SIZE:
+            self._history.popitem(last=False)
+
+    def _write(self, key: str, full_file_path: Path, file_data: bytes) -> None:
+        try:
+            self.writer(full_file_path, file_data)
+            status = "written"
+        except Exception as e:
+            status = f"failed: {e}"
+        with self._lock:
+            self._pending.pop(key, None)
+            if status == "written":
+                self.written += 1
+            else:
+                self.failed += 1
+            self._record(key, status)
+            self._idle.notify_all()
+
+    def submit(self, full_file_path: Path, file_data: bytes) -> bool:
+        """
+        Queue a file to be written.
+
+        Returns:
+            bool: True if the write was queued, False if the queue was full or
+                closed and the file has already been written
+        """
+        key = str(full_file_path)
+        with self._lock:
+            queued = not self._closed and len(self._pending) < self.max_pending
+            if queued:
+                self._pending[key] = file_data
+                self._record(key, "pending")
+        if queued:
+            self._executor.submit(self._write, key, full_file_path, file_data)
+            return True
+
+        self.writer(full_file_path, file_data)
+        with self._lock:
+            self.written += 1
+            self.written_inline += 1
+            self._record(key, "written")
+        return False
+
+    def pending_data(self, full_file_path: Path) -> bytes | None:
+        """Contents of a file that is queued but not written yet."""
+        with self._lock:
+            return self._pending.get(str(full_file_path))
+
+    def status(self, full_file_path: Path) -> str:
+        """'pending', 'written', 'failed: <error>', or 'unknown' for files this queue hasn't seen recently."""
+        with self._lock:
+            return self._history.get(str(full_file_path), "unknown")
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for every queued write to finish; False if some are still pending after timeout."""
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Stop accepting queued writes, wait for the pending ones and stop the workers."""
+        with self._lock:
+            self._closed = True
+        flushed = self.flush(timeout)
+        self._executor.shutdown(wait=flushed)
+        return flushed
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "workers": self.workers,
+                "written": self.written,
+                "written_inline": self.written_inline,
+                "failed": self.failed,
+                "recent_failures": {
+                    path: status
+                    for path, status in self._history.items()
+                    if status.startswith("failed")
+                },
+            }
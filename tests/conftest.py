@@ -1,5 +1,6 @@
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 import tempfile
 
 
@@ -21,3 +22,42 @@ def sample_video_file(temp_dir):
     video_file = temp_dir / "test.mp4"
     video_file.touch()
     return video_file
+
+
+@pytest.fixture(scope="session")
+def server_module(tmp_path_factory):
+    """The server module, imported once with a test API key and its own cache directory."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test")
+        monkeypatch.setenv("ELEVENLABS_MCP_OUTPUT_MODE", "files")
+        monkeypatch.setenv(
+            "ELEVENLABS_MCP_CACHE_DIR", str(tmp_path_factory.mktemp("cache"))
+        )
+        from elevenlabs_mcp import server
+
+    return server
+
+
+@pytest.fixture
+def server(server_module, temp_dir, monkeypatch):
+    """
+    Server module writing its files to temp_dir.
+
+    The API client has no endpoints, so a test stubs what it calls and
+    anything else fails instead of reaching the real API.
+    """
+    from elevenlabs_mcp.voices import VoiceIndex
+
+    monkeypatch.setattr(server_module, "base_path", str(temp_dir))
+    monkeypatch.setattr(server_module, "output_mode", "files")
+    monkeypatch.setattr(server_module, "tts_cache", None)
+    monkeypatch.setattr(server_module, "client", SimpleNamespace())
+
+    async def voices():
+        return [
+            SimpleNamespace(voice_id="voice_adam", name="Adam"),
+            SimpleNamespace(voice_id="voice_rachel", name="Rachel"),
+        ]
+
+    monkeypatch.setattr(server_module, "voice_index", VoiceIndex(voices))
+    return server_module
@@ -0,0 +1,63 @@
+from elevenlabs_mcp.cache import ResourceCache, TTSCache
+
+
+SETTINGS = {"stability": 0.5, "similarity_boost": 0.75}
+
+
+def test_make_key_depends_on_all_inputs():
+    key = TTSCache.make_key("Hello", "voice", "model", SETTINGS, "mp3_44100_128")
+    assert key == TTSCache.make_key(
+        "Hello", "voice", "model", dict(reversed(SETTINGS.items())), "mp3_44100_128"
+    )
+    assert key != TTSCache.make_key("Hello", "voice", "model", SETTINGS, "pcm_16000")
+    assert key != TTSCache.make_key(
+        "Hello!", "voice", "model", SETTINGS, "mp3_44100_128"
+    )
+
+
+def test_get_and_put(temp_dir):
+    cache = TTSCache(temp_dir, max_bytes=1024)
+    assert cache.get("missing") is None
+    cache.put("key", b"audio")
+    assert cache.get("key") == b"audio"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_lru_eviction(temp_dir):
+    cache = TTSCache(temp_dir, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.get("a")
+    cache.put("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_persists_across_instances(temp_dir):
+    TTSCache(temp_dir, max_bytes=1024).put("key", b"audio")
+    cache = TTSCache(temp_dir, max_bytes=1024)
+    assert cache.stats()["bytes"] == 5
+    assert cache.get("key") == b"audio"
+
+
+def test_resource_cache(temp_dir):
+    path = temp_dir / "audio.mp3"
+    path.write_bytes(b"audio")
+    cache = ResourceCache(max_bytes=10, max_entry_bytes=6)
+    key = ResourceCache.make_key(path, path.stat())
+    cache.put(key, "encoded", 6)
+    assert cache.get(key) == "encoded"
+
+    path.write_bytes(b"changed audio")
+    assert cache.get(ResourceCache.make_key(path, path.stat())) is None
+
+    cache.put("large", "value", 7)
+    assert cache.get("large") is None
+    cache.put("a", "value", 6)
+    assert cache.get(key) is None
+    assert cache.stats()["entries"] == 1
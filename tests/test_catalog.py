@@ -0,0 +1,92 @@
+import asyncio
+import json
+from elevenlabs_mcp.catalog import ModelCatalog, fallback_model
+
+
+def make_model(model_id, languages, can_do_text_to_speech=True, limit=10000):
+    return {
+        "model_id": model_id,
+        "name": model_id,
+        "can_do_text_to_speech": can_do_text_to_speech,
+        "maximum_text_length_per_request": limit,
+        "languages": [{"language_id": lang, "name": lang} for lang in languages],
+    }
+
+
+MODELS = [
+    make_model("eleven_multilingual_v2", ["en", "de"]),
+    make_model("eleven_flash_v2_5", ["en", "de", "hu"], limit=40000),
+    make_model("eleven_turbo_v2", ["en"], limit=30000),
+    make_model("eleven_english_sts_v2", ["en", "vi"], can_do_text_to_speech=False),
+]
+
+
+def make_catalog(path=None, ttl=86400, models=MODELS):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        if isinstance(models, Exception):
+            raise models
+        return models
+
+    return ModelCatalog(loader, path, ttl=ttl), calls
+
+
+def test_best_model_per_language():
+    catalog, calls = make_catalog()
+
+    async def run():
+        return [
+            await catalog.best_model("en"),
+            await catalog.best_model("HU"),
+            await catalog.best_model("vi"),
+            await catalog.best_model("en", "agent"),
+        ]
+
+    assert asyncio.run(run()) == [
+        "eleven_multilingual_v2",
+        "eleven_flash_v2_5",
+        None,
+        "eleven_turbo_v2",
+    ]
+    assert len(calls) == 1
+    assert catalog.character_limit("eleven_flash_v2_5") == 40000
+    assert catalog.character_limit("unknown") is None
+
+
+def test_persists_to_disk(temp_dir):
+    path = temp_dir / "models.json"
+    catalog, _ = make_catalog(path)
+    asyncio.run(catalog.ensure_fresh())
+    assert json.loads(path.read_text())["models"] == MODELS
+
+    reloaded, calls = make_catalog(path)
+    assert asyncio.run(reloaded.best_model("hu")) == "eleven_flash_v2_5"
+    assert calls == []
+
+
+def test_refreshes_after_ttl(temp_dir):
+    path = temp_dir / "models.json"
+    catalog, _ = make_catalog(path)
+    asyncio.run(catalog.ensure_fresh())
+
+    expired, calls = make_catalog(path, ttl=0)
+    asyncio.run(expired.ensure_fresh())
+    assert len(calls) == 1
+
+
+def test_stale_catalog_used_when_refresh_fails(temp_dir):
+    path = temp_dir / "models.json"
+    asyncio.run(make_catalog(path)[0].ensure_fresh())
+
+    catalog, calls = make_catalog(path, ttl=0, models=RuntimeError("offline"))
+    assert asyncio.run(catalog.best_model("de")) == "eleven_multilingual_v2"
+    assert len(calls) == 1
+
+
+def test_fallback_model_without_catalog():
+    assert fallback_model("en") == "eleven_multilingual_v2"
+    assert fallback_model("HU") == "eleven_flash_v2_5"
+    assert fallback_model("vi") == "eleven_flash_v2_5"
+    assert fallback_model("hu", "agent") == "eleven_turbo_v2"
@@ -0,0 +1,44 @@
+import pytest
+from elevenlabs_mcp.chunking import (
+    split_text,
+    get_character_limit,
+    DEFAULT_CHARACTER_LIMIT,
+)
+
+
+def test_split_text_short_text_is_one_chunk():
+    assert split_text("  Hello world.  ", 100) == ["Hello world."]
+
+
+def test_split_text_prefers_sentence_boundaries():
+    text = "First sentence here. Second sentence here. Third sentence here."
+    chunks = split_text(text, 45)
+    assert chunks == [
+        "First sentence here. Second sentence here.",
+        "Third sentence here.",
+    ]
+
+
+def test_split_text_packs_paragraphs():
+    text = "One.\n\nTwo.\n\n" + "Three is a much longer paragraph."
+    chunks = split_text(text, 12)
+    assert chunks[0] == "One.\n\nTwo."
+    assert all(len(chunk) <= 12 for chunk in chunks)
+
+
+def test_split_text_oversized_sentence():
+    text = "word " * 100
+    chunks = split_text(text, 30)
+    assert all(len(chunk) <= 30 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+    assert split_text("a" * 25, 10) == ["a" * 10, "a" * 10, "a" * 5]
+
+
+def test_split_text_invalid_limit():
+    with pytest.raises(ValueError):
+        split_text("Hello", 0)
+
+
+def test_get_character_limit():
+    assert get_character_limit("eleven_flash_v2_5") == 40000
+    assert get_character_limit("unknown_model") == DEFAULT_CHARACTER_LIMIT
@@ -0,0 +1,59 @@
+import httpx
+import pytest
+from elevenlabs_mcp.client import (
+    DEFAULT_MAX_CONNECTIONS,
+    LazyClient,
+    create_http_client,
+    get_connection_limits,
+)
+from elevenlabs_mcp.rate_limit import RateLimitedTransport, RateLimiter
+
+
+def test_get_connection_limits_defaults(monkeypatch):
+    monkeypatch.delenv("ELEVENLABS_MCP_MAX_CONNECTIONS", raising=False)
+    monkeypatch.delenv("ELEVENLABS_MCP_MAX_KEEPALIVE_CONNECTIONS", raising=False)
+    limits = get_connection_limits()
+    assert limits.max_connections == DEFAULT_MAX_CONNECTIONS
+    assert limits.max_keepalive_connections <= limits.max_connections
+
+
+def test_get_connection_limits_from_env(monkeypatch):
+    monkeypatch.setenv("ELEVENLABS_MCP_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("ELEVENLABS_MCP_MAX_KEEPALIVE_CONNECTIONS", "50")
+    monkeypatch.setenv("ELEVENLABS_MCP_KEEPALIVE_EXPIRY", "5")
+    limits = get_connection_limits()
+    assert limits.max_connections == 8
+    assert limits.max_keepalive_connections == 8
+    assert limits.keepalive_expiry == 5.0
+
+
+def test_get_connection_limits_invalid(monkeypatch):
+    monkeypatch.setenv("ELEVENLABS_MCP_MAX_CONNECTIONS", "many")
+    with pytest.raises(ValueError):
+        get_connection_limits()
+
+
+def test_create_http_client():
+    client = create_http_client()
+    assert isinstance(client, httpx.AsyncClient)
+    assert client.headers["User-Agent"].startswith("ElevenLabs-MCP/")
+
+
+def test_create_http_client_with_rate_limiter():
+    client = create_http_client(RateLimiter(concurrency={"tts": 2}))
+    assert isinstance(client._transport, RateLimitedTransport)
+    assert client.headers["User-Agent"].startswith("ElevenLabs-MCP/")
+
+
+def test_lazy_client_constructs_on_first_use():
+    created = []
+
+    def factory():
+        created.append(httpx.Limits(max_connections=3))
+        return created[-1]
+
+    client = LazyClient(factory)
+    assert created == []
+    assert client.max_connections == 3
+    assert client.get() is created[0]
+    assert len(created) == 1
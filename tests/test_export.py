@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import pytest
+
+from elevenlabs_mcp.export import (
+    ConversationPage,
+    export_conversation_pages,
+    state_file_for,
+)
+
+
+class FakeConversations:
+    """Conversation list of 25 conversations in pages of 10, with optional failures."""
+
+    def __init__(self, count: int = 25, page_size: int = 10):
+        self.ids = [f"conv_{i:03d}" for i in range(count)]
+        self.page_size = page_size
+        self.fail = set()
+        self.fail_listing_at = None
+        self.fetched = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_page(self, cursor: str | None) -> ConversationPage:
+        start = int(cursor or 0)
+        if start == self.fail_listing_at:
+            raise ConnectionError("listing failed")
+        end = start + self.page_size
+        return ConversationPage(
+            self.ids[start:end],
+            next_cursor=str(end),
+            has_more=end < len(self.ids),
+        )
+
+    async def fetch(self, conversation_id: str) -> dict:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if conversation_id in self.fail:
+                raise RuntimeError("server error")
+            self.fetched.append(conversation_id)
+            return {"transcript": [{"role": "user", "message": conversation_id}]}
+        finally:
+            self.in_flight -= 1
+
+    def export(self, output_file, **kwargs):
+        return asyncio.run(
+            export_conversation_pages(self.list_page, self.fetch, output_file, **kwargs)
+        )
+
+
+def _exported_ids(output_file) -> list[str]:
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    return sorted(json.loads(line)["conversation_id"] for line in lines)
+
+
+def test_export_walks_all_pages_with_bounded_concurrency(tmp_path):
+    conversations = FakeConversations()
+    output_file = tmp_path / "conversations.jsonl"
+
+    result = conversations.export(output_file, max_concurrency=4)
+
+    assert result.complete
+    assert result.exported == 25
+    assert result.pages == 3
+    assert conversations.max_in_flight == 4
+    assert _exported_ids(output_file) == conversations.ids
+    state = json.loads(state_file_for(output_file).read_text())
+    assert state["complete"] and state["cursor"] is None
+
+
+def test_export_resumes_after_interruption(tmp_path):
+    conversations = FakeConversations()
+    conversations.fail_listing_at = 20
+    output_file = tmp_path / "conversations.jsonl"
+
+    with pytest.raises(ConnectionError):
+        conversations.export(output_file, max_concurrency=4)
+    assert _exported_ids(output_file) == conversations.ids[:20]
+    assert json.loads(state_file_for(output_file).read_text())["cursor"] == "20"
+
+    # A crash while writing leaves half a line, which is dropped and fetched again
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write('{"conversation_id": "conv_0')
+    conversations.fail_listing_at = None
+    conversations.fetched.clear()
+    result = conversations.export(output_file, max_concurrency=4)
+
+    assert result.complete
+    assert sorted(conversations.fetched) == conversations.ids[20:]
+    assert _exported_ids(output_file) == conversations.ids
+
+
+def test_export_retries_failures_and_skips_exported_conversations(tmp_path):
+    conversations = FakeConversations()
+    conversations.fail = {"conv_003", "conv_017"}
+    output_file = tmp_path / "conversations.jsonl"
+
+    result = conversations.export(output_file)
+    assert result.complete
+    assert result.exported == 23
+    assert set(result.failed) == {"conv_003", "conv_017"}
+
+    conversations.fail.clear()
+    conversations.fetched.clear()
+    result = conversations.export(output_file)
+    assert sorted(conversations.fetched) == ["conv_003", "conv_017"]
+    assert result.skipped == 23
+    assert not result.failed
+    assert _exported_ids(output_file) == conversations.ids
+
+    # Other filters belong to another export
+    with pytest.raises(ValueError):
+        conversations.export(output_file, filters={"agent_id": "agent_1"})
+    result = conversations.export(output_file, resume=False)
+    assert result.exported == 25
+    assert _exported_ids(output_file) == conversations.ids
+
+
+def test_export_leaves_unrelated_files_alone(tmp_path):
+    conversations = FakeConversations()
+    output_file = tmp_path / "notes.jsonl"
+    output_file.write_text('{"a": 1}\n{"b": 2}\n', encoding="utf-8")
+
+    # Without a state file the existing file is not an export
+    with pytest.raises(ValueError, match="not an export to resume"):
+        conversations.export(output_file)
+    assert output_file.read_text(encoding="utf-8") == '{"a": 1}\n{"b": 2}\n'
+    assert not state_file_for(output_file).exists()
+
+    # A complete line that is not a conversation is not cut off either
+    conversations.export(output_file, resume=False)
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write('{"a": 1}\n')
+    content = output_file.read_text(encoding="utf-8")
+    with pytest.raises(ValueError, match="Line 26 .* is not an exported conversation"):
+        conversations.export(output_file)
+    assert output_file.read_text(encoding="utf-8") == content
@@ -0,0 +1,32 @@
+from elevenlabs_mcp import file_index
+from elevenlabs_mcp.file_index import get_filename_index
+
+
+def test_finds_similar_names_in_large_directory(temp_dir, monkeypatch):
+    monkeypatch.setattr(file_index, "MAX_CANDIDATES", 16)
+    for i in range(200):
+        (temp_dir / f"recording_{i:04d}.mp3").touch()
+    (temp_dir / "team meeting notes.mp3").touch()
+
+    matches = get_filename_index(temp_dir).find_similar("notes meeting team.mp3")
+    assert matches[0] == (temp_dir / "team meeting notes.mp3", 100)
+
+
+def test_rebuilt_when_directory_changes(temp_dir):
+    (temp_dir / "interview.mp3").touch()
+    index = get_filename_index(temp_dir)
+    assert get_filename_index(temp_dir) is index
+
+    (temp_dir / "interview_2.mp3").touch()
+    assert index.is_stale()
+    matches = get_filename_index(temp_dir).find_similar("interview_3.mp3")
+    assert {path.name for path, _ in matches} == {"interview.mp3", "interview_2.mp3"}
+
+
+def test_subdirectories_only_when_recursive(temp_dir):
+    (temp_dir / "nested").mkdir()
+    (temp_dir / "nested" / "podcast.mp3").touch()
+    assert get_filename_index(temp_dir).find_similar("podcast.mp3") == []
+    assert get_filename_index(temp_dir, recursive=True).find_similar("podcast.mp3") == [
+        (temp_dir / "nested" / "podcast.mp3", 100)
+    ]
@@ -0,0 +1,98 @@
+import json
+from types import SimpleNamespace
+from elevenlabs_mcp.formatting import (
+    TranscriptSegment,
+    format_diarized_transcript,
+    format_srt,
+    format_transcript_json,
+    format_vtt,
+    iter_segments,
+)
+
+
+def make_transcription(words, as_dicts=False):
+    entries = []
+    for text, start, speaker in words:
+        entries.append(
+            {
+                "text": text,
+                "start": start,
+                "end": start + 0.5,
+                "type": "word",
+                "speaker_id": speaker,
+            }
+        )
+        entries.append(
+            {
+                "text": " ",
+                "start": start + 0.5,
+                "end": start + 0.6,
+                "type": "spacing",
+                "speaker_id": speaker,
+            }
+        )
+    if not as_dicts:
+        entries = [SimpleNamespace(**entry) for entry in entries]
+    return SimpleNamespace(
+        language_code="en",
+        text=" ".join(text for text, _, _ in words),
+        words=entries,
+    )
+
+
+WORDS = [
+    ("Hello", 0.0, "speaker_0"),
+    ("there.", 0.6, "speaker_0"),
+    ("Hi!", 1.2, "speaker_1"),
+    ("Bye.", 3661.0, "speaker_0"),
+]
+
+
+def test_iter_segments_groups_speaker_runs():
+    for as_dicts in (False, True):
+        assert list(iter_segments(make_transcription(WORDS, as_dicts))) == [
+            TranscriptSegment("speaker_0", 0.0, 1.1, "Hello there."),
+            TranscriptSegment("speaker_1", 1.2, 1.7, "Hi!"),
+            TranscriptSegment("speaker_0", 3661.0, 3661.5, "Bye."),
+        ]
+
+
+def test_iter_segments_splits_long_runs():
+    segments = list(iter_segments(make_transcription(WORDS), max_chars=6))
+    assert [segment.text for segment in segments] == ["Hello", "there.", "Hi!", "Bye."]
+
+
+def test_format_diarized_transcript():
+    assert format_diarized_transcript(make_transcription(WORDS)) == (
+        "SPEAKER 0: Hello there.\n\nSPEAKER 1: Hi!\n\nSPEAKER 0: Bye."
+    )
+
+
+def test_format_diarized_transcript_falls_back_to_text():
+    transcription = SimpleNamespace(text="Plain text", words=[])
+    assert format_diarized_transcript(transcription) == "Plain text"
+
+
+def test_subtitles():
+    transcription = make_transcription(WORDS)
+    srt = format_srt(transcription)
+    assert srt.startswith(
+        "1\n00:00:00,000 --> 00:00:01,100\n[SPEAKER 0] Hello there.\n"
+    )
+    assert "3\n01:01:01,000 --> 01:01:01,500\n[SPEAKER 0] Bye.\n" in srt
+
+    vtt = format_vtt(transcription)
+    assert vtt.startswith(
+        "WEBVTT\n\n00:00:00.000 --> 00:00:01.100\n<v SPEAKER 0>Hello there.\n"
+    )
+
+
+def test_format_transcript_json():
+    data = json.loads(format_transcript_json(make_transcription(WORDS, as_dicts=True)))
+    assert data["language_code"] == "en"
+    assert data["segments"][1] == {
+        "speaker": "speaker_1",
+        "start": 1.2,
+        "end": 1.7,
+        "text": "Hi!",
+    }
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import httpx
+
+from elevenlabs_mcp.rate_limit import (
+    RateLimitedTransport,
+    RateLimiter,
+    create_rate_limiter,
+    endpoint_family,
+    parse_retry_after,
+)
+
+
+def test_endpoint_family():
+    assert endpoint_family("/v1/text-to-speech/voice1/stream") == "tts"
+    assert endpoint_family("/v1/speech-to-text") == "stt"
+    assert endpoint_family("/v1/music/plan") == "music"
+    assert endpoint_family("/v1/convai/agents/abc") == "convai"
+    assert endpoint_family("/v2/voices") == "other"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_rate_limiter_caps_concurrency_per_family():
+    limiter = RateLimiter(concurrency={"tts": 2})
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.02)
+        in_flight["now"] -= 1
+        return httpx.Response(200, content=b"audio")
+
+    async def run():
+        transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+        async with httpx.AsyncClient(transport=transport) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post(f"https://api.test/v1/text-to-speech/voice{i}")
+                    for i in range(8)
+                )
+            )
+        return [response.content for response in responses]
+
+    assert asyncio.run(run()) == [b"audio"] * 8
+    assert in_flight["max"] == 2
+    stats = limiter.stats()["families"]["tts"]
+    assert stats["requests"] == 8
+    assert stats["in_flight"] == 0
+    assert stats["max_queued"] >= 5
+    assert stats["waited"] >= 6
+
+
+def test_rate_limiter_token_bucket_and_throttling():
+    limiter = RateLimiter(rate=50, burst=1)
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0.2"})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses, httpx.Response(200))
+
+    async def run() -> list[int]:
+        transport = RateLimitedTransport(httpx.MockTransport(handler), limiter)
+        async with httpx.AsyncClient(transport=transport) as client:
+            start = time.monotonic()
+            statuses = [(await client.get("https://api.test/v2/voices")).status_code]
+            # The 429 holds back the next request for its Retry-After
+            statuses.append(
+                (await client.get("https://api.test/v2/voices")).status_code
+            )
+            assert time.monotonic() - start >= 0.15
+            start = time.monotonic()
+            for _ in range(5):
+                await client.get("https://api.test/v1/models")
+            assert time.monotonic() - start >= 0.07
+        return statuses
+
+    assert asyncio.run(run()) == [429, 200]
+    assert limiter.stats()["families"]["other"]["throttled"] == 1
+
+
+def test_rate_limiter_tier_caps_keep_configured_caps():
+    limiter = RateLimiter(concurrency={"music": 1})
+    limiter.apply_tier("Creator")
+    limits = {
+        family: stats["limit"] for family, stats in limiter.stats()["families"].items()
+    }
+    assert limits == {"tts": 5, "stt": 5, "music": 1, "convai": 5, "other": None}
+    limiter.apply_tier("unknown")
+    assert limiter.stats()["tier"] == "creator"
+
+
+def test_create_rate_limiter_zero_concurrency_is_unlimited(monkeypatch):
+    monkeypatch.delenv("ELEVENLABS_MCP_SUBSCRIPTION_TIER", raising=False)
+    monkeypatch.setenv("ELEVENLABS_MCP_CONCURRENCY_TTS", "0")
+    monkeypatch.setenv("ELEVENLABS_MCP_CONCURRENCY_STT", "3")
+    families = create_rate_limiter().stats()["families"]
+    assert families["tts"]["limit"] is None
+    assert families["stt"]["limit"] == 3
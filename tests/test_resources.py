@@ -0,0 +1,132 @@
+import asyncio
+import base64
+import os
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.types import TextContent
+from elevenlabs_mcp.resources import (
+    DeferredResources,
+    ElevenLabsFastMCP,
+    ResourceData,
+    encode_file_base64,
+)
+from elevenlabs_mcp.utils import create_saved_file_response, handle_output_mode
+
+
+def test_encode_file_base64_in_chunks(temp_dir):
+    data = os.urandom(1000)
+    path = temp_dir / "audio.mp3"
+    path.write_bytes(data)
+    for chunk_size in (3, 100, 4096):
+        assert (
+            encode_file_base64(path, chunk_size=chunk_size)
+            == base64.b64encode(data).decode()
+        )
+
+
+def test_encode_file_base64_range(temp_dir):
+    data = os.urandom(1000)
+    path = temp_dir / "audio.mp3"
+    path.write_bytes(data)
+    assert (
+        base64.b64decode(encode_file_base64(path, 10, 20, chunk_size=6)) == data[10:30]
+    )
+    assert base64.b64decode(encode_file_base64(path, 990, 20)) == data[990:]
+    assert encode_file_base64(path, 2000, 20) == ""
+
+
+def read(mcp, uri):
+    request = types.ReadResourceRequest(
+        method="resources/read", params=types.ReadResourceRequestParams(uri=uri)
+    )
+    handler = mcp._mcp_server.request_handlers[types.ReadResourceRequest]
+    return asyncio.run(handler(request)).root.contents[0]
+
+
+def test_resource_data_sent_as_is():
+    mcp = ElevenLabsFastMCP("test")
+
+    @mcp.resource("test://{name}")
+    async def encoded(name: str) -> ResourceData:
+        return ResourceData("audio/mpeg", blob="AAAA")
+
+    @mcp.resource("plain://{name}")
+    def plain(name: str) -> bytes:
+        return b"\x00"
+
+    contents = read(mcp, "test://a.mp3")
+    assert (contents.mimeType, contents.blob) == ("audio/mpeg", "AAAA")
+    assert read(mcp, "plain://a").blob == "AA=="
+
+
+def test_deferred_resources_evict_oldest_outputs():
+    deferred = DeferredResources(max_inline_bytes=10, max_bytes=25)
+    assert not deferred.should_defer(10)
+    assert deferred.should_defer(11)
+
+    assert deferred.add("a.mp3", b"a" * 10) == "elevenlabs://outputs/a.mp3"
+    deferred.add("b.mp3", b"b" * 10)
+    deferred.get("a.mp3")
+    deferred.add("c.mp3", b"c" * 10)
+
+    # b.mp3 was the least recently used once a.mp3 was read
+    assert deferred.get("b.mp3") is None
+    assert deferred.get("a.mp3") == b"a" * 10
+    assert deferred.stats()["evictions"] == 1
+
+
+def test_large_outputs_returned_by_uri(temp_dir):
+    deferred = DeferredResources(max_inline_bytes=100, max_bytes=1000)
+
+    small = handle_output_mode(
+        b"x" * 100, temp_dir, "small.mp3", "both", deferred=deferred
+    )
+    assert small.type == "resource"
+
+    large = handle_output_mode(
+        b"x" * 101, temp_dir, "large.mp3", "both", deferred=deferred
+    )
+    assert isinstance(large, TextContent)
+    assert "elevenlabs://outputs/large.mp3" in large.text
+    assert deferred.get("large.mp3") == temp_dir / "large.mp3"
+    assert (temp_dir / "large.mp3").read_bytes() == b"x" * 101
+
+
+def test_saved_file_response_defers_large_files(temp_dir):
+    deferred = DeferredResources(max_inline_bytes=100, max_bytes=1000)
+    small_path = temp_dir / "small.mp3"
+    small_path.write_bytes(b"x" * 100)
+    large_path = temp_dir / "large.mp3"
+    large_path.write_bytes(b"x" * 101)
+
+    small = create_saved_file_response(small_path, deferred)
+    assert small.type == "resource"
+    assert base64.b64decode(small.resource.blob) == b"x" * 100
+
+    large = create_saved_file_response(large_path, deferred)
+    assert isinstance(large, TextContent)
+    assert "elevenlabs://outputs/large.mp3" in large.text
+    assert deferred.get("large.mp3") == large_path
+
+    assert create_saved_file_response(large_path).type == "resource"
+
+
+def test_read_resource_override_matches_fastmcp():
+    # ElevenLabsFastMCP replaces FastMCP's private read handler from _setup_handlers;
+    # this fails when an mcp upgrade renames either or changes what reads return
+    servers = [FastMCP("stock"), ElevenLabsFastMCP("test")]
+    for mcp in servers:
+
+        @mcp.resource("text://{name}", mime_type="text/plain")
+        def text(name: str) -> str:
+            return f"hello {name}"
+
+        @mcp.resource("json://{name}")
+        async def data(name: str) -> dict:
+            return {"name": name}
+
+    stock, ours = servers
+    handler = ours._mcp_server.request_handlers[types.ReadResourceRequest]
+    assert handler == ours._handle_read_resource
+    for uri in ("text://a", "json://b"):
+        assert read(ours, uri) == read(stock, uri)
@@ -0,0 +1,187 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from elevenlabs_mcp.rate_limit import RateLimitedTransport, RateLimiter
+from elevenlabs_mcp.retry import RetryPolicy, RetryTransport, create_retry_policy
+
+
+def _client(handler, policy: RetryPolicy) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=RetryTransport(httpx.MockTransport(handler), policy)
+    )
+
+
+def _faults(*outcomes):
+    """Handler answering with each outcome in turn, then 200; exceptions are raised."""
+    requests = []
+    remaining = list(outcomes)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.read())
+        outcome = remaining.pop(0) if remaining else httpx.Response(200)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return handler, requests
+
+
+def test_retry_recovers_idempotent_requests():
+    policy = RetryPolicy(max_retries=3, base_delay=0.01)
+    handler, requests = _faults(
+        httpx.Response(503),
+        httpx.ReadError("connection reset"),
+        httpx.Response(502),
+    )
+
+    async def run() -> int:
+        async with _client(handler, policy) as client:
+            return (await client.get("https://api.test/v1/voices/abc")).status_code
+
+    assert asyncio.run(run()) == 200
+    assert len(requests) == 4
+    stats = policy.stats()
+    assert stats["retries"] == 3
+    assert stats["recovered"] == 1
+
+
+def test_retry_gives_up_after_max_retries():
+    policy = RetryPolicy(max_retries=1, base_delay=0.01)
+    handler, requests = _faults(httpx.Response(503), httpx.Response(503))
+
+    async def run() -> int:
+        async with _client(handler, policy) as client:
+            return (await client.get("https://api.test/v1/models")).status_code
+
+    assert asyncio.run(run()) == 503
+    assert len(requests) == 2
+    assert policy.stats()["exhausted"] == 1
+
+
+def test_retry_honors_retry_after():
+    policy = RetryPolicy(max_retries=2, base_delay=5)
+    handler, _ = _faults(httpx.Response(429, headers={"Retry-After": "0.2"}))
+
+    async def run() -> float:
+        async with _client(handler, policy) as client:
+            start = time.monotonic()
+            assert (await client.get("https://api.test/v2/voices")).status_code == 200
+            return time.monotonic() - start
+
+    assert 0.2 <= asyncio.run(run()) < 2
+
+
+def test_retry_only_resends_posts_that_were_not_processed():
+    policy = RetryPolicy(max_retries=2, base_delay=0.01)
+
+    async def post(handler) -> int:
+        async with _client(handler, policy) as client:
+            response = await client.post(
+                "https://api.test/v1/text-to-speech/voice",
+                files={"file": ("audio.mp3", b"audio bytes")},
+            )
+            return response.status_code
+
+    # A 5xx may have generated audio already
+    handler, requests = _faults(httpx.Response(500))
+    assert asyncio.run(post(handler)) == 500
+    assert len(requests) == 1
+
+    # A 429 or a failed connection never reached the generation step
+    handler, requests = _faults(
+        httpx.Response(429), httpx.ConnectError("connection refused")
+    )
+    assert asyncio.run(post(handler)) == 200
+    assert len(requests) == 3
+    assert requests[0] == requests[2]
+    assert b"audio bytes" in requests[2]
+
+    handler, requests = _faults(httpx.ReadTimeout("timed out"))
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(post(handler))
+    assert len(requests) == 1
+
+    # A body read from a generator is used up by the first send
+    async def upload():
+        yield b"audio bytes"
+
+    async def post_stream(handler) -> int:
+        async with _client(handler, policy) as client:
+            response = await client.post(
+                "https://api.test/v1/speech-to-text", content=upload()
+            )
+            return response.status_code
+
+    handler, requests = _faults(httpx.Response(429))
+    assert asyncio.run(post_stream(handler)) == 429
+    assert len(requests) == 1
+
+
+def test_hedged_get_returns_the_first_response():
+    policy = RetryPolicy(max_retries=0, hedge_after=0.05)
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(2)
+        return httpx.Response(200, json={"attempt": len(calls)})
+
+    async def run() -> tuple[dict, float]:
+        async with _client(handler, policy) as client:
+            start = time.monotonic()
+            response = await client.get("https://api.test/v1/convai/agents/abc")
+            return response.json(), time.monotonic() - start
+
+    body, elapsed = asyncio.run(run())
+    assert body == {"attempt": 2}
+    assert elapsed < 1
+    assert policy.stats()["hedged"] == 1
+    assert policy.stats()["hedges_won"] == 1
+
+
+def test_create_retry_policy_zero_disables_retries_and_hedging(monkeypatch):
+    monkeypatch.setenv("ELEVENLABS_MCP_MAX_RETRIES", "0")
+    monkeypatch.setenv("ELEVENLABS_MCP_HEDGE_AFTER_MS", "0")
+    policy = create_retry_policy()
+    assert policy.max_retries == 0
+    assert policy.hedge_after == 0
+
+    monkeypatch.setenv("ELEVENLABS_MCP_MAX_RETRIES", "-1")
+    with pytest.raises(ValueError, match="at least 0"):
+        create_retry_policy()
+
+
+def test_cancelled_hedged_get_gives_back_its_rate_limit_slot():
+    policy = RetryPolicy(max_retries=0, hedge_after=0.5)
+    limiter = RateLimiter(concurrency={"convai": 1})
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    async def run() -> int:
+        transport = RetryTransport(
+            RateLimitedTransport(httpx.MockTransport(handler), limiter), policy
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            request = asyncio.ensure_future(
+                client.get("https://api.test/v1/convai/agents/abc")
+            )
+            await asyncio.sleep(0.05)
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+            response = await asyncio.wait_for(
+                client.get("https://api.test/v1/convai/agents/abc"), timeout=2
+            )
+            return response.status_code
+
+    assert asyncio.run(run()) == 200
+    assert limiter.stats()["families"]["convai"]["in_flight"] == 0
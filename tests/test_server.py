@@ -0,0 +1,315 @@
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from elevenlabs_mcp.model import BatchSpeechItem
+from elevenlabs_mcp.utils import ElevenLabsMcpError
+
+
+def _stub_synthesis(server, monkeypatch) -> list[dict]:
+    """Replace speech synthesis with one returning the request as bytes; returns the requests."""
+    requests = []
+
+    async def synthesize(
+        text, voice_id, model_id, voice_settings, output_format, **context
+    ):
+        requests.append(
+            {"text": text, "voice_id": voice_id, "model_id": model_id, **context}
+        )
+        # Earlier requests finish last, so results must be put back in order
+        await asyncio.sleep(0.05 / len(requests))
+        return f"{voice_id}:{text}".encode()
+
+    monkeypatch.setattr(server, "_synthesize_speech", synthesize)
+    return requests
+
+
+def _manifest(text: str) -> list[dict]:
+    manifest, _ = json.JSONDecoder().raw_decode(text.split("Manifest: ", 1)[1])
+    return manifest
+
+
+def test_batch_text_to_speech_dedupes_and_isolates_failures(
+    server, monkeypatch, temp_dir
+):
+    requests = _stub_synthesis(server, monkeypatch)
+    items = [
+        BatchSpeechItem(text="Hello there", voice_name="Adam", model_id="model_a"),
+        BatchSpeechItem(text="Hello there", voice_name="Adam", model_id="model_a"),
+        BatchSpeechItem(text="Who is this?", voice_name="Nobody", model_id="model_a"),
+        BatchSpeechItem(text="  ", voice_name="Adam", model_id="model_a"),
+    ]
+
+    result = asyncio.run(server.batch_text_to_speech(items))
+
+    assert "2/4 items succeeded, 1 files generated." in result.text
+    manifest = _manifest(result.text)
+    assert [entry["status"] for entry in manifest] == ["ok", "ok", "error", "error"]
+    assert manifest[1]["duplicate_of"] == 0
+    assert manifest[1]["file"] == manifest[0]["file"]
+    assert "Nobody" in manifest[2]["error"]
+    assert manifest[3]["error"] == "Text is required."
+
+    # One request for the duplicated item, and the voices were loaded once for all items
+    assert requests == [
+        {"text": "Hello there", "voice_id": "voice_adam", "model_id": "model_a"}
+    ]
+    assert server.voice_index.refreshes == 1
+    files = list(temp_dir.glob("*.mp3"))
+    assert [path.read_bytes() for path in files] == [b"voice_adam:Hello there"]
+    assert manifest[0]["bytes"] == len(b"voice_adam:Hello there")
+
+
+def test_batch_text_to_speech_keeps_going_after_a_failed_request(
+    server, monkeypatch, temp_dir
+):
+    async def synthesize(text, voice_id, model_id, voice_settings, output_format, **_):
+        if text == "fail":
+            raise RuntimeError("quota exceeded")
+        return text.encode()
+
+    monkeypatch.setattr(server, "_synthesize_speech", synthesize)
+    items = [
+        BatchSpeechItem(text="first", voice_id="voice_rachel", model_id="model_a"),
+        BatchSpeechItem(text="fail", voice_id="voice_rachel", model_id="model_a"),
+        BatchSpeechItem(text="third", model_id="model_a"),
+    ]
+
+    result = asyncio.run(
+        server.batch_text_to_speech(items, max_concurrency=1, save_manifest=True)
+    )
+
+    manifest = _manifest(result.text)
+    assert [entry["status"] for entry in manifest] == ["ok", "error", "ok"]
+    assert manifest[1]["error"] == "quota exceeded"
+    assert all(entry["seconds"] >= 0 for entry in manifest if entry["status"] == "ok")
+    assert len(list(temp_dir.glob("*.mp3"))) == 2
+    (manifest_file,) = temp_dir.glob("*_manifest_*.json")
+    saved = json.loads(manifest_file.read_text())
+    assert [entry["status"] for entry in saved["items"]] == ["ok", "error", "ok"]
+
+
+def test_batch_text_to_speech_rejects_bad_arguments(server):
+    with pytest.raises(ElevenLabsMcpError, match="At least one item"):
+        asyncio.run(server.batch_text_to_speech([]))
+    with pytest.raises(ElevenLabsMcpError, match="max_concurrency"):
+        asyncio.run(
+            server.batch_text_to_speech(
+                [BatchSpeechItem(text="Hello")], max_concurrency=11
+            )
+        )
+
+
+def _stub_previews(server, fail: set[str] = frozenset()) -> list[dict]:
+    """Replace the voice design endpoint with one making three previews; returns the requests."""
+    requests = []
+
+    async def create_previews(voice_description, text, auto_generate_text):
+        requests.append(
+            {
+                "voice_description": voice_description,
+                "text": text,
+                "auto_generate_text": auto_generate_text,
+            }
+        )
+        await asyncio.sleep(0.01)
+        if voice_description in fail:
+            raise RuntimeError("description rejected")
+        name = voice_description.split()[0].lower()
+        return SimpleNamespace(
+            text=text or f"Generated text for {name}",
+            previews=[
+                SimpleNamespace(
+                    audio_base_64=base64.b64encode(f"{name}{index}".encode()).decode(),
+                    generated_voice_id=f"{name}{index}",
+                    duration_secs=2.5,
+                    language="en",
+                )
+                for index in range(3)
+            ],
+        )
+
+    server.client.text_to_voice = SimpleNamespace(create_previews=create_previews)
+    return requests
+
+
+def test_text_to_voice_designs_several_voices(server, temp_dir):
+    requests = _stub_previews(server, fail={"Robot voice"})
+
+    result = asyncio.run(
+        server.text_to_voice(
+            ["Calm narrator", "Robot voice", "Excited announcer"],
+            save_manifest=True,
+        )
+    )
+
+    assert len(requests) == 3
+    assert all(request["auto_generate_text"] for request in requests)
+    assert "Generated voice IDs for 'Calm narrator' are: calm0, calm1, calm2" in (
+        result.text
+    )
+    assert "Failed: 'Robot voice': description rejected" in result.text
+    files = sorted(path.name for path in temp_dir.glob("voice_design_*.mp3"))
+    assert len(files) == 6
+    assert (temp_dir / files[0]).read_bytes() == b"calm0"
+
+    (manifest_file,) = temp_dir.glob("voice_design_manifest_*.json")
+    manifest = json.loads(manifest_file.read_text())
+    designs = manifest["designs"]
+    assert [design["voice_description"] for design in designs] == [
+        "Calm narrator",
+        "Robot voice",
+        "Excited announcer",
+    ]
+    assert designs[1] == {
+        "voice_description": "Robot voice",
+        "error": "description rejected",
+    }
+    calm = designs[0]
+    assert calm["text"] == "Generated text for calm"
+    assert calm["request_seconds"] >= 0.01
+    assert calm["save_seconds"] >= 0
+    assert [preview["generated_voice_id"] for preview in calm["previews"]] == [
+        "calm0",
+        "calm1",
+        "calm2",
+    ]
+    assert calm["previews"][0]["duration_seconds"] == 2.5
+    assert calm["previews"][0]["bytes"] == len(b"calm0")
+    assert manifest["total_seconds"] >= calm["request_seconds"]
+
+
+def test_text_to_voice_single_description_failures_raise(server):
+    requests = _stub_previews(server, fail={"Robot voice"})
+
+    # A single description reports the API error itself
+    with pytest.raises(RuntimeError, match="description rejected"):
+        asyncio.run(server.text_to_voice("Robot voice", text="Beep boop"))
+    assert requests[0]["text"] == "Beep boop"
+    assert requests[0]["auto_generate_text"] is False
+
+    with pytest.raises(ElevenLabsMcpError, match="No voice previews were generated"):
+        asyncio.run(server.text_to_voice(["Robot voice", "Robot voice"]))
+    with pytest.raises(ElevenLabsMcpError, match="Voice description is required"):
+        asyncio.run(server.text_to_voice(["Calm narrator", ""]))
+    with pytest.raises(ElevenLabsMcpError, match="max_concurrency"):
+        asyncio.run(server.text_to_voice("Calm narrator", max_concurrency=0))
+
+
+def test_text_to_speech_long_sends_context_and_joins_in_order(
+    server, monkeypatch, temp_dir
+):
+    requests = _stub_synthesis(server, monkeypatch)
+    text = " ".join(f"Sentence number {index} is here." for index in range(6))
+
+    result = asyncio.run(
+        server.text_to_speech_long(
+            text,
+            voice_name="Rachel",
+            model_id="model_a",
+            max_chunk_chars=70,
+            max_concurrency=3,
+        )
+    )
+
+    chunks = sorted((request["text"] for request in requests), key=text.index)
+    assert " ".join(chunks) == text
+    assert len(chunks) == 3
+    by_text = {request["text"]: request for request in requests}
+    for index, chunk in enumerate(chunks):
+        assert by_text[chunk]["voice_id"] == "voice_rachel"
+        assert by_text[chunk]["previous_text"] == (chunks[index - 1] if index else None)
+        assert by_text[chunk]["next_text"] == (
+            chunks[index + 1] if index + 1 < len(chunks) else None
+        )
+    assert "Synthesized in 3 chunks" in result.text
+    (output_file,) = temp_dir.glob("tts_*.mp3")
+    assert output_file.read_bytes() == b"".join(
+        f"voice_rachel:{chunk}".encode() for chunk in chunks
+    )
+
+
+def test_text_to_speech_long_stops_after_a_failed_chunk(server, monkeypatch, temp_dir):
+    requests = _stub_synthesis(server, monkeypatch)
+    synthesize = server._synthesize_speech
+
+    async def fail_first_chunk(text, *args, **context):
+        audio = await synthesize(text, *args, **context)
+        if len(requests) == 1:
+            raise ElevenLabsMcpError("Quota exceeded")
+        return audio
+
+    monkeypatch.setattr(server, "_synthesize_speech", fail_first_chunk)
+    text = " ".join(f"Sentence number {index} is here." for index in range(6))
+
+    with pytest.raises(ElevenLabsMcpError, match="Quota exceeded"):
+        asyncio.run(
+            server.text_to_speech_long(text, max_chunk_chars=70, max_concurrency=1)
+        )
+    # The chunks still waiting for a slot are cancelled rather than requested
+    assert len(requests) == 1
+    assert not list(temp_dir.glob("tts_*"))
+
+
+def test_text_to_speech_long_rejects_bad_arguments(server):
+    for arguments, message in (
+        ({"text": " "}, "Text is required"),
+        ({"output_format": "opus_48000_64"}, "Opus output cannot be joined"),
+        ({"max_concurrency": 0}, "max_concurrency"),
+        ({"max_concurrency": 11}, "max_concurrency"),
+        ({"max_chunk_chars": 0}, "max_chunk_chars"),
+    ):
+        with pytest.raises(ElevenLabsMcpError, match=message):
+            asyncio.run(server.text_to_speech_long(**{"text": "Hello.", **arguments}))
+
+
+def test_long_audio_stops_after_a_failed_segment(server, monkeypatch, temp_dir):
+    from elevenlabs_mcp import transcription
+
+    exported, requested = [], []
+
+    def export_segment(file_path, start, end, segment_path):
+        segment_path.write_bytes(b"flac")
+        exported.append(segment_path)
+
+    async def transcribe(file_path, language_code, diarize):
+        requested.append(file_path)
+        raise ElevenLabsMcpError("Quota exceeded")
+
+    monkeypatch.setattr(
+        transcription,
+        "plan_segments",
+        lambda file_path, segment_seconds: [(0.0, 60.0), (60.0, 120.0), (120.0, 150.0)],
+    )
+    monkeypatch.setattr(transcription, "export_segment", export_segment)
+    monkeypatch.setattr(server, "_transcribe", transcribe)
+
+    with pytest.raises(ElevenLabsMcpError, match="Quota exceeded"):
+        asyncio.run(
+            server._transcribe_long_audio(
+                temp_dir / "meeting.wav", None, False, 60, 1, None
+            )
+        )
+    # No other segment is sent, and exports finish before the directory is removed
+    assert requested == exported[:1]
+    assert not exported[0].parent.exists()
+
+
+def test_default_model_falls_back_per_language_when_offline(server):
+    # The stub client has no models endpoint, so the catalog cannot be loaded
+    async def run():
+        return [await server._default_model_id(language) for language in ("en", "no")]
+
+    assert asyncio.run(run()) == ["eleven_multilingual_v2", "eleven_flash_v2_5"]
+
+
+def test_export_conversations_refuses_to_resume_into_unrelated_files(server, temp_dir):
+    notes = temp_dir / "notes.jsonl"
+    notes.write_text('{"a": 1}\n{"b": 2}\n', encoding="utf-8")
+
+    with pytest.raises(ElevenLabsMcpError, match="not an export to resume"):
+        asyncio.run(server.export_conversations(file_name="notes.jsonl"))
+    assert notes.read_text(encoding="utf-8") == '{"a": 1}\n{"b": 2}\n'
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from elevenlabs_mcp.single_flight import SingleFlight
+
+
+def test_single_flight_shares_concurrent_identical_calls():
+    single_flight = SingleFlight()
+    started = []
+
+    async def fetch(key: str) -> str:
+        started.append(key)
+        await asyncio.sleep(0.05)
+        return f"result {key}"
+
+    async def run():
+        results = await asyncio.gather(
+            *(single_flight.do("get_voice", "a", lambda: fetch("a")) for _ in range(5)),
+            single_flight.do("get_voice", "b", lambda: fetch("b")),
+            single_flight.do("get_agent", "a", lambda: fetch("agent a")),
+        )
+        # The call is over, so the next one starts again
+        results.append(await single_flight.do("get_voice", "a", lambda: fetch("a")))
+        return results
+
+    results = asyncio.run(run())
+    assert results == ["result a"] * 5 + ["result b", "result agent a", "result a"]
+    assert started == ["a", "b", "agent a", "a"]
+    assert single_flight.stats() == {
+        "in_flight": 0,
+        "operations": {
+            "get_agent": {"calls": 1, "coalesced": 0},
+            "get_voice": {"calls": 3, "coalesced": 4},
+        },
+    }
+
+
+def test_single_flight_shares_failures_and_survives_cancelled_callers():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise ValueError("voice not found")
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "audio"
+
+    async def run():
+        failures = await asyncio.gather(
+            single_flight.do("get_voice", "x", fail),
+            single_flight.do("get_voice", "x", fail),
+            return_exceptions=True,
+        )
+        assert [str(e) for e in failures] == ["voice not found"] * 2
+
+        first = asyncio.ensure_future(single_flight.do("tts", "key", slow))
+        second = asyncio.ensure_future(single_flight.do("tts", "key", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "audio"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(run())
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+# Modules that must only be imported when a tool first needs them
+DEFERRED_MODULES = ["elevenlabs", "numpy", "soundfile", "fuzzywuzzy"]
+
+
+def _import_server(temp_dir: Path) -> list[str]:
+    """Import the server in a fresh interpreter; returns the deferred modules it loaded."""
+    env = dict(os.environ)
+    env["ELEVENLABS_API_KEY"] = "test"
+    env["ELEVENLABS_MCP_BASE_PATH"] = str(temp_dir)
+    env["ELEVENLABS_MCP_CACHE_DIR"] = str(temp_dir / "cache")
+    env["PYTHONPATH"] = str(Path(__file__).resolve().parent.parent)
+    code = (
+        "import json, sys\n"
+        "import elevenlabs_mcp.server\n"
+        "loaded = sorted({m.split('.')[0] for m in sys.modules} & set(json.loads(sys.argv[1])))\n"
+        "print(json.dumps(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, json.dumps(DEFERRED_MODULES)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_server_import_defers_heavy_modules(temp_dir):
+    # The first start builds the tool schemas, which may need the SDK, and caches them
+    _import_server(temp_dir)
+    assert (temp_dir / "cache" / "tool_schemas.json").exists()
+
+    assert _import_server(temp_dir) == []
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+
+from mcp.server.fastmcp.tools.base import Tool
+
+from elevenlabs_mcp.resources import ElevenLabsFastMCP
+from elevenlabs_mcp.tool_schemas import LazyFuncMetadata, ToolSchemaCache
+
+
+def _register(cache: ToolSchemaCache) -> ElevenLabsFastMCP:
+    server = ElevenLabsFastMCP("test", tool_schemas=cache)
+
+    @server.tool(
+        description="Add two numbers",
+        parameter_schemas={
+            "options": lambda: {
+                "anyOf": [{"$ref": "#/$defs/Options"}, {"type": "null"}],
+                "$defs": {"Options": {"type": "object"}},
+            }
+        },
+    )
+    def add(a: int, b: int = 1, options: dict | None = None) -> int:
+        return a + b
+
+    return server
+
+
+def test_tool_schemas_are_cached_between_starts(temp_dir):
+    path = temp_dir / "tool_schemas.json"
+    cold = ToolSchemaCache(path, version="1")
+    server = _register(cold)
+    cold.save()
+    assert cold.stats()["misses"] == 1
+
+    warm = ToolSchemaCache(path, version="1")
+    cached_server = _register(warm)
+    assert warm.stats()["hits"] == 1
+
+    tools = asyncio.run(server.list_tools())
+    cached_tools = asyncio.run(cached_server.list_tools())
+    assert cached_tools == tools
+    schema = cached_tools[0].inputSchema
+    assert schema["properties"]["options"]["anyOf"][0] == {"$ref": "#/$defs/Options"}
+    assert schema["properties"]["options"]["default"] is None
+    assert schema["$defs"] == {"Options": {"type": "object"}}
+
+    # Arguments are still validated, by a model built on the first call
+    tool = cached_server._tool_manager.get_tool("add")
+    assert isinstance(tool.fn_metadata, LazyFuncMetadata)
+    result = asyncio.run(cached_server.call_tool("add", {"a": "2", "b": 3}))
+    assert result[0].text == "5"
+
+
+def test_tool_schema_cache_is_keyed_on_version_and_signature(temp_dir):
+    path = temp_dir / "tool_schemas.json"
+    cache = ToolSchemaCache(path, version="1")
+    cache.put("add", "(a: int)", {"properties": {"a": {"type": "integer"}}})
+    cache.save()
+
+    assert ToolSchemaCache(path, version="2").get("add", "(a: int)") is None
+    cache = ToolSchemaCache(path, version="1")
+    assert cache.get("add", "(a: str)") is None
+    assert cache.get("add", "(a: int)") == {"properties": {"a": {"type": "integer"}}}
+    assert cache.stats()["misses"] == 1
+
+
+def test_cached_tools_match_the_tools_mcp_builds(temp_dir, caplog):
+    # Cached tools are built with Tool.model_construct and written into the tool
+    # manager's private dict; this fails when an mcp upgrade changes either
+    cache = ToolSchemaCache(temp_dir / "tool_schemas.json", version="1")
+    server = _register(cache)
+    cached_server = _register(cache)
+    built = server._tool_manager.get_tool("add")
+    cached = cached_server._tool_manager.get_tool("add")
+
+    assert cached.model_fields_set == set(Tool.model_fields)
+    # The fields skipped validation, so check they would have passed it
+    Tool.model_validate({**dict(cached), "fn_metadata": built.fn_metadata})
+    for field in Tool.model_fields:
+        # Each server registered its own copy of the function
+        if field not in ("fn", "fn_metadata"):
+            assert getattr(cached, field) == getattr(built, field), field
+    assert cached_server._tool_manager._tools == {"add": cached}
+
+    # Registering a name again keeps the first tool, as FastMCP does
+    with caplog.at_level(logging.WARNING):
+        cached_server.add_tool(lambda: 0, name="add")
+    assert cached_server._tool_manager.get_tool("add") is cached
+    assert "Tool already exists: add" in caplog.text
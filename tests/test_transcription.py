@@ -0,0 +1,96 @@
+import numpy as np
+import soundfile as sf
+from elevenlabs.types import (
+    SpeechToTextChunkResponseModel,
+    SpeechToTextWordResponseModel,
+)
+from elevenlabs_mcp.transcription import (
+    export_segment,
+    merge_transcriptions,
+    plan_segments,
+)
+
+
+SAMPLE_RATE = 8000
+
+
+def write_speech(path, pattern):
+    """Write a wav of tone ("speech") and silence spans given as (seconds, is_speech)."""
+    parts = []
+    for seconds, is_speech in pattern:
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        parts.append(
+            0.5 * np.sin(2 * np.pi * 440 * t) if is_speech else np.zeros_like(t)
+        )
+    sf.write(path, np.concatenate(parts), SAMPLE_RATE)
+
+
+def make_response(words):
+    return SpeechToTextChunkResponseModel(
+        language_code="en",
+        language_probability=1.0,
+        text=" ".join(text for text, *_ in words),
+        words=[
+            SpeechToTextWordResponseModel(
+                text=text,
+                start=start,
+                end=start + 0.3,
+                type="word",
+                speaker_id=speaker,
+                logprob=0,
+            )
+            for text, start, speaker in words
+        ],
+    )
+
+
+def test_plan_segments_cuts_at_pauses(temp_dir):
+    path = temp_dir / "speech.wav"
+    write_speech(path, [(8, True), (1, False), (5, True), (1, False), (10, True)])
+    segments = plan_segments(path, segment_seconds=12, search_seconds=6)
+    assert len(segments) == 3
+    assert 8 <= segments[0][1] <= 9
+    assert 14 <= segments[1][1] <= 15
+    assert segments[-1][1] == 25
+    assert all(end - start <= 12 for start, end in segments)
+
+
+def test_short_file_is_one_segment(temp_dir):
+    path = temp_dir / "speech.wav"
+    write_speech(path, [(3, True)])
+    assert plan_segments(path, segment_seconds=60) == [(0.0, 3.0)]
+
+
+def test_export_segment(temp_dir):
+    path = temp_dir / "speech.wav"
+    write_speech(path, [(4, True)])
+    export_segment(path, 1.0, 2.5, temp_dir / "segment.flac")
+    info = sf.info(temp_dir / "segment.flac")
+    assert info.frames == int(1.5 * SAMPLE_RATE)
+
+
+def test_merge_shifts_timestamps_and_matches_speakers():
+    first = make_response(
+        [
+            ("hello", 0.0, "speaker_0"),
+            ("there", 8.0, "speaker_1"),
+            ("friend", 9.0, "speaker_1"),
+        ]
+    )
+    # Second segment starts at 10s but its audio begins at 7s; it labels the speakers the other way round
+    second = make_response(
+        [
+            ("there", 1.0, "speaker_0"),
+            ("friend", 2.0, "speaker_0"),
+            ("bye", 4.0, "speaker_0"),
+            ("new", 5.0, "speaker_1"),
+        ]
+    )
+    words = merge_transcriptions([first, second], [(0, 10), (10, 20)], [0, 7])
+    assert [(w.text, w.start, w.speaker_id) for w in words] == [
+        ("hello", 0.0, "speaker_0"),
+        ("there", 8.0, "speaker_1"),
+        ("friend", 9.0, "speaker_1"),
+        ("bye", 11.0, "speaker_1"),
+        ("new", 12.0, "speaker_2"),
+    ]
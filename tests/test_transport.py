@@ -0,0 +1,94 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"Server did not listen on port {port}")
+
+
+async def _list_tools(url: str) -> list[str]:
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+
+    async def session_tools() -> list[str]:
+        async with sse_client(url) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                return [tool.name for tool in (await session.list_tools()).tools]
+
+    # Several clients share one server process
+    return await asyncio.gather(session_tools(), session_tools())
+
+
+def test_sse_transport_serves_several_clients(temp_dir):
+    env = dict(os.environ)
+    env["ELEVENLABS_API_KEY"] = "test"
+    env["ELEVENLABS_MCP_BASE_PATH"] = str(temp_dir)
+    env["ELEVENLABS_MCP_CACHE_DIR"] = str(temp_dir / "cache")
+    env["PYTHONPATH"] = str(Path(__file__).resolve().parent.parent)
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from elevenlabs_mcp.server import main; main()",
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            "--workers",
+            "2",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_port(port)
+        first, second = asyncio.run(_list_tools(f"http://127.0.0.1:{port}/sse"))
+        assert "text_to_speech" in first
+        assert first == second
+    finally:
+        process.terminate()
+        # Open SSE sessions must not keep the server from shutting down
+        assert process.wait(timeout=15) is not None
+
+
+def test_workers_zero_uses_the_default_executor(temp_dir):
+    env = dict(os.environ)
+    env["ELEVENLABS_API_KEY"] = "test"
+    env["ELEVENLABS_MCP_BASE_PATH"] = str(temp_dir)
+    env["ELEVENLABS_MCP_CACHE_DIR"] = str(temp_dir / "cache")
+    env["ELEVENLABS_MCP_WORKERS"] = "0"
+    env["PYTHONPATH"] = str(Path(__file__).resolve().parent.parent)
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from elevenlabs_mcp.server import parse_args; print(parse_args([]).workers)",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    assert output.stdout.strip() == "0"
@@ -1,15 +1,23 @@
+import asyncio
+import os
 import pytest
 from pathlib import Path
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from elevenlabs_mcp.utils import (
     ElevenLabsMcpError,
     make_error,
     is_file_writeable,
     make_output_file,
     make_output_path,
+    invalidate_output_path,
+    write_output_file,
     find_similar_filenames,
     try_find_similar_files,
     handle_input_file,
+    stream_to_file,
+    save_output,
+    handle_multiple_files_output_mode,
 )
 
 
@@ -86,3 +94,148 @@ def test_handle_input_file():
 
         with pytest.raises(ElevenLabsMcpError):
             handle_input_file(str(temp_path / "nonexistent.mp3"))
+
+
+def test_stream_to_file():
+    async def chunks():
+        for chunk in (b"abc", b"def", b"ghi"):
+            yield chunk
+
+    progress = []
+
+    async def on_progress(bytes_written):
+        progress.append(bytes_written)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target = Path(temp_dir) / "out.mp3"
+        bytes_written, time_to_first_byte = asyncio.run(
+            stream_to_file(chunks(), target, on_progress, progress_interval=4)
+        )
+        assert bytes_written == 9
+        assert time_to_first_byte is not None
+        assert target.read_bytes() == b"abcdefghi"
+        assert progress == [6, 9]
+        assert list(Path(temp_dir).iterdir()) == [target]
+
+
+def test_stream_to_file_failure_leaves_no_file():
+    async def chunks():
+        yield b"abc"
+        raise RuntimeError("connection lost")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target = Path(temp_dir) / "out.mp3"
+        with pytest.raises(RuntimeError):
+            asyncio.run(stream_to_file(chunks(), target))
+        assert list(Path(temp_dir).iterdir()) == []
+
+
+def test_make_output_path_is_memoized(monkeypatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = make_output_path("memoized", temp_dir)
+        assert output_path.is_dir()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("validated directory was checked again")
+
+        monkeypatch.setattr("elevenlabs_mcp.utils.is_file_writeable", fail)
+        assert make_output_path("memoized", temp_dir) == output_path
+
+        invalidate_output_path(output_path)
+        with pytest.raises(AssertionError):
+            make_output_path("memoized", temp_dir)
+
+
+def test_write_output_file_recreates_removed_directory():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = make_output_path("removed", temp_dir)
+        output_path.rmdir()
+
+        write_output_file(output_path / "out.mp3", b"audio")
+
+        assert (output_path / "out.mp3").read_bytes() == b"audio"
+
+
+def test_make_output_file_names_are_unique():
+    names = {make_output_file("tts", "Same opening words", "mp3") for _ in range(1000)}
+    assert len(names) == 1000
+    assert make_output_file("tts", "a/b:c", "mp3").name.startswith("tts_a_b_c_")
+
+
+def test_parallel_writes_lose_no_outputs():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = make_output_path("parallel", temp_dir)
+
+        def write(index: int) -> Path:
+            full_file_path = output_path / make_output_file("tts", "Same text", "mp3")
+            write_output_file(full_file_path, f"output {index}".encode())
+            return full_file_path
+
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            paths = list(executor.map(write, range(500)))
+
+        assert len(set(paths)) == 500
+        assert sorted(os.listdir(output_path)) == sorted(path.name for path in paths)
+        for index, path in enumerate(paths):
+            assert path.read_bytes() == f"output {index}".encode()
+
+
+def test_write_output_file_fsync_policy(monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = make_output_path("fsync", temp_dir)
+
+        write_output_file(output_path / "none.mp3", b"audio")
+        assert synced == []
+
+        monkeypatch.setenv("ELEVENLABS_MCP_FSYNC", "file")
+        write_output_file(output_path / "file.mp3", b"audio")
+        assert len(synced) == 1
+
+        monkeypatch.setenv("ELEVENLABS_MCP_FSYNC", "full")
+        write_output_file(output_path / "full.mp3", b"audio")
+        assert len(synced) == (2 if os.name == "nt" else 3)
+        assert sorted(os.listdir(output_path)) == ["file.mp3", "full.mp3", "none.mp3"]
+
+
+def test_save_output_metadata():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir)
+        result = save_output(
+            b"audio", output_path, "out.mp3", "both", duration_seconds=1.5
+        )
+        assert result.content.type == "resource"
+        assert result.manifest_entry(voice="v") == {
+            "file": str(output_path / "out.mp3"),
+            "filename": "out.mp3",
+            "uri": f"elevenlabs://{(output_path / 'out.mp3').as_posix()}",
+            "bytes": 5,
+            "mime_type": "audio/mpeg",
+            "duration_seconds": 1.5,
+            "voice": "v",
+        }
+
+        manifest = save_output(b"{}", output_path, "manifest.json", "resources")
+        assert manifest.saved is False
+        assert manifest.content.resource.text == "{}"
+
+
+def test_handle_multiple_files_output_mode_keeps_dotted_paths():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / "v1.2 outputs"
+        output_path.mkdir()
+        results = [
+            save_output(b"a", output_path, "a.v1.mp3", "files"),
+            save_output(
+                b"b", output_path, "b.mp3", "files", "Saved {file_path}. Done."
+            ),
+        ]
+        manifest = save_output(b"{}", output_path, "manifest.json", "files")
+
+        output = handle_multiple_files_output_mode(results, "files", "Info", manifest)
+        assert output.text == (
+            f"Success. Files saved at: {output_path / 'a.v1.mp3'}, {output_path / 'b.mp3'}. "
+            f"Info. Manifest saved as: {output_path / 'manifest.json'}"
+        )
@@ -0,0 +1,84 @@
+import asyncio
+from types import SimpleNamespace
+from elevenlabs_mcp.voices import VoiceIndex
+
+
+def make_voice(
+    voice_id, name, category="premade", description=None, created_at_unix=None
+):
+    return SimpleNamespace(
+        voice_id=voice_id,
+        name=name,
+        category=category,
+        description=description,
+        labels={},
+        created_at_unix=created_at_unix,
+    )
+
+
+VOICES = [
+    make_voice("1", "Adam", description="Deep narrator", created_at_unix=3),
+    make_voice("2", "Rachel", category="cloned", created_at_unix=1),
+    make_voice("3", "Bella", created_at_unix=2),
+]
+
+
+def make_index(ttl=300):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return VOICES
+
+    return VoiceIndex(loader, ttl=ttl), calls
+
+
+def test_resolve_exact_casefold_and_fuzzy():
+    index, calls = make_index()
+
+    async def run():
+        assert (await index.resolve("Adam")).voice_id == "1"
+        assert (await index.resolve("rachel")).voice_id == "2"
+        assert (await index.resolve("Bela")).voice_id == "3"
+        assert await index.resolve("Zyxw") is None
+
+    asyncio.run(run())
+    assert len(calls) == 1
+    assert index.stats()["fuzzy_matches"] == 1
+
+
+def test_get_by_id():
+    index, _ = make_index()
+    assert asyncio.run(index.get("2")).name == "Rachel"
+    assert asyncio.run(index.get("missing")) is None
+
+
+def test_search_filters_and_sorts():
+    index, _ = make_index()
+    voices = asyncio.run(index.search("narrator"))
+    assert [voice.name for voice in voices] == ["Adam"]
+    voices = asyncio.run(index.search(sort="created_at_unix", sort_direction="asc"))
+    assert [voice.name for voice in voices] == ["Rachel", "Bella", "Adam"]
+
+
+def test_refresh_on_ttl_and_invalidate():
+    index, calls = make_index(ttl=0)
+    asyncio.run(index.get("1"))
+    asyncio.run(index.get("1"))
+    assert len(calls) == 2
+
+    index, calls = make_index()
+    asyncio.run(index.get("1"))
+    index.invalidate()
+    asyncio.run(index.get("1"))
+    assert len(calls) == 2
+
+
+def test_concurrent_lookups_load_once():
+    index, calls = make_index()
+
+    async def run():
+        await asyncio.gather(*(index.resolve("Adam") for _ in range(10)))
+
+    asyncio.run(run())
+    assert len(calls) == 1
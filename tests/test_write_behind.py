@@ -0,0 +1,73 @@
+import threading
+import tempfile
+from pathlib import Path
+
+from elevenlabs_mcp.utils import write_output_file
+from elevenlabs_mcp.write_behind import WriteBehindQueue
+
+
+def test_write_behind_queue_writes_in_background():
+    release = threading.Event()
+
+    def slow_writer(full_file_path: Path, file_data: bytes):
+        release.wait()
+        write_output_file(full_file_path, file_data)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        queue = WriteBehindQueue(slow_writer, workers=2, max_pending=8)
+        paths = [Path(temp_dir) / f"out_{i}.mp3" for i in range(5)]
+        for i, path in enumerate(paths):
+            assert queue.submit(path, f"audio {i}".encode()) is True
+
+        assert queue.status(paths[0]) == "pending"
+        assert queue.pending_data(paths[3]) == b"audio 3"
+        assert not paths[0].exists()
+
+        release.set()
+        assert queue.flush(timeout=5)
+        assert [path.read_bytes() for path in paths] == [
+            f"audio {i}".encode() for i in range(5)
+        ]
+        assert queue.status(paths[0]) == "written"
+        assert queue.pending_data(paths[3]) is None
+        assert queue.stats()["written"] == 5
+        queue.close()
+
+
+def test_write_behind_queue_is_bounded():
+    release = threading.Event()
+
+    def writer(full_file_path: Path, file_data: bytes):
+        if threading.current_thread().name.startswith("elevenlabs-write"):
+            release.wait()
+        write_output_file(full_file_path, file_data)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        queue = WriteBehindQueue(writer, workers=1, max_pending=2)
+        assert queue.submit(Path(temp_dir) / "a.mp3", b"a") is True
+        assert queue.submit(Path(temp_dir) / "b.mp3", b"b") is True
+
+        # A full queue writes in the caller's thread before returning
+        assert queue.submit(Path(temp_dir) / "c.mp3", b"c") is False
+        assert (Path(temp_dir) / "c.mp3").read_bytes() == b"c"
+        assert queue.stats()["written_inline"] == 1
+
+        release.set()
+        assert queue.close(timeout=5)
+        assert (Path(temp_dir) / "a.mp3").read_bytes() == b"a"
+        assert (Path(temp_dir) / "b.mp3").read_bytes() == b"b"
+
+
+def test_write_behind_queue_records_failures():
+    def failing_writer(full_file_path: Path, file_data: bytes):
+        raise OSError("disk full")
+
+    queue = WriteBehindQueue(failing_writer)
+    path = Path(tempfile.gettempdir()) / "never_written.mp3"
+    queue.submit(path, b"audio")
+    assert queue.close(timeout=5)
+
+    assert queue.status(path) == "failed: disk full"
+    stats = queue.stats()
+    assert stats["failed"] == 1
+    assert stats["recent_failures"] == {str(path): "failed: disk full"}